@@ -133,6 +133,18 @@ run_linter() {
   popd
 }
 
+build_mips () {
+  echo "Building sprite mip chains"
+  "${PYSCRIPTS}/python" tools/downscale.py --mip assets
+  check_res_and_popd_on_exit
+}
+
+pack_atlases () {
+  echo "Packing sprite atlases"
+  "${PYSCRIPTS}/python" tools/pack_atlas.py assets/*/
+  check_res_and_popd_on_exit
+}
+
 pyinstaller_build () {
   echo "Building a PyInstaller executable"
   S=':'
@@ -15,4 +15,6 @@ build_msgs
 run_tests
 run_mypy
 run_linter
+build_mips
+pack_atlases
 pyinstaller_build
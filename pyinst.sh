@@ -7,4 +7,6 @@ echo "Running pyinstaller ${PROGRAM_VERSION}"
 
 set_version
 activate_venv
+build_mips
+pack_atlases
 pyinstaller_build
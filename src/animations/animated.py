@@ -1,18 +1,120 @@
 import os
 import json
+import weakref
 import pygame
-from typing import Dict, Tuple, List, cast
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple, List, cast
 
 from util.sopen import smart_open
 from util.image_loader import load_image
+from animations.atlas import ATLAS_IMAGE, AtlasIndex
+from animations.sources import frame_name
+from animations.mipmaps import MipIndex, level_dir
+from animations.dihedral import (
+    Transform,
+    compose_transformations,
+    transform_anchor,
+    transform_image,
+)
+
+if TYPE_CHECKING:
+    from animations.disk_cache import SpriteDiskCache
+
+SpriteKey = Tuple[str, int, str]  # (variation, frame index, direction)
+SpriteFrame = Tuple[pygame.Surface, List[int]]  # (image, anchor)
+DecodedSource = Tuple[pygame.Surface, Tuple[int, int]]  # (scaled, original size)
+
+DEFAULT_DIRECTIONS = ["r", "l", "u", "d"]
 
 
 class AnimatedSprite:
-    def __init__(self, path: str, size: Tuple[int, int]) -> None:
+    def __init__(
+        self,
+        path: str,
+        size: Tuple[int, int],
+        lazy: bool = False,
+        disk_cache: Optional["SpriteDiskCache"] = None,
+        defer_loading: bool = False,
+    ) -> None:
+        """
+        Load the sprite description and, unless lazy or deferred, all of its
+        frames.
+
+        Args:
+            path: Path to the directory with sprite files and animation.json.
+            size: Sprite size (width, height) in pixels.
+            lazy: If True, every frame is loaded, scaled and transformed
+                  the first time it is requested (see get_frame and warm_up).
+            disk_cache: Persistent cache of final frames. On a hit all frames
+                  are read from it at once; otherwise they are stored there
+                  as soon as all of them have been materialized.
+            defer_loading: If True, the frames of an eager sprite are not
+                  loaded here but left for the caller to load, e.g. with
+                  load_in_parallel or warm_up.
+        """
         self.path = path
         self.size = size
+        self.lazy = lazy
         self.animation_data = self._load_animation_data()
-        self.sprites = self._load_sprites()
+        # Animations of this sprite, adapted to it when it is reloaded
+        self._animations: "weakref.WeakSet[Animation]" = weakref.WeakSet()
+        # Each transform chain reduced to a single D4 element
+        self._transforms = self._compose_transformations()
+        # Smallest pre-downscaled source level at or above the target size
+        self._mip_index = MipIndex.load(path)
+        self._mip_level = (
+            self._mip_index.select_level(size) if self._mip_index is not None else None
+        )
+        self.source_path = path
+        if self._mip_level is not None:
+            self.source_path = os.path.join(path, level_dir(self._mip_level))
+        # Packed atlas of the frames, if the source directory has one
+        self._atlas_index = AtlasIndex.load(self.source_path)
+        self._atlas: Optional[pygame.Surface] = None
+        self._frame_files = {
+            f"{frame_name(variation, frame_index)}.png": (variation, frame_index)
+            for variation in self.get_variations()
+            for frame_index in range(self.get_frame_count())
+        }
+        self.sprites: Dict[SpriteKey, SpriteFrame] = {}
+        # Scaled source frames which still have directions to be materialized
+        self._base_frames: Dict[Tuple[str, int], SpriteFrame] = {}
+        # Transformed frames shared by directions with the same element
+        self._transformed: Dict[Tuple[str, int, Transform], SpriteFrame] = {}
+
+        self._persistent_cache = disk_cache
+        # Cache to store the frames to once all of them are materialized
+        self._disk_cache = disk_cache
+        self._disk_cache_key: Optional[str] = None
+        if disk_cache is not None:
+            self._disk_cache_key = disk_cache.make_key(
+                path,
+                size,
+                cast(Dict[str, object], self.animation_data),
+                self.source_path,
+            )
+            cached = disk_cache.load(self._disk_cache_key)
+            if cached is not None:
+                self.sprites = cached
+                self._disk_cache = None  # Nothing to store
+                return
+
+        if not lazy and not defer_loading:
+            self.warm_up()
+
+    def reload(self) -> None:
+        """
+        Load the sprite again from its files, keeping this object and so every
+        reference to it. If loading fails, the sprite is left unchanged.
+        Existing animations are adapted to the new frames (see Animation.resync).
+        The frames are loaded from the files, never from the disk cache; a
+        stale atlas or mip chain is ignored (see animations/sources.py).
+        """
+        reloaded = AnimatedSprite(self.path, self.size, self.lazy)
+        animations, disk_cache = self._animations, self._persistent_cache
+        vars(self).update(vars(reloaded))
+        self._animations, self._persistent_cache = animations, disk_cache
+        for animation in animations:
+            animation.resync()
 
     def _load_animation_data(
         self,
@@ -23,76 +125,225 @@ class AnimatedSprite:
                 json.load(f),
             )
 
-    def _load_sprites(
+    def _compose_transformations(self) -> Dict[str, Transform]:
+        if "transform" not in self.animation_data:
+            return {}
+        return {
+            direction: compose_transformations(transformations)
+            for direction, transformations in cast(
+                Dict[str, List[str]], self.animation_data["transform"]
+            ).items()
+        }
+
+    def get_variations(self) -> List[str]:
+        """Get the list of sprite variations."""
+        return cast(List[str], self.animation_data["variations"])
+
+    def get_frame_count(self) -> int:
+        """Get the number of frames per variation."""
+        return cast(int, self.animation_data["frame_count"])
+
+    def get_directions(self) -> List[str]:
+        """Get the list of supported directions."""
+        if "transform" in self.animation_data:
+            return list(cast(Dict[str, List[str]], self.animation_data["transform"]))
+        return DEFAULT_DIRECTIONS
+
+    def get_frame(
+        self, variation: str, frame_index: int, direction: str
+    ) -> SpriteFrame:
+        """
+        Get a frame image and its anchor, materializing it on first use.
+
+        Raises:
+            KeyError: If there is no such variation, frame or direction.
+        """
+        key = (variation, frame_index, direction)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            if (
+                variation not in self.get_variations()
+                or not 0 <= frame_index < self.get_frame_count()
+                or direction not in self.get_directions()
+            ):
+                raise KeyError(key)
+            sprite = self._materialize(key)
+        return sprite
+
+    def warm_up(
         self,
-    ) -> Dict[Tuple[str, int, str], Tuple[pygame.Surface, List[int]]]:
-        sprites = {}
+        variations: Optional[Iterable[str]] = None,
+        frames: Optional[Iterable[int]] = None,
+        directions: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Materialize frames in advance. Every omitted argument means "all".
+
+        Args:
+            variations: Variations to load.
+            frames: Frame indices to load.
+            directions: Directions to load.
+        """
+        for variation in self.get_variations() if variations is None else variations:
+            for frame_index in (
+                range(self.get_frame_count()) if frames is None else frames
+            ):
+                for direction in (
+                    self.get_directions() if directions is None else directions
+                ):
+                    self.get_frame(variation, frame_index, direction)
+
+    def is_loaded(self) -> bool:
+        """Check whether all frames have been materialized."""
+        total = len(self.get_variations()) * self.get_frame_count()
+        return len(self.sprites) == total * len(self.get_directions())
+
+    def _materialize(self, key: SpriteKey) -> SpriteFrame:
+        variation, frame_index, direction = key
+        base = self._base_frames.get((variation, frame_index))
+        if base is None:
+            base = self._load_frame(variation, frame_index)
+            self._base_frames[(variation, frame_index)] = base
 
-        # Get available directions from transform or use default
         if "transform" in self.animation_data:
-            directions = cast(List[str], self.animation_data["transform"])
+            # With transform: directions with the same element share the frame
+            # (the identity keeps the source image itself)
+            transform = self._transforms[direction]
+            sprite = self._transformed.get((variation, frame_index, transform))
+            if sprite is None:
+                sprite = self._apply_transform(base, transform)
+                self._transformed[(variation, frame_index, transform)] = sprite
         else:
-            directions = ["r"]
-
-        for variation in cast(Dict[str, List[int]], self.animation_data["variations"]):
-            for frame_index in range(cast(int, self.animation_data["frame_count"])):
-                filename = f"{variation}_{frame_index}.png"
-                image = load_image(os.path.join(self.path, filename)).convert_alpha()
-                original_size = image.get_size()
-                image = pygame.transform.scale(image, self.size)
-
-                anchor = self._scale_anchor(
-                    cast(List[List[int]], self.animation_data["anchors"])[frame_index],
-                    original_size,
-                )
-
-                if "transform" in self.animation_data:
-                    # With transform: apply transformations per direction
-                    for direction in directions:
-                        sprites[(variation, frame_index, direction)] = (
-                            self._apply_transformations(
-                                image.copy(), direction, anchor[:]
-                            )
-                        )
-                else:
-                    base_sprite = (image, anchor)
-                    for direction in ["r", "l", "u", "d"]:
-                        sprites[(variation, frame_index, direction)] = base_sprite
-
-        return sprites
+            # The same object is shared by all directions
+            sprite = base
+        self.sprites[key] = sprite
+
+        # The source frame is not needed once all its directions are ready
+        if all(
+            (variation, frame_index, d) in self.sprites for d in self.get_directions()
+        ):
+            del self._base_frames[(variation, frame_index)]
+            for transform in set(self._transforms.values()):
+                self._transformed.pop((variation, frame_index, transform), None)
+
+        if self._disk_cache is not None and self.is_loaded():
+            assert self._disk_cache_key is not None
+            self._disk_cache.save(self._disk_cache_key, self.sprites)
+            self._disk_cache = None
+        return sprite
+
+    def _load_frame(self, variation: str, frame_index: int) -> SpriteFrame:
+        if self._atlas_index is not None:
+            # Frames are cut from the atlas which is scaled only once
+            if self._atlas is None:
+                self.install_source(ATLAS_IMAGE, self.decode_source(ATLAS_IMAGE))
+            assert self._atlas is not None
+            rect = self._atlas_index.get_scaled_rect(
+                frame_name(variation, frame_index), self.size
+            )
+            image = self._atlas.subsurface(rect)
+            anchor = self._scale_anchor(
+                cast(List[List[int]], self.animation_data["anchors"])[frame_index],
+                self._atlas_index.frame_size,
+            )
+            return image, anchor
+
+        filename = f"{frame_name(variation, frame_index)}.png"
+        self.install_source(filename, self.decode_source(filename))
+        return self._base_frames[(variation, frame_index)]
+
+    def get_pending_sources(self) -> List[str]:
+        """
+        Get the file names of the source images (frame files or the atlas)
+        which still have to be loaded to materialize all frames.
+        """
+        if self.is_loaded():
+            return []
+        if self._atlas_index is not None:
+            return [] if self._atlas is not None else [ATLAS_IMAGE]
+        directions = self.get_directions()
+        return [
+            f"{frame_name(variation, frame_index)}.png"
+            for variation in self.get_variations()
+            for frame_index in range(self.get_frame_count())
+            if (variation, frame_index) not in self._base_frames
+            and not all((variation, frame_index, d) in self.sprites for d in directions)
+        ]
+
+    def decode_source(self, name: str) -> DecodedSource:
+        """
+        Read, decode and scale a source image. Does not touch the display
+        or the sprite state, so it may be called from worker threads.
+
+        Args:
+            name: File name of a frame or of the atlas in the source directory.
+
+        Returns:
+            The scaled image and the original image size.
+        """
+        image = load_image(os.path.join(self.source_path, name))
+        original_size = image.get_size()
+        if self._atlas_index is not None:
+            size = self._atlas_index.get_scaled_atlas_size(original_size, self.size)
+        else:
+            size = self.size
+        if image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        return image, original_size
+
+    def install_source(self, name: str, decoded: DecodedSource) -> None:
+        """
+        Convert a decoded source image for the display and keep it as the source
+        of its frames. Must be called from the main thread.
+
+        Args:
+            name: File name passed to decode_source.
+            decoded: Result of decode_source.
+        """
+        image, original_size = decoded
+        image = image.convert_alpha()
+        if self._atlas_index is not None:
+            self._atlas = image
+            return
+        variation, frame_index = self._frame_files[name]
+        anchor = self._scale_anchor(
+            cast(List[List[int]], self.animation_data["anchors"])[frame_index],
+            original_size,
+        )
+        self._base_frames[(variation, frame_index)] = (image, anchor)
 
     def _scale_anchor(
         self, anchor: List[int], original_size: Tuple[int, int]
     ) -> List[int]:
+        if self._mip_index is not None and self._mip_level is not None:
+            # Anchors refer to the source frames, not to the mip level
+            original_size = self._mip_index.source_size
         scaled_anchor = [
             anchor[0] * self.size[0] // original_size[0],
             anchor[1] * self.size[1] // original_size[1],
         ]
         return scaled_anchor
 
-    def _apply_transformations(
-        self, image: pygame.Surface, direction: str, anchor: List[int]
-    ) -> Tuple[pygame.Surface, List[int]]:
-        transformations = cast(Dict[str, List[str]], self.animation_data["transform"])[
-            direction
-        ]
-        for transformation in transformations:
-            if transformation == "mirror":
-                # Flip horizontally
-                image = pygame.transform.flip(image, True, False)
-                anchor[0] = image.get_width() - anchor[0] - 1
-
-            elif transformation == "rotate":
-                # Rotate 90° clockwise
-                image = pygame.transform.rotate(image, -90)
-                old_anchor = anchor[:]
-                # Rotate anchor around origin (0,0)
-                anchor = [image.get_width() - old_anchor[1] - 1, old_anchor[0]]
-
-            else:
-                raise ValueError(f"Unknown transformation: {transformation}")
+    @staticmethod
+    def _apply_transform(base: SpriteFrame, transform: Transform) -> SpriteFrame:
+        image, anchor = base
+        return (
+            transform_image(image, transform),
+            transform_anchor(anchor, image.get_size(), transform),
+        )
 
-        return image, anchor
+    def get_memory_size(self) -> int:
+        """
+        Get the number of bytes held by the loaded frame surfaces.
+        Surfaces shared between several directions are counted once,
+        subsurfaces are accounted as their parent surface.
+        """
+        frames = list(self.sprites.values()) + list(self._base_frames.values())
+        roots = [image.get_abs_parent() for image, _ in frames]
+        surfaces = {id(image): image for image in roots}
+        return sum(
+            image.get_pitch() * image.get_height() for image in surfaces.values()
+        )
 
     def create_animation(self) -> "Animation":
         return Animation(self)
@@ -101,6 +352,7 @@ class AnimatedSprite:
 class Animation:
     def __init__(self, animated_sprite: "AnimatedSprite") -> None:
         self.animated_sprite = animated_sprite
+        animated_sprite._animations.add(self)
         self.current_variation = cast(
             List[str], self.animated_sprite.animation_data["variations"]
         )[
@@ -109,18 +361,23 @@ class Animation:
         self.current_animation = cast(
             Dict[str, List[int]], self.animated_sprite.animation_data["animations"]
         )["default"]
+        self.animation_name = "default"
         self.current_frame_index = 0
         self.position = [0, 0]  # Initial sprite position
         self.direction = "r"  # Initial direction
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw the current frame and return the changed area of the surface."""
+        frame, dest = self.get_blit()
+        return surface.blit(frame, dest)
+
+    def get_blit(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Get the current frame and its top-left position for drawing."""
         frame_index = self.current_animation[self.current_frame_index]
-        frame, anchor = self.animated_sprite.sprites[
-            (self.current_variation, frame_index, self.direction)
-        ]
-        surface.blit(
-            frame, (self.position[0] - anchor[0], self.position[1] - anchor[1])
+        frame, anchor = self.animated_sprite.get_frame(
+            self.current_variation, frame_index, self.direction
         )
+        return frame, (self.position[0] - anchor[0], self.position[1] - anchor[1])
 
     def set_variation(self, variation: str) -> None:
         self.current_variation = variation
@@ -132,8 +389,31 @@ class Animation:
         self.current_animation = cast(
             Dict[str, List[int]], self.animated_sprite.animation_data["animations"]
         )[animation_name]
+        self.animation_name = animation_name
         self.current_frame_index = 0
 
+    def resync(self) -> None:
+        """
+        Adapt to the reloaded animation data of the sprite. The animation,
+        variation and direction are kept if the sprite still has them, else
+        the initial ones are used; the sequence restarts if the current frame
+        is past its new end.
+        """
+        animations = cast(
+            Dict[str, List[int]], self.animated_sprite.animation_data["animations"]
+        )
+        if self.animation_name not in animations:
+            self.animation_name = "default"
+        self.current_animation = animations[self.animation_name]
+        if self.current_frame_index >= len(self.current_animation):
+            self.current_frame_index = 0
+        variations = self.animated_sprite.get_variations()
+        if self.current_variation not in variations:
+            self.current_variation = variations[0]
+        directions = self.animated_sprite.get_directions()
+        if self.direction not in directions:
+            self.direction = directions[0]
+
     def next_frame(self) -> None:
         self.current_frame_index += 1
         if self.current_frame_index >= len(self.current_animation):
@@ -0,0 +1,174 @@
+"""
+Packed sprite atlas format.
+
+An animation directory may contain "atlas.png" with all frames of the
+animation and "atlas.json" with the frame index:
+
+    {
+      "frame_size": [512, 512],
+      "frames": {"l_0": [0, 0], "l_1": [512, 0], ...}
+    }
+
+Each frame is identified by "<variation>_<frame index>" (the name of its
+source PNG without the extension) and maps to its top-left corner in the
+atlas. All frames of an atlas have the same size. The index also records a
+stamp of the frame files (and animation.json) it was packed from; a stale
+atlas is ignored (see animations/sources.py). Atlases are packed by
+tools/pack_atlas.py.
+"""
+
+import json
+import math
+import os
+from typing import Dict, List, Optional, Tuple, cast
+
+import pygame
+
+from util.sopen import smart_exists, smart_open
+from animations.mipmaps import MipIndex, level_dir
+from animations.sources import (
+    ANIMATION_DATA,
+    SOURCES_KEY,
+    frame_name,
+    is_current,
+    make_stamp,
+)
+
+ATLAS_IMAGE = "atlas.png"
+ATLAS_INDEX = "atlas.json"
+
+
+class AtlasIndex:
+    """Frame index of a packed sprite atlas."""
+
+    def __init__(
+        self, frame_size: Tuple[int, int], frames: Dict[str, Tuple[int, int]]
+    ) -> None:
+        """
+        Args:
+            frame_size: Size (width, height) of every frame in atlas pixels.
+            frames: Top-left corner of each frame in the atlas by frame name.
+        """
+        self.frame_size = frame_size
+        self.frames = frames
+
+    @classmethod
+    def load(cls, path: str) -> Optional["AtlasIndex"]:
+        """
+        Load the atlas index of an animation directory.
+
+        Returns:
+            The index, or None if the directory has no atlas or the frames
+            changed since it was packed.
+        """
+        index_path = os.path.join(path, ATLAS_INDEX)
+        if not smart_exists(index_path):
+            return None
+        with smart_open(index_path) as f:
+            data = cast(Dict[str, List[int] | Dict[str, List[int]]], json.load(f))
+        if not is_current(path, data):
+            return None
+        frame_size = cast(List[int], data["frame_size"])
+        frames = cast(Dict[str, List[int]], data["frames"])
+        return cls(
+            (frame_size[0], frame_size[1]),
+            {name: (pos[0], pos[1]) for name, pos in frames.items()},
+        )
+
+    def save(self, path: str) -> None:
+        """Write the index with a stamp of the frame files into a directory."""
+        sources = [f"{name}.png" for name in self.frames]
+        if os.path.isfile(os.path.join(path, ANIMATION_DATA)):
+            sources.insert(0, ANIMATION_DATA)
+        data = {
+            "frame_size": list(self.frame_size),
+            "frames": {name: list(pos) for name, pos in self.frames.items()},
+            SOURCES_KEY: make_stamp(path, sources),
+        }
+        with open(os.path.join(path, ATLAS_INDEX), "w") as f:
+            json.dump(data, f, indent=2)
+
+    def get_scaled_rect(self, name: str, size: Tuple[int, int]) -> pygame.Rect:
+        """
+        Get the rect of a frame in the atlas scaled so that frames have the given size.
+
+        Raises:
+            KeyError: If there is no such frame in the atlas.
+        """
+        x, y = self.frames[name]
+        return pygame.Rect(
+            x // self.frame_size[0] * size[0],
+            y // self.frame_size[1] * size[1],
+            size[0],
+            size[1],
+        )
+
+    def get_scaled_atlas_size(
+        self, atlas_size: Tuple[int, int], size: Tuple[int, int]
+    ) -> Tuple[int, int]:
+        """Get the size of the whole atlas scaled so that frames have the given size."""
+        return (
+            atlas_size[0] // self.frame_size[0] * size[0],
+            atlas_size[1] // self.frame_size[1] * size[1],
+        )
+
+
+def pack_atlas(path: str, columns: Optional[int] = None) -> AtlasIndex:
+    """
+    Pack all frames of an animation directory into a single atlas image
+    and write the atlas image and index next to animation.json. Each level
+    of the mip chain, if any, gets its own atlas in the level directory.
+
+    Args:
+        path: Path to the animation directory.
+        columns: Number of frames per atlas row. By default the atlas is
+                 made as close to a square as possible.
+
+    Returns:
+        The index of the atlas of the source frames.
+
+    Raises:
+        ValueError: If the frames have different sizes.
+    """
+    with open(os.path.join(path, "animation.json"), "rb") as f:
+        animation_data = json.load(f)
+
+    names = [
+        frame_name(variation, frame_index)
+        for variation in animation_data["variations"]
+        for frame_index in range(animation_data["frame_count"])
+    ]
+    mip_index = MipIndex.load(path)
+    if mip_index is not None:
+        for level in mip_index.levels:
+            _pack_frames(os.path.join(path, level_dir(level)), names, columns)
+    return _pack_frames(path, names, columns)
+
+
+def _pack_frames(path: str, names: List[str], columns: Optional[int]) -> AtlasIndex:
+    images = [pygame.image.load(os.path.join(path, f"{name}.png")) for name in names]
+
+    frame_size = images[0].get_size()
+    for name, image in zip(names, images):
+        if image.get_size() != frame_size:
+            raise ValueError(
+                f"Frame {name} has size {image.get_size()}, expected {frame_size}"
+            )
+
+    if columns is None:
+        columns = math.ceil(math.sqrt(len(images)))
+    rows = math.ceil(len(images) / columns)
+
+    atlas = pygame.Surface(
+        (columns * frame_size[0], rows * frame_size[1]), pygame.SRCALPHA
+    )
+    frames = {}
+    for i, (name, image) in enumerate(zip(names, images)):
+        position = ((i % columns) * frame_size[0], (i // columns) * frame_size[1])
+        atlas.blit(image, position)
+        frames[name] = position
+
+    pygame.image.save(atlas, os.path.join(path, ATLAS_IMAGE))
+    index = AtlasIndex(frame_size, frames)
+    index.save(path)
+    return index
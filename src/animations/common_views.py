@@ -1,4 +1,6 @@
-from typing import Tuple
+from typing import Optional, Tuple
+
+import pygame
 
 from mainloop.screens import View
 from animations.animated import AnimatedSprite, Animation
@@ -9,6 +11,10 @@ class AnimatedSpriteView(View):
     View for rendering an animated sprite.
     Takes an AnimatedSprite and creates an Animation to manage frame progression.
     Draws the sprite to the window's surface during tick.
+
+    Without fixed updates every tick draws the current frame and advances the
+    animation. With fixed updates (env.alpha set) update() advances it and
+    tick() draws the sprite between its positions at the last two updates.
     """
 
     view_type = "animated_sprite"
@@ -24,24 +30,59 @@ class AnimatedSpriteView(View):
         self.animated_sprite = animated_sprite
         self.animation = animated_sprite.create_animation()
         self._position: Tuple[int, int] = (0, 0)
+        # Positions at the previous and at the last fixed update
+        self._previous_position = self._position
+        self._updated_position: Optional[Tuple[int, int]] = None
 
     def tick(self) -> None:
         """
-        Update animation frame and draw to parent window.
+        Update animation frame and draw to parent window, reporting the drawn
+        area to the window as dirty. Windows batching blits get the frame
+        queued instead.
         Called each frame by the window's tick method.
         """
         window = self.get_window()
         if window is None:
             return
 
+        alpha = window.env.alpha
+        position = self._position
+        if alpha is not None:
+            position = self._interpolate(alpha)
+
         # Convert position from local window coordinates to screen coordinates
-        screen_pos = window.to_screen_coords(self._position)
+        screen_pos = window.to_screen_coords(position)
         self.animation.set_position(screen_pos)
-        self.animation.draw(window.env.display)
-
-        # Advance to next frame
+        # Culled views don't fetch (and possibly load) their frame but still
+        # animate. The frame is drawn with its anchor at the position, so it
+        # stays within the bounds grown by half the sprite size on each side.
+        bounds = self.get_bounds()
+        bounds.center = screen_pos
+        if window.is_visible(bounds.inflate(bounds.size)):
+            if window.batches_blits:
+                window.queue_blit(*self.animation.get_blit())
+            else:
+                window.mark_dirty(self.animation.draw(window.env.display))
+
+        if alpha is None:
+            # Advance to next frame
+            self.animation.next_frame()
+
+    def update(self) -> None:
+        """Advance the animation by one frame and record the position."""
+        if self._updated_position is not None:
+            self._previous_position = self._updated_position
+        else:
+            self._previous_position = self._position
+        self._updated_position = self._position
         self.animation.next_frame()
 
+    def _interpolate(self, alpha: float) -> Tuple[int, int]:
+        if self._updated_position is None:
+            return self._position  # Not updated yet
+        (x0, y0), (x1, y1) = self._previous_position, self._updated_position
+        return (round(x0 + (x1 - x0) * alpha), round(y0 + (y1 - y0) * alpha))
+
     def set_position(self, position: Tuple[int, int]) -> None:
         """
         Set the position of the sprite within the window.
@@ -52,6 +93,19 @@ class AnimatedSpriteView(View):
         self._position = position
         # Don't set animation position yet - it will be done during tick()
         # when we convert to screen coordinates
+        window = self.get_window()
+        if window is not None:
+            window.update_view_bounds(self)
+
+    def get_bounds(self) -> pygame.Rect:
+        """
+        Get the sprite-sized area centered on the position (window-local).
+        The exact frame bounds depend on the anchor of the current frame,
+        which may not be loaded yet.
+        """
+        bounds = pygame.Rect((0, 0), self.animated_sprite.size)
+        bounds.center = self._position
+        return bounds
 
     def get_position(self) -> Tuple[int, int]:
         """Get the current position of the sprite."""
@@ -0,0 +1,100 @@
+# REGISTER_DOCTEST
+"""
+Transformations of sprite frames as elements of the dihedral group D4.
+
+Every chain of "mirror" (horizontal flip) and "rotate" (90° clockwise) steps
+equals a single element (mirrored, turns): an optional horizontal flip followed
+by `turns` clockwise quarter turns. Applying an element costs one pass over the
+image, or two for a mirrored odd number of turns, whatever the chain length.
+"""
+
+from typing import Iterable, List, Tuple
+
+import pygame
+
+Transform = Tuple[bool, int]  # (mirrored, clockwise quarter turns 0..3)
+
+IDENTITY: Transform = (False, 0)
+
+
+def compose_transformations(transformations: Iterable[str]) -> Transform:
+    """
+    Reduce a chain of transformations to a single element.
+
+    Raises:
+        ValueError: On an unknown transformation.
+
+    Examples:
+        >>> compose_transformations([])
+        (False, 0)
+        >>> compose_transformations(["rotate", "rotate", "rotate", "mirror"])
+        (True, 1)
+        >>> compose_transformations(["mirror", "rotate", "mirror"])
+        (False, 3)
+        >>> compose_transformations(["rotate"] * 4)
+        (False, 0)
+        >>> compose_transformations(["spin"])
+        Traceback (most recent call last):
+        ...
+        ValueError: Unknown transformation: spin
+    """
+    mirrored, turns = IDENTITY
+    for transformation in transformations:
+        if transformation == "rotate":
+            turns = (turns + 1) % 4
+        elif transformation == "mirror":
+            # Flipping after the turns equals flipping first and turning back
+            mirrored, turns = not mirrored, -turns % 4
+        else:
+            raise ValueError(f"Unknown transformation: {transformation}")
+    return mirrored, turns
+
+
+def transform_anchor(
+    anchor: List[int], size: Tuple[int, int], transform: Transform
+) -> List[int]:
+    """
+    Map a pixel position of an image of the given size to the transformed image.
+
+    Examples:
+        >>> transform_anchor([1, 0], (4, 2), (False, 1))
+        [1, 1]
+        >>> transform_anchor([1, 0], (4, 2), (True, 0))
+        [2, 0]
+        >>> transform_anchor([1, 0], (4, 2), (True, 3))
+        [0, 1]
+    """
+    mirrored, turns = transform
+    width, height = size
+    x, y = anchor
+    if mirrored:
+        x = width - x - 1
+    if turns == 1:
+        return [height - y - 1, x]
+    if turns == 2:
+        return [width - x - 1, height - y - 1]
+    if turns == 3:
+        return [y, width - x - 1]
+    return [x, y]
+
+
+def transform_image(image: pygame.Surface, transform: Transform) -> pygame.Surface:
+    """
+    Apply the element to an image. The identity returns the image itself.
+
+    Examples:
+        >>> image = pygame.Surface((4, 2))
+        >>> transform_image(image, IDENTITY) is image
+        True
+        >>> transform_image(image, (True, 1)).get_size()
+        (2, 4)
+    """
+    mirrored, turns = transform
+    if turns == 0:
+        return pygame.transform.flip(image, True, False) if mirrored else image
+    if turns == 2:
+        # Half turn is a flip over both axes, cancelled by a horizontal flip
+        return pygame.transform.flip(image, not mirrored, True)
+    if mirrored:
+        image = pygame.transform.flip(image, True, False)
+    return pygame.transform.rotate(image, -90 * turns)
@@ -0,0 +1,161 @@
+"""
+Persistent on-disk cache of scaled and transformed sprite frames.
+
+Each sprite is stored in a single file named after its cache key:
+
+    <header length: uint32 LE> <JSON header> <raw RGBA pixels of all surfaces>
+
+The header lists the surface sizes and, for every (variation, frame, direction),
+the index of its surface and its anchor. Surfaces shared by several frames are
+stored once. The key is a hash of the source files content, the target size
+and the transform chains, so any change of the sources makes a new entry.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from typing import Dict, List, Optional, Tuple, cast
+
+import pygame
+
+from util.sopen import smart_open
+from animations.animated import SpriteFrame, SpriteKey
+from animations.atlas import ATLAS_IMAGE, ATLAS_INDEX, AtlasIndex
+from animations.sources import frame_name
+
+FORMAT_VERSION = 1
+CACHE_FILE_SUFFIX = ".sprite"
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+class SpriteDiskCache:
+    """Directory of cached sprite frames keyed by source content, size and transforms."""
+
+    def __init__(self, directory: str) -> None:
+        """
+        Args:
+            directory: Cache directory. It is created on the first save.
+        """
+        self.directory = directory
+
+    def make_key(
+        self,
+        path: str,
+        size: Tuple[int, int],
+        animation_data: Dict[str, object],
+        source_path: Optional[str] = None,
+    ) -> str:
+        """
+        Compute the cache key of a sprite.
+
+        Args:
+            path: Path to the sprite directory.
+            size: Target sprite size.
+            animation_data: Parsed animation.json of the sprite.
+            source_path: Directory the frames are loaded from, if not path
+                (a mip level).
+
+        Returns:
+            Hex digest identifying the sprite sources, size and transform chains.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"v{FORMAT_VERSION};{size[0]}x{size[1]};".encode())
+        digest.update(
+            json.dumps(animation_data.get("transform"), sort_keys=True).encode()
+        )
+        source_path = path if source_path is None else source_path
+        files = [os.path.join(path, "animation.json")] + [
+            os.path.join(source_path, name)
+            for name in self._source_files(source_path, animation_data)
+        ]
+        for file_path in files:
+            with smart_open(file_path) as f:
+                content = f.read()
+            name = os.path.basename(file_path)
+            digest.update(f";{name}:{len(content)};".encode())
+            digest.update(content)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _source_files(path: str, animation_data: Dict[str, object]) -> List[str]:
+        # The files the sprite loads its frames from: a stale atlas is ignored
+        if AtlasIndex.load(path) is not None:
+            return [ATLAS_INDEX, ATLAS_IMAGE]
+        names = []
+        for variation in cast(List[str], animation_data["variations"]):
+            for frame_index in range(cast(int, animation_data["frame_count"])):
+                names.append(f"{frame_name(variation, frame_index)}.png")
+        return names
+
+    def _file_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_FILE_SUFFIX)
+
+    def load(self, key: str) -> Optional[Dict[SpriteKey, SpriteFrame]]:
+        """
+        Load cached frames with a single file read.
+
+        Returns:
+            The frames, or None if there is no valid cache entry.
+        """
+        try:
+            with open(self._file_path(key), "rb") as f:
+                data = f.read()
+            (header_length,) = _HEADER_LENGTH.unpack_from(data)
+            start = _HEADER_LENGTH.size
+            header = json.loads(data[start : start + header_length])
+            offset = start + header_length
+
+            surfaces = []
+            for width, height in header["surfaces"]:
+                end = offset + width * height * 4
+                if end > len(data):
+                    return None
+                surface = pygame.image.frombytes(
+                    data[offset:end], (width, height), "RGBA"
+                )
+                surfaces.append(surface.convert_alpha())
+                offset = end
+
+            sprites: Dict[SpriteKey, SpriteFrame] = {}
+            shared: Dict[Tuple[int, int, int], SpriteFrame] = {}
+            for variation, frame_index, direction, index, ax, ay in header["frames"]:
+                # Frames which shared an object keep sharing it
+                sprite = shared.setdefault((index, ax, ay), (surfaces[index], [ax, ay]))
+                sprites[(variation, frame_index, direction)] = sprite
+            return sprites
+        except (OSError, ValueError, KeyError, IndexError, struct.error):
+            return None
+
+    def save(self, key: str, sprites: Dict[SpriteKey, SpriteFrame]) -> None:
+        """
+        Store frames in the cache. Failures to write are ignored.
+        """
+        surfaces: List[pygame.Surface] = []
+        surface_indices: Dict[int, int] = {}
+        frames = []
+        for (variation, frame_index, direction), (image, anchor) in sprites.items():
+            index = surface_indices.get(id(image))
+            if index is None:
+                index = surface_indices[id(image)] = len(surfaces)
+                surfaces.append(image)
+            frames.append(
+                [variation, frame_index, direction, index, anchor[0], anchor[1]]
+            )
+        header = json.dumps(
+            {"surfaces": [list(s.get_size()) for s in surfaces], "frames": frames}
+        ).encode()
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER_LENGTH.pack(len(header)))
+                f.write(header)
+                for surface in surfaces:
+                    f.write(pygame.image.tobytes(surface, "RGBA"))
+            # Atomic replace, so concurrent readers never see a partial file
+            os.replace(tmp_path, self._file_path(key))
+        except OSError:
+            pass
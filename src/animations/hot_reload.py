@@ -0,0 +1,132 @@
+"""
+Reloading of changed sprite assets while the game runs (development mode).
+
+SpriteWatcher keeps an AssetManifest (content hashes of all files) of every
+sprite directory in the sprite cache and reloads the sprites of a directory
+in place as soon as any of its files changes.
+"""
+
+import hashlib
+import os
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+import pygame
+
+from settings import HOT_RELOAD_INTERVAL
+from animations.sprite_cache import SpriteCache
+from util.zip_pool import split_zip_path
+
+
+class AssetManifest:
+    """
+    Content hashes of all files under a directory by relative path.
+    Files with unchanged size and modification time are not hashed again.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.hashes: Dict[str, str] = {}
+        self._stats: Dict[str, Tuple[int, int]] = {}
+        self.update()
+
+    def update(self) -> Set[str]:
+        """
+        Scan the directory again.
+
+        Returns:
+            Relative paths of the added, removed and changed files.
+        """
+        hashes = {}
+        stats = {}
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                file_path = os.path.join(root, name)
+                relative = os.path.relpath(file_path, self.directory)
+                try:
+                    stat = os.stat(file_path)
+                    key = (stat.st_size, stat.st_mtime_ns)
+                    if self._stats.get(relative) == key:
+                        hashes[relative] = self.hashes[relative]
+                    else:
+                        hashes[relative] = self._hash_file(file_path)
+                    stats[relative] = key
+                except OSError:
+                    continue  # Removed while scanning
+
+        changed = {
+            relative
+            for relative in hashes.keys() | self.hashes.keys()
+            if hashes.get(relative) != self.hashes.get(relative)
+        }
+        self.hashes = hashes
+        self._stats = stats
+        return changed
+
+    @staticmethod
+    def _hash_file(file_path: str) -> str:
+        with open(file_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+
+class SpriteWatcher:
+    """
+    Watches the files of the cached sprites and reloads changed ones.
+    Sprites stored in ZIP archives are not watched.
+    """
+
+    def __init__(self, cache: SpriteCache, interval: int = HOT_RELOAD_INTERVAL) -> None:
+        """
+        Args:
+            cache: Sprite cache to watch.
+            interval: Minimal time between two scans in milliseconds.
+        """
+        self.cache = cache
+        self.interval = interval
+        self._manifests: Dict[str, AssetManifest] = {}
+        self._last_check: Optional[int] = None
+
+    def poll(self) -> List[str]:
+        """
+        Check for changes if the interval has elapsed since the last check.
+        Intended to be called on every main loop iteration.
+
+        Returns:
+            The reloaded asset paths.
+        """
+        now = pygame.time.get_ticks()
+        if self._last_check is not None and now - self._last_check < self.interval:
+            return []
+        self._last_check = now
+        return self.check()
+
+    def check(self) -> List[str]:
+        """
+        Reload the sprites of every directory with changed files. Directories
+        of sprites added to the cache since the last check are only scanned.
+        A sprite that fails to load is reported and keeps its old frames.
+
+        Returns:
+            The reloaded asset paths.
+        """
+        paths = [p for p in self.cache.get_paths() if split_zip_path(p) is None]
+        self._manifests = {
+            path: manifest
+            for path, manifest in self._manifests.items()
+            if path in paths
+        }
+        reloaded = []
+        for path in paths:
+            manifest = self._manifests.get(path)
+            if manifest is None:
+                self._manifests[path] = AssetManifest(path)
+                continue
+            if not manifest.update():
+                continue
+            try:
+                self.cache.reload(path)
+            except (OSError, ValueError, KeyError, pygame.error) as e:
+                print(f"Failed to reload {path}: {e}", file=sys.stderr)
+                continue
+            reloaded.append(path)
+        return reloaded
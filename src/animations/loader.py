@@ -0,0 +1,118 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Optional, Tuple
+
+from animations.animated import AnimatedSprite, DecodedSource
+
+
+class AsyncSpriteLoader:
+    """
+    Loads sprites in the background. Source images are read, decoded and scaled
+    on a worker pool as soon as the loader is created; the display-bound steps
+    (convert_alpha and building the frames of each direction) are done by poll,
+    which must be called from the main thread, e.g. once per frame.
+    """
+
+    def __init__(
+        self, sprites: Iterable[AnimatedSprite], max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Start decoding the source images of the given sprites.
+
+        Args:
+            sprites: Sprites to load. Already loaded sprites are skipped.
+            max_workers: Number of worker threads (default: ThreadPoolExecutor's).
+        """
+        self._sprites = [sprite for sprite in sprites if not sprite.is_loaded()]
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[Future[DecodedSource], Tuple[AnimatedSprite, str]] = {}
+        jobs = [
+            (sprite, name)
+            for sprite in self._sprites
+            for name in sprite.get_pending_sources()
+        ]
+        if jobs:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+            for sprite, name in jobs:
+                future = self._executor.submit(sprite.decode_source, name)
+                self._pending[future] = (sprite, name)
+        self._total_steps = len(jobs) + len(self._sprites)
+        self._done_steps = 0
+
+    def poll(self, timeout: Optional[float] = 0) -> bool:
+        """
+        Install the decoded images and build the frames of one sprite whose
+        images are all installed, so a single call stays short.
+
+        Args:
+            timeout: Seconds to wait for a decoded image if none is ready yet
+                (None waits until one is).
+
+        Returns:
+            True when all sprites are loaded.
+
+        Raises:
+            Any exception raised while decoding a source image.
+        """
+        if self._pending:
+            done, _ = wait(self._pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                sprite, name = self._pending.pop(future)
+                sprite.install_source(name, future.result())
+                self._done_steps += 1
+            if not self._pending:
+                self._shutdown()
+
+        decoding = {id(sprite) for sprite, _ in self._pending.values()}
+        for sprite in self._sprites:
+            if id(sprite) not in decoding:
+                self._sprites.remove(sprite)
+                sprite.warm_up()
+                self._done_steps += 1
+                break
+        return self.is_done()
+
+    def wait(self) -> None:
+        """Block until all sprites are loaded."""
+        while not self.poll(timeout=None):
+            pass
+
+    def cancel(self) -> None:
+        """Stop loading. Images not installed yet are discarded."""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._sprites.clear()
+        self._shutdown()
+
+    def is_done(self) -> bool:
+        return not self._pending and not self._sprites
+
+    def get_progress(self) -> float:
+        """Get the loaded part in range [0, 1]."""
+        if self._total_steps == 0:
+            return 1.0
+        return self._done_steps / self._total_steps
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def load_in_parallel(
+    sprites: Iterable[AnimatedSprite], max_workers: Optional[int] = None
+) -> None:
+    """
+    Fully load the given sprites, reading, decoding and scaling their source
+    images on a worker pool. Only the display-bound steps (convert_alpha and
+    building the frames of each direction) run on the calling thread, which
+    must be the main thread.
+
+    Args:
+        sprites: Sprites to load. Already loaded sprites are skipped.
+        max_workers: Number of worker threads (default: ThreadPoolExecutor's).
+
+    Raises:
+        Any exception raised while decoding a source image.
+    """
+    AsyncSpriteLoader(sprites, max_workers).wait()
@@ -0,0 +1,108 @@
+# REGISTER_DOCTEST
+"""
+Pre-downscaled source levels of an animation directory (a mip chain).
+
+An animation directory may contain "mips.json" describing downscaled copies of
+its frame files, generated by tools/downscale.py --mip:
+
+    {
+      "source_size": [512, 512],
+      "levels": [[256, 256], [128, 128], [64, 64]]
+    }
+
+The frames of each level are stored in "mip/<width>x<height>/" under the same
+file names as the source frames. A level directory may have its own atlas
+(see animations/atlas.py). Anchors in animation.json always refer to the
+source size. mips.json also records a stamp of animation.json and the
+source frames; a stale chain is ignored (see animations/sources.py).
+"""
+
+import json
+import os
+from typing import List, Optional, Tuple
+
+from util.sopen import smart_exists, smart_open
+from animations.sources import SOURCES_KEY, is_current, make_stamp, source_files
+
+MIP_INDEX = "mips.json"
+MIP_DIR = "mip"
+
+
+def level_dir(level: Tuple[int, int]) -> str:
+    """
+    Get the directory of a level relative to the animation directory.
+
+    Examples:
+        >>> level_dir((64, 32)).replace(os.sep, "/")
+        'mip/64x32'
+    """
+    return os.path.join(MIP_DIR, f"{level[0]}x{level[1]}")
+
+
+class MipIndex:
+    """Description of the mip chain of an animation directory."""
+
+    def __init__(
+        self, source_size: Tuple[int, int], levels: List[Tuple[int, int]]
+    ) -> None:
+        """
+        Args:
+            source_size: Size of the source frames.
+            levels: Frame sizes of the downscaled levels.
+        """
+        self.source_size = source_size
+        self.levels = levels
+
+    @classmethod
+    def load(cls, path: str) -> Optional["MipIndex"]:
+        """
+        Load the mip index of an animation directory.
+
+        Returns:
+            The index, or None if the directory has no mip chain or the
+            sources changed since it was built.
+        """
+        index_path = os.path.join(path, MIP_INDEX)
+        if not smart_exists(index_path):
+            return None
+        with smart_open(index_path) as f:
+            data = json.load(f)
+        if not is_current(path, data):
+            return None
+        width, height = data["source_size"]
+        return cls((width, height), [(w, h) for w, h in data["levels"]])
+
+    def save(self, path: str) -> None:
+        """Write the index with a stamp of the sources into the animation directory."""
+        data = {
+            "source_size": list(self.source_size),
+            "levels": [list(level) for level in self.levels],
+            SOURCES_KEY: make_stamp(path, source_files(path)),
+        }
+        with open(os.path.join(path, MIP_INDEX), "w") as f:
+            json.dump(data, f, indent=2)
+
+    def select_level(self, size: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Pick the smallest level at or above the target size.
+
+        Returns:
+            The level, or None if the source frames have to be used.
+
+        Examples:
+            >>> index = MipIndex((512, 512), [(256, 256), (128, 128), (64, 64)])
+            >>> index.select_level((100, 60))
+            (128, 128)
+            >>> index.select_level((64, 64))
+            (64, 64)
+            >>> index.select_level((300, 80)) is None
+            True
+        """
+        candidates = [
+            level
+            for level in self.levels
+            if level[0] >= size[0] and level[1] >= size[1]
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda level: level[0] * level[1])
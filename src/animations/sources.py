@@ -0,0 +1,94 @@
+# REGISTER_DOCTEST
+"""
+Source files of an animation directory and stamps of generated files.
+
+Generated indexes (atlas.json, mips.json) record a stamp of the files they
+were made from: the file names and a SHA-256 digest of their contents. An
+index whose sources changed since (e.g. a frame edited after a build) is
+stale and ignored, so the sprite is loaded from its source frames instead.
+Indexes inside ZIP archives are packaged together with their sources and
+are not checked.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Mapping, Optional, cast
+
+from util.sopen import smart_exists, smart_open
+from util.zip_pool import split_zip_path
+
+ANIMATION_DATA = "animation.json"
+SOURCES_KEY = "sources"  # Key of the stamp in generated indexes
+
+
+def frame_name(variation: str, frame_index: int) -> str:
+    """
+    Get the name of a frame file (without extension) and of its atlas entry.
+
+    Examples:
+        >>> frame_name("l", 3)
+        'l_3'
+    """
+    return f"{variation}_{frame_index}"
+
+
+def source_files(path: str) -> List[str]:
+    """Get animation.json and the frame files it lists, relative to path."""
+    with smart_open(os.path.join(path, ANIMATION_DATA)) as f:
+        data = json.load(f)
+    return [ANIMATION_DATA] + [
+        f"{frame_name(variation, frame_index)}.png"
+        for variation in data["variations"]
+        for frame_index in range(data["frame_count"])
+    ]
+
+
+def digest_files(path: str, files: List[str]) -> Optional[str]:
+    """
+    Get the SHA-256 digest of the names and contents of files under path.
+
+    Returns:
+        The hex digest, or None if a file is missing.
+    """
+    digest = hashlib.sha256()
+    for name in files:
+        file_path = os.path.join(path, name)
+        if not smart_exists(file_path):
+            return None
+        with smart_open(file_path) as f:
+            content = f.read()
+        digest.update(f"{name}:{len(content)};".encode())
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def make_stamp(path: str, files: List[str]) -> Dict[str, object]:
+    """Get the stamp of files under path to store in a generated index."""
+    return {"files": list(files), "sha256": digest_files(path, files)}
+
+
+def is_current(path: str, index_data: Mapping[str, object]) -> bool:
+    """
+    Check whether the sources stamped in a generated index of the directory
+    path are unchanged. Indexes without a stamp are stale.
+
+    Examples:
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     with open(os.path.join(tmpdir, "a_0.png"), "wb") as f:
+        ...         _ = f.write(b"frame")
+        ...     index = {SOURCES_KEY: make_stamp(tmpdir, ["a_0.png"])}
+        ...     fresh = is_current(tmpdir, index)
+        ...     with open(os.path.join(tmpdir, "a_0.png"), "wb") as f:
+        ...         _ = f.write(b"edited")
+        ...     fresh, is_current(tmpdir, index), is_current(tmpdir, {})
+        (True, False, False)
+    """
+    if split_zip_path(path) is not None:
+        return True
+    stamp = index_data.get(SOURCES_KEY)
+    if not isinstance(stamp, dict):
+        return False
+    digest = digest_files(path, cast(List[str], stamp.get("files", [])))
+    return digest is not None and digest == stamp.get("sha256")
@@ -0,0 +1,170 @@
+import os
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from settings import SPRITE_CACHE_BUDGET, SPRITE_DISK_CACHE_DIR, SPRITE_LAZY_LOADING
+from animations.animated import AnimatedSprite
+from animations.disk_cache import SpriteDiskCache
+from animations.loader import load_in_parallel
+
+
+class SpriteCache:
+    """
+    Process-wide cache of AnimatedSprite objects keyed by (asset path, target size).
+    Sprites are shared between all requesters, so rebuilding a screen does not
+    load, scale or transform any image again.
+    The least recently used sprites are evicted while the total surface memory
+    exceeds the budget. The most recently requested sprite is never evicted.
+    Lazy sprites grow as their frames are used; the budget is enforced
+    whenever a new sprite is added or the budget is changed.
+    """
+
+    def __init__(
+        self,
+        budget: int = SPRITE_CACHE_BUDGET,
+        lazy: bool = False,
+        disk_cache: Optional[SpriteDiskCache] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            budget: Surface memory budget in bytes.
+            lazy: Create sprites which load their frames on first use.
+            disk_cache: Persistent frame cache passed to the created sprites.
+            max_workers: Number of threads used by get_many to decode images.
+        """
+        self._budget = budget
+        self._lazy = lazy
+        self._disk_cache = disk_cache
+        self._max_workers = max_workers
+        self._sprites: OrderedDict[Tuple[str, Tuple[int, int]], AnimatedSprite] = (
+            OrderedDict()
+        )
+
+    def get(self, path: str, size: Tuple[int, int]) -> AnimatedSprite:
+        """
+        Get the sprite for the given asset path and size, loading it on a miss.
+
+        Args:
+            path: Path to the sprite directory.
+            size: Target sprite size (width, height) in pixels.
+
+        Returns:
+            The shared AnimatedSprite instance.
+        """
+        key = self._make_key(path, size)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            return sprite
+        sprite = AnimatedSprite(
+            path, size, lazy=self._lazy, disk_cache=self._disk_cache
+        )
+        self._sprites[key] = sprite
+        self._evict()
+        return sprite
+
+    def get_many(
+        self,
+        requests: Mapping[str, Tuple[str, Tuple[int, int]]],
+        load: bool = True,
+    ) -> Dict[str, AnimatedSprite]:
+        """
+        Get several sprites at once. Unless the cache is lazy, the missing
+        sprites are loaded together with their images decoded in parallel.
+
+        Args:
+            requests: (path, size) of each requested sprite by name.
+            load: If False, missing sprites are only created and are left
+                for the caller to load, e.g. with AsyncSpriteLoader.
+
+        Returns:
+            The shared AnimatedSprite instances by name.
+        """
+        sprites = {}
+        missing = []
+        for name, (path, size) in requests.items():
+            key = self._make_key(path, size)
+            sprite = self._sprites.get(key)
+            if sprite is None:
+                sprite = AnimatedSprite(
+                    path,
+                    size,
+                    lazy=self._lazy,
+                    disk_cache=self._disk_cache,
+                    defer_loading=True,
+                )
+                missing.append(sprite)
+            self._sprites[key] = sprite
+            self._sprites.move_to_end(key)
+            sprites[name] = sprite
+        if missing and load and not self._lazy:
+            load_in_parallel(missing, self._max_workers)
+        self._evict(keep=len(sprites))
+        return sprites
+
+    def contains(self, path: str, size: Tuple[int, int]) -> bool:
+        """Check whether the sprite is cached without touching the LRU order."""
+        return self._make_key(path, size) in self._sprites
+
+    def get_paths(self) -> List[str]:
+        """Get the asset paths of the cached sprites."""
+        return list(dict.fromkeys(path for path, _ in self._sprites))
+
+    def reload(self, path: str) -> int:
+        """
+        Reload the cached sprites of the asset path in place, so views keep
+        using the same AnimatedSprite objects.
+
+        Returns:
+            The number of reloaded sprites.
+        """
+        path = os.path.normpath(path)
+        sprites = [s for (p, _), s in self._sprites.items() if p == path]
+        for sprite in sprites:
+            sprite.reload()
+        self._evict()
+        return len(sprites)
+
+    def get_budget(self) -> int:
+        """Get the surface memory budget in bytes."""
+        return self._budget
+
+    def set_budget(self, budget: int) -> None:
+        """Set the surface memory budget in bytes, evicting sprites if needed."""
+        if budget < 0:
+            raise ValueError(f"Budget must be non-negative, got {budget}")
+        self._budget = budget
+        self._evict()
+
+    def get_memory_size(self) -> int:
+        """Get the total surface memory of the cached sprites in bytes."""
+        return sum(sprite.get_memory_size() for sprite in self._sprites.values())
+
+    def clear(self) -> None:
+        """Drop all cached sprites."""
+        self._sprites.clear()
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    @staticmethod
+    def _make_key(path: str, size: Tuple[int, int]) -> Tuple[str, Tuple[int, int]]:
+        return os.path.normpath(path), (size[0], size[1])
+
+    def _evict(self, keep: int = 1) -> None:
+        # Drop least recently used sprites, always keeping the newest ones
+        total = self.get_memory_size()
+        while total > self._budget and len(self._sprites) > keep:
+            _, sprite = self._sprites.popitem(last=False)
+            total -= sprite.get_memory_size()
+
+
+SPRITE_CACHE = SpriteCache(
+    lazy=SPRITE_LAZY_LOADING,
+    disk_cache=(
+        SpriteDiskCache(SPRITE_DISK_CACHE_DIR) if SPRITE_DISK_CACHE_DIR else None
+    ),
+)
@@ -1,4 +1,5 @@
 import argparse
+import os
 import sys
 from current_version import VERSION
 
@@ -6,6 +7,17 @@ MAIN_ASSETS = True  # Sign to use main set of assets, not the test assets
 
 SUPPORTED_LANGUAGES = {"en": "en_US", "ru": "ru_RU"}
 LANGUAGE = "en_US"
+DEV_MODE = False
+SPRITE_LAZY_LOADING = False
+RENDER_BACKEND = "surface"
+LOGICAL_CELL_SIZE = None
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive number")
+    return number
 
 
 def process_cmdline() -> int:
@@ -24,6 +36,57 @@ def process_cmdline() -> int:
         default="en",
         help="language code to use (default: en)",
     )
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="development mode: reload changed sprites while running",
+    )
+    parser.add_argument(
+        "--lazy-sprites",
+        action="store_true",
+        help="load sprite frames on first use instead of at level start",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=["surface", "texture"],
+        default="surface",
+        help="draw with software surfaces or SDL2 textures (default: surface)",
+    )
+    parser.add_argument(
+        "--cell-size",
+        type=int,
+        metavar="PIXELS",
+        help="draw the board with cells of PIXELS and scale it to the screen",
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=positive_int,
+        metavar="FRAMES",
+        help="draw FRAMES frames of the play screen headless, print times as JSON",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        metavar="FILE",
+        help="write the benchmark JSON to FILE instead of stdout",
+    )
+    parser.add_argument(
+        "--resolution",
+        type=str,
+        default="1920x1080",
+        help="benchmark resolution WIDTHxHEIGHT (default: 1920x1080)",
+    )
+    parser.add_argument(
+        "--sprites",
+        type=int,
+        default=0,
+        help="number of additional animated sprites in the benchmark",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="benchmark redrawing only what changed instead of full frames",
+    )
     args = parser.parse_args()
     if args.list_lang:
         print("Supported languages:")
@@ -35,12 +98,34 @@ def process_cmdline() -> int:
             f"Error: unsupported language '{args.lang}'. Supported languages are: {', '.join(SUPPORTED_LANGUAGES)}",
             file=sys.stderr,
         )
-    global LANGUAGE
+    global LANGUAGE, DEV_MODE, SPRITE_LAZY_LOADING, RENDER_BACKEND, LOGICAL_CELL_SIZE
     LANGUAGE = SUPPORTED_LANGUAGES[args.lang]
+    DEV_MODE = args.dev
+    SPRITE_LAZY_LOADING = args.lazy_sprites
+    RENDER_BACKEND = args.renderer
+    if args.cell_size is not None:
+        LOGICAL_CELL_SIZE = (args.cell_size, args.cell_size)
+    if args.benchmark is not None:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"  # Headless
+        os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"  # Keep stdout pure JSON
     import settings
 
     getattr(settings, "LANGUAGE", LANGUAGE)  # Avoiding flake8 problems
 
+    if args.benchmark is not None:
+        from game import benchmark
+
+        width, height = (int(n) for n in args.resolution.split("x"))
+        return benchmark.main(
+            (width, height),
+            args.benchmark,
+            args.sprites,
+            args.renderer == "texture",
+            LOGICAL_CELL_SIZE,
+            not args.incremental,
+            args.output,
+        )
+
     from game.main import main
 
     return main()
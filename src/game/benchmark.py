@@ -0,0 +1,180 @@
+# REGISTER_DOCTEST
+"""
+Headless render benchmark of the play screen.
+
+The screen is drawn into an off-screen surface as fast as possible, without
+MainLoop throttling, and the frame times are reported as JSON. Every window
+is invalidated before each frame, so a frame is a full redraw at the
+benchmark resolution; with full_redraw=False only what changed is redrawn,
+as in the game. Run it with the SDL dummy video driver (see digger.py
+--benchmark).
+"""
+
+import json
+import math
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+from mainloop.environment import Environment
+from mainloop.screens import Screen
+from game.main import create_texture_environment
+from game.playscreen import PlayScreen
+from views.hobbin_view import HobbinView
+
+# Frames drawn before measuring: the first ones redraw everything
+WARMUP_FRAMES = 10
+
+
+def percentile(sorted_values: Sequence[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of sorted values.
+
+    Examples:
+        >>> percentile([1.0, 2.0, 3.0, 4.0], 50)
+        2.0
+        >>> percentile([1.0, 2.0, 3.0, 4.0], 99)
+        4.0
+        >>> percentile([5.0], 0)
+        5.0
+    """
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def measure_frames(
+    screen: Screen,
+    frames: int,
+    warmup: int = WARMUP_FRAMES,
+    full_redraw: bool = True,
+) -> List[float]:
+    """
+    Tick the screen warmup + frames times, invalidating all windows before
+    every tick if full_redraw is set.
+
+    Returns:
+        The measured frame times in milliseconds.
+    """
+    for _ in range(warmup):
+        if full_redraw:
+            screen.invalidate()
+        screen.tick([])
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        if full_redraw:
+            screen.invalidate()
+        screen.tick([])
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def summarize(times: List[float]) -> Dict[str, float]:
+    """
+    Get the mean, p50, p95 and p99 of frame times in milliseconds.
+
+    Examples:
+        >>> summarize([2.0, 1.0, 4.0, 3.0])["p95_ms"]
+        4.0
+        >>> summarize([2.0, 1.0, 4.0, 3.0])["fps"]
+        400.0
+        >>> summarize([])
+        Traceback (most recent call last):
+        ...
+        ValueError: No frame times to summarize
+    """
+    if not times:
+        raise ValueError("No frame times to summarize")
+    ordered = sorted(times)
+    mean = sum(ordered) / len(ordered)
+    return {
+        "mean_ms": mean,
+        "p50_ms": percentile(ordered, 50),
+        "p95_ms": percentile(ordered, 95),
+        "p99_ms": percentile(ordered, 99),
+        "fps": 1000 / mean if mean > 0 else math.inf,
+    }
+
+
+def add_sprites(screen: PlayScreen, count: int) -> None:
+    """Add count animated sprites spread over the cells of the game board."""
+    window = screen.game_window
+    sprite = window.sprites["hobbin"]
+    width, height = window.board_width_cells, window.board_height_cells
+    for i in range(count):
+        cx, cy = i % width, (i // width) % height
+        view = HobbinView(sprite, (window.cell_width, window.cell_height))
+        view.set_position(
+            (
+                cx * window.cell_width + window.cell_width // 2,
+                cy * window.cell_height + window.cell_height // 2,
+            )
+        )
+        window.add_view(10, view)
+
+
+def run_benchmark(
+    resolution: Tuple[int, int],
+    frames: int,
+    sprites: int = 0,
+    texture: bool = False,
+    logical_cell_size: Optional[Tuple[int, int]] = None,
+    full_redraw: bool = True,
+) -> Dict[str, object]:
+    """
+    Draw the play screen at the given resolution and measure frame times.
+
+    Args:
+        resolution: Size of the off-screen surface the screen is drawn to.
+        frames: Number of measured frames.
+        sprites: Number of additional animated sprites on the board.
+        texture: Draw with the TextureBackend into a hidden SDL2 window.
+        logical_cell_size: Draw the board with cells of this size and scale it.
+        full_redraw: Redraw all windows every frame, not only what changed.
+    """
+    pygame.init()
+    if texture:
+        from pygame._sdl2.video import Window
+
+        env = create_texture_environment(Window("Benchmark", resolution, hidden=True))
+    else:
+        pygame.display.set_mode((1, 1))  # Needed for converting sprite images
+        env = Environment(pygame.Surface(resolution))
+    screen = PlayScreen(env, logical_cell_size=logical_cell_size)
+    add_sprites(screen, sprites)
+    result: Dict[str, object] = {
+        "resolution": list(resolution),
+        "frames": frames,
+        "sprites": sprites,
+        "renderer": "texture" if texture else "surface",
+        "logical_cell_size": list(logical_cell_size) if logical_cell_size else None,
+        "full_redraw": full_redraw,
+    }
+    result.update(summarize(measure_frames(screen, frames, full_redraw=full_redraw)))
+    return result
+
+
+def main(
+    resolution: Tuple[int, int],
+    frames: int,
+    sprites: int = 0,
+    texture: bool = False,
+    logical_cell_size: Optional[Tuple[int, int]] = None,
+    full_redraw: bool = True,
+    output: Optional[str] = None,
+) -> int:
+    """
+    Run the benchmark and write the report as JSON to the file output, or to
+    stdout if output is None.
+    """
+    result = run_benchmark(
+        resolution, frames, sprites, texture, logical_cell_size, full_redraw
+    )
+    report = json.dumps(result, indent=2)
+    if output is None:
+        print(report)
+    else:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    return 0
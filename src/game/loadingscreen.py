@@ -0,0 +1,61 @@
+import pygame
+from mainloop.screens import Screen, Screens, Window
+from mainloop.environment import Environment
+
+from animations.loader import AsyncSpriteLoader
+
+
+class ProgressWindow(Window):
+    """Window with a centered progress bar"""
+
+    def __init__(self, env: Environment, loader: AsyncSpriteLoader) -> None:
+        super().__init__(env)
+        self.loader = loader
+        self.color = (0, 0, 0)  # Black background
+        self.frame_color = (128, 128, 128)  # Gray bar frame
+        self.bar_color = (255, 255, 255)  # White bar
+
+        # Bar is half of the display wide and centered
+        display_width, display_height = env.display.get_size()
+        bar_width = display_width // 2
+        bar_height = max(display_height // 40, 4)
+        self.bar_rect = pygame.Rect(0, 0, bar_width, bar_height)
+        self.bar_rect.center = (display_width // 2, display_height // 2)
+
+    def tick(self, events: list[pygame.event.Event]) -> None:
+        pygame.draw.rect(self.env.display, self.color, self.get_rect())
+        pygame.draw.rect(self.env.display, self.frame_color, self.bar_rect, 1)
+
+        filled = self.bar_rect.inflate(-4, -4)
+        filled.width = round(filled.width * self.loader.get_progress())
+        if filled.width > 0:
+            pygame.draw.rect(self.env.display, self.bar_color, filled)
+
+
+class LoadingScreen(Screen):
+    """
+    Screen showing the progress of an AsyncSpriteLoader. The loader is polled
+    once per tick; when it is done the next screen is made active.
+    """
+
+    def __init__(
+        self,
+        env: Environment,
+        screens: Screens,
+        loader: AsyncSpriteLoader,
+        next_screen: str,
+        interval: int = 16,
+    ) -> None:
+        super().__init__(env, interval)
+        self.screens = screens
+        self.loader = loader
+        self.next_screen = next_screen
+
+        self.progress_window = ProgressWindow(env, loader)
+        self.add_window(1, self.progress_window)
+
+    def tick(self, events: list[pygame.event.Event]) -> None:
+        done = self.loader.poll()
+        super().tick(events)
+        if done:
+            self.screens.set_active_screen(self.next_screen)
@@ -1,27 +1,64 @@
+from typing import TYPE_CHECKING
 import pygame
 from mainloop.environment import Environment
 from mainloop.screens import Screens
 from mainloop.mainloop import MainLoop
 from game.playscreen import PlayScreen
+from game.loadingscreen import LoadingScreen
+from animations.loader import AsyncSpriteLoader
+from animations.hot_reload import SpriteWatcher
+from animations.sprite_cache import SPRITE_CACHE
+from settings import DEV_MODE, LOGICAL_CELL_SIZE, RENDER_BACKEND, UPDATE_INTERVAL
+
+if TYPE_CHECKING:
+    from pygame._sdl2.video import Window
 
 
 def create_digger_screens(env: Environment) -> Screens:
     screens = Screens(env)
 
-    # Create game screen
-    play_screen = PlayScreen(env, interval=60)  # 60 FPS
+    # Create game screen, its sprites are loaded by the loading screen.
+    # The game advances in fixed steps (see main()), drawing runs at ~60 FPS.
+    play_screen = PlayScreen(
+        env, interval=16, load_sprites=False, logical_cell_size=LOGICAL_CELL_SIZE
+    )
+    screens.add_screen("play", play_screen)
 
-    # Add screen and make it active
-    screens.add_screen("play", play_screen, make_active=True)
+    # Show loading progress first, then switch to the game screen
+    loader = AsyncSpriteLoader(play_screen.get_sprites())
+    loading_screen = LoadingScreen(env, screens, loader, next_screen="play")
+    screens.add_screen("loading", loading_screen, make_active=True)
 
     return screens
 
 
+def create_texture_environment(window: "Window") -> Environment:
+    """
+    Create an environment drawing with the renderer of an SDL2 window.
+    Windows draw into an off-screen surface of the window size.
+    """
+    # Imported here, so the software renderer works without pygame._sdl2
+    from pygame._sdl2.video import Renderer
+    from mainloop.render_sdl2 import TextureBackend
+
+    # A (hidden) display mode provides the pixel format for convert_alpha
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    display = pygame.Surface(tuple(window.size))
+    return Environment(display, TextureBackend(Renderer(window), display))
+
+
 def main() -> int:
     pygame.init()
-    display = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-    env = Environment(display)
+    if RENDER_BACKEND == "texture":
+        from pygame._sdl2.video import Window
+
+        env = create_texture_environment(Window("Digger", fullscreen_desktop=True))
+    else:
+        display = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        env = Environment(display)
     screens = create_digger_screens(env)
-    loop = MainLoop(env, screens)
+    loop = MainLoop(env, screens, update_interval=UPDATE_INTERVAL, paced=True)
+    if DEV_MODE:
+        loop.add_hook(SpriteWatcher(SPRITE_CACHE).poll)
     loop.run()
     return 0
@@ -1,21 +1,34 @@
 import pygame
-from typing import List, Tuple, Dict
-from mainloop.screens import Screen, Window
+from typing import List, Optional, Tuple, Dict
+from mainloop.screens import ScaledWindow, Screen, Window
 from mainloop.environment import Environment
+from mainloop.profiler import FrameProfiler
 
 from settings import asset_path
 from animations.animated import AnimatedSprite
+from animations.sprite_cache import SPRITE_CACHE
 from views.hobbin_view import HobbinView
+from models.board import BoardModel
+from game.terrain import TerrainLayer
 
 
 class BackgroundWindow(Window):
-    """Background window with lowest priority, covering the entire screen"""
+    """
+    Background window with lowest priority, covering the entire screen.
+    The background rectangles are pre-rendered into a cached layer, which is
+    rendered again only when their color or layout changes and blitted only
+    when the window is invalid.
+    """
+
+    tracks_dirty_rects = True
 
     def __init__(self, env: Environment, background_rects: List[pygame.Rect]) -> None:
         super().__init__(env)
         self.color = (50, 50, 50)  # Dark gray background
         self.background_rects = background_rects
         self.rect_color = (0, 0, 0)  # White color for background rectangles
+        # Pre-rendered background rectangles (None when outdated)
+        self._layer: Optional[List[Tuple[pygame.Surface, pygame.Rect]]] = None
 
     def tick(self, events: list[pygame.event.Event]) -> None:
         # Handle keyboard events for color switching
@@ -28,17 +41,47 @@ class BackgroundWindow(Window):
                     else:
                         self.set_rect_color((255, 255, 255))  # White
 
-        # Draw background rectangles
-        for rect in self.background_rects:
-            pygame.draw.rect(self.env.display, self.rect_color, rect)
+        if self.is_valid():
+            return
+
+        # Blit background rectangles from the cached layer
+        if self._layer is None:
+            self._layer = self._render_layer()
+        self.env.display.blits(self._layer, doreturn=False)
+        for _, rect in self._layer:
+            self.mark_dirty(rect)
+        self.validate()
 
     def set_rect_color(self, color: Tuple[int, int, int]) -> None:
         """Set the color for background rectangles"""
-        self.rect_color = color
+        if color != self.rect_color:
+            self.rect_color = color
+            self._layer = None
+            self.invalidate()
+
+    def set_background_rects(self, background_rects: List[pygame.Rect]) -> None:
+        """Set the background rectangles (layout change)"""
+        self.background_rects = background_rects
+        self._layer = None
+        self.invalidate()
+
+    def _render_layer(self) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        layer = []
+        for rect in self.background_rects:
+            tile = pygame.Surface(rect.size, 0, self.env.display)
+            tile.fill(self.rect_color)
+            layer.append((tile, rect.copy()))
+        return layer
 
 
 class GameWindow(Window):
-    """Game board window"""
+    """
+    Game board window. The board terrain is kept in an off-screen layer,
+    which redraws only the cells changed in the BoardModel.
+    """
+
+    tracks_dirty_rects = True
+    batches_blits = True
 
     # Sprite asset definitions (name: path)
     SPRITE_ASSETS = {
@@ -51,12 +94,16 @@ class GameWindow(Window):
         env: Environment,
         rect: pygame.Rect,
         board_size: Tuple[int, int] = (10, 15),
+        load_sprites: bool = True,
+        board: Optional[BoardModel] = None,
     ) -> None:
         super().__init__(env)
         self.set_rect(rect)
         self.color = (24, 24, 24)  # Dark gray color for game board
 
         # Store board dimensions (in cells)
+        if board is not None:
+            board_size = board.size
         self.board_width_cells, self.board_height_cells = board_size
 
         # Calculate cell size (in pixels)
@@ -64,13 +111,20 @@ class GameWindow(Window):
         self.cell_width = rect.width // self.board_width_cells
         self.cell_height = rect.height // self.board_height_cells
 
-        # Load sprites
-        self.sprites: Dict[str, AnimatedSprite] = {}
-        for sprite_name, sprite_path in self.SPRITE_ASSETS.items():
-            self.sprites[sprite_name] = AnimatedSprite(
-                asset_path(sprite_path),
-                (self.cell_width, self.cell_height),
-            )
+        # Load sprites (shared with previous instances through the sprite cache)
+        self.sprites: Dict[str, AnimatedSprite] = SPRITE_CACHE.get_many(
+            {
+                sprite_name: (
+                    asset_path(sprite_path),
+                    (self.cell_width, self.cell_height),
+                )
+                for sprite_name, sprite_path in self.SPRITE_ASSETS.items()
+            },
+            load=load_sprites,
+        )
+
+        # Views are indexed by the board cells they cover
+        self.enable_spatial_index((max(self.cell_width, 1), max(self.cell_height, 1)))
 
         # Create hobbin view in top-right cell
         hobbin_sprite = self.sprites["digger"]
@@ -90,36 +144,128 @@ class GameWindow(Window):
         # Add hobbin view to this window
         self.add_view(priority=10, view=self.hobbin_view)
 
+        # Off-screen terrain (plain board color without a board model)
+        self.board = board
+        self.terrain = TerrainLayer(
+            rect.size, (self.cell_width, self.cell_height), board, self.color
+        )
+
+        # Areas drawn by the views on the previous tick (to be erased)
+        self._view_rects: List[pygame.Rect] = []
+
     def tick(self, events: list[pygame.event.Event]) -> None:
-        # Fill game board with green color
-        pygame.draw.rect(self.env.display, self.color, self.get_rect())
+        rect = self.get_rect()
+        changed = [r.move(rect.topleft) for r in self.terrain.update()]
+        if not self.is_valid():
+            # Blit the whole terrain
+            self.env.display.blit(self.terrain.surface, rect)
+            self.mark_dirty()
+            self.validate()
+        else:
+            # Blit only changed cells and what the views drew on the previous
+            # tick (to erase it)
+            areas = changed + [r.clip(rect) for r in self._view_rects]
+            self.env.display.blits(
+                [
+                    (self.terrain.surface, area, area.move(-rect.left, -rect.top))
+                    for area in areas
+                ],
+                doreturn=False,
+            )
+            for area in areas:
+                self.mark_dirty(area)
 
         # Draw grid (optional - for visualization)
         # TODO: Add grid lines
 
         # Tick all views (including hobbin_view)
-        for _, view in self._views:
-            view.tick()
+        self._view_rects = self.tick_views()
 
         # Game board rendering logic will be here
         # TODO: Add grid and game elements rendering
 
+    def close(self) -> None:
+        """Stop following the board; the window is not used afterwards."""
+        self.terrain.close()
+
 
 class StatusWindow(Window):
-    """Status window"""
+    """
+    Status window. PROFILER_KEY toggles frame-time profiling of all windows
+    and views, with the slowest of them shown over the window.
+    """
+
+    tracks_dirty_rects = True
+
+    PROFILER_KEY = pygame.K_F3
+    OVERLAY_LINES = 10  # Number of slowest windows and views shown
+    OVERLAY_INTERVAL = 500  # Interval of overlay updates (ms)
 
     def __init__(self, env: Environment, rect: pygame.Rect) -> None:
         super().__init__(env)
         self.set_rect(rect)
         self.color = (0, 0, 255)  # Blue color for status
+        self.text_color = (255, 255, 255)  # White overlay text
+        self._font: Optional[pygame.font.Font] = None
+        self._overlay_time: Optional[int] = None
 
     def tick(self, events: list[pygame.event.Event]) -> None:
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == self.PROFILER_KEY:
+                self.toggle_profiler()
+
+        profiler = self.env.profiler
+        if profiler is not None:
+            now = pygame.time.get_ticks()
+            if (
+                self.is_valid()
+                and self._overlay_time is not None
+                and now - self._overlay_time < self.OVERLAY_INTERVAL
+            ):
+                return
+            self._overlay_time = now
+        elif self.is_valid():
+            return
         # Fill status window with blue color
         pygame.draw.rect(self.env.display, self.color, self.get_rect())
+        if profiler is not None:
+            self._draw_overlay(profiler)
+        self.mark_dirty()
+        self.validate()
+
+    def toggle_profiler(self) -> None:
+        """Start profiling with a new profiler, or stop it."""
+        if self.env.profiler is None:
+            self.env.profiler = FrameProfiler()
+        else:
+            self.env.profiler = None
+        self._overlay_time = None
+        self.invalidate()
+
+    def _draw_overlay(self, profiler: FrameProfiler) -> None:
+        rect = self.get_rect()
+        if self._font is None:
+            self._font = pygame.font.Font(None, max(rect.height // 40, 12))
+        y = rect.top
+        for stats in profiler.get_top(self.OVERLAY_LINES):
+            text = f"{stats.name} {stats.mean_ms:.2f}/{stats.max_ms:.2f} ms"
+            image = self._font.render(text, True, self.text_color)
+            self.env.display.blit(
+                image, (rect.left, y), pygame.Rect(0, 0, rect.width, rect.bottom - y)
+            )
+            y += self._font.get_linesize()
+            if y >= rect.bottom:
+                break
 
 
 class PlayScreen(Screen):
-    """Game screen with game board and status windows"""
+    """
+    Game screen with game board and status windows.
+
+    With a logical cell size the game board is drawn into an off-screen
+    surface with cells of that size, scaled to the game rect once per frame,
+    so the cost of drawing sprites does not grow with the display resolution.
+    """
 
     def __init__(
         self,
@@ -127,8 +273,13 @@ class PlayScreen(Screen):
         interval: int = 60,
         board_size: Tuple[int, int] = (15, 10),
         status_width_percent: int = 20,
+        load_sprites: bool = True,  # False: caller loads get_sprites() itself
+        board: Optional[BoardModel] = None,
+        logical_cell_size: Optional[Tuple[int, int]] = None,
     ) -> None:
         super().__init__(env, interval)
+        if board is not None:
+            board_size = board.size
 
         # Store configuration
         self.board_size = board_size
@@ -146,12 +297,34 @@ class PlayScreen(Screen):
         background_window = BackgroundWindow(env, background_rects)
         background_window.set_rect(pygame.Rect(0, 0, display_width, display_height))
 
-        game_window = GameWindow(env, game_rect, board_size=self.board_size)
+        game_env = env
+        game_window_rect = game_rect
+        if logical_cell_size is not None:
+            # Board drawn at the logical resolution into its own surface
+            game_window_rect = pygame.Rect(
+                0,
+                0,
+                self.board_size[0] * logical_cell_size[0],
+                self.board_size[1] * logical_cell_size[1],
+            )
+            game_env = Environment(
+                pygame.Surface(game_window_rect.size, 0, env.display)
+            )
+        game_window = GameWindow(
+            game_env,
+            game_window_rect,
+            board_size=self.board_size,
+            load_sprites=load_sprites,
+            board=board,
+        )
         status_window = StatusWindow(env, status_rect)
 
         # Add windows with priorities (lower number = higher priority)
         self.add_window(1, background_window)  # Highest priority (drawn first)
-        self.add_window(5, game_window)  # Game board
+        if logical_cell_size is not None:
+            self.add_window(5, ScaledWindow(env, game_rect, game_window))
+        else:
+            self.add_window(5, game_window)  # Game board
         self.add_window(3, status_window)  # Status
 
         # Store references for potential use
@@ -160,6 +333,14 @@ class PlayScreen(Screen):
         self.background_window = background_window
         self.background_rects = background_rects
 
+    def close(self) -> None:
+        """Release the game window; the screen is not used afterwards."""
+        self.game_window.close()
+
+    def get_sprites(self) -> List[AnimatedSprite]:
+        """Get the sprites used by the screen."""
+        return list(self.game_window.sprites.values())
+
     def _calculate_window_rects(
         self, display_width: int, display_height: int
     ) -> Tuple[pygame.Rect, pygame.Rect, List[pygame.Rect]]:
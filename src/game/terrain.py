@@ -0,0 +1,133 @@
+import weakref
+from contextlib import suppress
+from typing import Dict, List, Optional, Set, Tuple
+
+import pygame
+
+from models.board import BoardModel, ChangeListener
+
+Slot = Tuple[int, int]  # (sign(mx), sign(my)) of a small cell in its large cell
+
+# Position of each slot in the 3x3 grid a large cell is drawn as
+SLOT_GRID = {
+    (0, 0): (1, 1),
+    (-1, 0): (0, 1),
+    (1, 0): (2, 1),
+    (0, -1): (1, 0),
+    (0, 1): (1, 2),
+}
+
+EARTH_COLOR = (139, 69, 19)  # Brown
+TUNNEL_COLOR = (24, 24, 24)  # Dark gray
+CONTENT_COLORS = {
+    BoardModel.EMPTY: TUNNEL_COLOR,
+    BoardModel.GOLD: (255, 215, 0),
+    BoardModel.RUBY: (224, 17, 95),
+    BoardModel.ROCK: EARTH_COLOR,
+    BoardModel.HOBBIN_START: TUNNEL_COLOR,
+    BoardModel.DIGGER_START: TUNNEL_COLOR,
+}
+
+
+class TerrainLayer:
+    """
+    Off-screen surface with the terrain of a board. Every large cell is drawn
+    as a 3x3 grid: the center, the four roads and earth in the corners.
+    Only cells changed through BoardModel.set_cell_content are drawn again.
+    The board refers to the layer only weakly: a layer dropped without
+    close() stops following the board when it is freed.
+    """
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        cell_size: Tuple[int, int],
+        board: Optional[BoardModel] = None,
+        background: Tuple[int, int, int] = TUNNEL_COLOR,
+    ) -> None:
+        """
+        Args:
+            size: Size of the layer in pixels.
+            cell_size: Size of a large cell in pixels.
+            board: Board to draw, None for a plain background.
+            background: Color of the area not covered by the board.
+        """
+        self.cell_width, self.cell_height = cell_size
+        self.board = board
+        self.surface = pygame.Surface(size)
+        self.surface.fill(background)
+        self._pending: Set[Tuple[Tuple[int, int], Slot]] = set()
+        self._slot_rects = self._make_slot_rects()
+        self._listener: Optional[ChangeListener] = None
+
+        if board is not None:
+            board_rect = pygame.Rect(
+                0, 0, board.size[0] * self.cell_width, board.size[1] * self.cell_height
+            )
+            self.surface.fill(EARTH_COLOR, board_rect)
+            for bx in range(board.size[0]):
+                for by in range(board.size[1]):
+                    for slot in SLOT_GRID:
+                        self._draw_slot((bx, by), slot)
+            self._listener = self._follow(board)
+
+    def _follow(self, board: BoardModel) -> ChangeListener:
+        # Register a listener holding the layer through a weak reference,
+        # which unregisters itself when the layer is freed
+        def on_cell_changed(lc_coords: Tuple[int, int], slot: Slot) -> None:
+            layer = layer_ref()
+            if layer is not None:
+                layer._on_cell_changed(lc_coords, slot)
+
+        def on_freed(_: "weakref.ref[TerrainLayer]") -> None:
+            with suppress(ValueError):  # Already removed by close()
+                board.remove_change_listener(on_cell_changed)
+
+        layer_ref = weakref.ref(self, on_freed)
+        board.add_change_listener(on_cell_changed)
+        return on_cell_changed
+
+    def _make_slot_rects(self) -> Dict[Slot, pygame.Rect]:
+        # Slot rects within a large cell at (0, 0)
+        xs = [0, self.cell_width // 3, self.cell_width - self.cell_width // 3]
+        ys = [0, self.cell_height // 3, self.cell_height - self.cell_height // 3]
+        widths = [xs[1], xs[2] - xs[1], self.cell_width - xs[2]]
+        heights = [ys[1], ys[2] - ys[1], self.cell_height - ys[2]]
+        return {
+            slot: pygame.Rect(xs[gx], ys[gy], widths[gx], heights[gy])
+            for slot, (gx, gy) in SLOT_GRID.items()
+        }
+
+    def get_slot_rect(self, lc_coords: Tuple[int, int], slot: Slot) -> pygame.Rect:
+        """Get the rect of a slot of a large cell in layer coordinates."""
+        bx, by = lc_coords
+        return self._slot_rects[slot].move(bx * self.cell_width, by * self.cell_height)
+
+    def _on_cell_changed(self, lc_coords: Tuple[int, int], slot: Slot) -> None:
+        # Drawing is deferred to update(), so repeated changes are drawn once
+        self._pending.add((lc_coords, slot))
+
+    def _draw_slot(self, lc_coords: Tuple[int, int], slot: Slot) -> pygame.Rect:
+        assert self.board is not None
+        content = self.board.get_cell_content((lc_coords, slot))
+        rect = self.get_slot_rect(lc_coords, slot)
+        self.surface.fill(CONTENT_COLORS.get(content, EARTH_COLOR), rect)
+        return rect
+
+    def update(self) -> List[pygame.Rect]:
+        """
+        Draw the cells changed since the last update.
+
+        Returns:
+            The redrawn rects in layer coordinates.
+        """
+        rects = [self._draw_slot(lc, slot) for lc, slot in self._pending]
+        self._pending.clear()
+        return rects
+
+    def close(self) -> None:
+        """Stop following the board changes."""
+        if self.board is not None and self._listener is not None:
+            self.board.remove_change_listener(self._listener)
+            self._listener = None
+        self._pending.clear()
@@ -1,18 +1,38 @@
 import pygame
-from typing import Final
+from typing import Final, Optional
+
+from mainloop.profiler import FrameProfiler
+from mainloop.render import RenderBackend, SurfaceBackend
 
 
 class Environment:
     """
-    Holds global resources such as display surface and clock.
+    Holds global resources such as display surface, render backend and clock.
     Provides event ID allocator by name.
     """
 
-    def __init__(self, display: pygame.Surface) -> None:
+    def __init__(
+        self, display: pygame.Surface, backend: Optional[RenderBackend] = None
+    ) -> None:
+        """
+        Args:
+            display: Surface windows draw to.
+            backend: Backend drawing sprites and presenting the display,
+                  SurfaceBackend of the display by default.
+        """
         self.display: Final[pygame.Surface] = display
+        self.backend: Final[RenderBackend] = (
+            backend if backend is not None else SurfaceBackend(display)
+        )
         self.clock: Final[pygame.time.Clock] = pygame.time.Clock()
         self._event_ids: dict[str, int] = {}
         self._next_event_id: int = pygame.USEREVENT + 1
+        # Progress (0..1) of the time since the last fixed update step towards
+        # the next one, for interpolating the drawn state. None while every
+        # tick is a step of its own.
+        self.alpha: Optional[float] = None
+        # Times window and view ticks while set (see mainloop/profiler.py)
+        self.profiler: Optional[FrameProfiler] = None
 
     def allocate_event_id(self, name: str) -> int:
         """
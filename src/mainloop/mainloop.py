@@ -1,7 +1,16 @@
+import time
 import pygame
+from typing import Callable, List, Optional
 from mainloop.environment import Environment
+from mainloop.profiler import FrameProfiler, TimingStats
 from mainloop.screens import Screens, ExitMainLoop
 
+# Fixed update steps run at most per iteration; time beyond them is dropped
+# so that a long stall does not freeze the loop catching up
+MAX_UPDATES_PER_ITERATION = 5
+# Time before a paced tick is due that is busy-waited instead of slept (ms)
+PACING_SPIN_MARGIN = 2.0
+
 
 class MainLoop:
     def __init__(
@@ -10,13 +19,78 @@ class MainLoop:
         screens: Screens,
         frequency: int = 1000,
         use_timer: bool = False,
+        update_interval: Optional[int] = None,
+        paced: bool = False,
+        spin_margin: float = PACING_SPIN_MARGIN,
     ) -> None:
+        """
+        Args:
+            env: Environment with the display and clock.
+            screens: Screens to tick.
+            frequency: Maximal number of loop iterations per second.
+            use_timer: Tick screens on a pygame timer event instead of polling.
+            update_interval: Interval of fixed update steps in milliseconds.
+                  If given, Screens.update() runs at this rate whatever the
+                  frame rate and screens are ticked (drawn) with env.alpha
+                  set for interpolation. Otherwise env.alpha stays None.
+            paced: Sleep until the next tick or update is due or an input
+                  event arrives instead of polling at frequency. Events are
+                  collected until the next tick. Excludes use_timer.
+            spin_margin: Time before a paced tick that is busy-waited for
+                  precision, in milliseconds.
+        """
+        if paced and use_timer:
+            raise ValueError("paced and use_timer are mutually exclusive")
         self.env = env
         self.screens = screens
         self.frequency = frequency
         self.use_timer = use_timer
+        self.update_interval = update_interval
+        self.paced = paced
+        self.spin_margin = spin_margin
+        # Lateness of paced ticks ("tick") in milliseconds
+        self.jitter = FrameProfiler()
+        self._hooks: List[Callable[[], object]] = []
+        self._lag = 0  # Time not yet simulated by fixed updates (ms)
+        self._last_update: Optional[int] = None
+
+    def add_hook(self, hook: Callable[[], object]) -> None:
+        """Add a callable invoked on every loop iteration before ticking screens."""
+        self._hooks.append(hook)
+
+    def run_updates(self) -> int:
+        """
+        Run the fixed update steps due since the last call and set env.alpha
+        to the progress towards the next step.
+
+        Returns:
+            The number of steps run.
+        """
+        assert self.update_interval is not None
+        now = pygame.time.get_ticks()
+        if self._last_update is None:
+            self._last_update = now
+        self._lag += now - self._last_update
+        self._last_update = now
+
+        steps = min(self._lag // self.update_interval, MAX_UPDATES_PER_ITERATION)
+        for _ in range(steps):
+            self.screens.update()
+        self._lag -= steps * self.update_interval
+        if self._lag >= self.update_interval:
+            self._lag %= self.update_interval  # Dropped beyond the maximal steps
+        self.env.alpha = self._lag / self.update_interval
+        return steps
+
+    def get_jitter_stats(self) -> List[TimingStats]:
+        """Get the statistics of how late paced ticks ran."""
+        return self.jitter.get_stats()
 
     def run(self) -> None:
+        if self.paced:
+            self._run_paced()
+            return
+
         if self.use_timer:
             event_id = self.env.allocate_event_id("tick")
             pygame.time.set_timer(event_id, self.screens.get_interval())
@@ -30,6 +104,12 @@ class MainLoop:
                     if event.type == pygame.QUIT:
                         raise ExitMainLoop()  # pragma: no cover
 
+                for hook in self._hooks:
+                    hook()
+
+                if self.update_interval is not None:
+                    self.run_updates()
+
                 if self.use_timer:
                     self.screens.tick(events)
                 else:
@@ -41,3 +121,65 @@ class MainLoop:
                 self.env.clock.tick(self.frequency)
         except ExitMainLoop:
             pass
+
+    @staticmethod
+    def _now() -> float:
+        return time.perf_counter() * 1000
+
+    def _next_update_due(self, now: float) -> float:
+        assert self.update_interval is not None
+        if self._last_update is None:
+            return now
+        elapsed = pygame.time.get_ticks() - self._last_update
+        return now + max(self.update_interval - self._lag - elapsed, 0)
+
+    def _wait(self, deadline: float) -> List[pygame.event.Event]:
+        """
+        Sleep until the deadline or the first input event, whichever comes
+        first. The last spin_margin milliseconds are busy-waited.
+
+        Returns:
+            The events received.
+        """
+        timeout = int(deadline - self._now() - self.spin_margin)
+        if timeout >= 1:  # A zero timeout would wait forever
+            event = pygame.event.wait(timeout)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
+            if events:
+                return events
+        while self._now() < deadline:
+            time.sleep(0)  # Yield while spinning
+        return pygame.event.get()
+
+    def _run_paced(self) -> None:
+        next_tick = self._now()
+        pending: List[pygame.event.Event] = []
+        try:
+            while True:
+                deadline = next_tick
+                if self.update_interval is not None:
+                    deadline = min(deadline, self._next_update_due(self._now()))
+                events = self._wait(deadline)
+                for event in events:
+                    if event.type == pygame.QUIT:
+                        raise ExitMainLoop()  # pragma: no cover
+                pending.extend(events)
+
+                for hook in self._hooks:
+                    hook()
+
+                if self.update_interval is not None:
+                    self.run_updates()
+
+                now = self._now()
+                if now >= next_tick:
+                    self.jitter.record("tick", now - next_tick)
+                    self.screens.tick(pending)
+                    pending = []
+                    interval = self.screens.get_interval()
+                    next_tick += interval
+                    if next_tick <= now:
+                        next_tick = now + interval  # Too late to catch up
+        except ExitMainLoop:
+            pass
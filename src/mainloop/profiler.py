@@ -0,0 +1,83 @@
+"""
+Frame-time profiler of windows and views.
+
+While Environment.profiler is set, Screen.tick times every Window.tick and
+Window.tick_views times every View.tick. Without a profiler nothing is timed.
+"""
+
+import time
+import weakref
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple
+
+# Number of most recent samples the statistics are computed from
+PROFILER_WINDOW = 120
+
+
+class TimingStats(NamedTuple):
+    name: str
+    mean_ms: float
+    max_ms: float
+
+
+class FrameProfiler:
+    """Rolling statistics of tick times by name."""
+
+    def __init__(self, window: int = PROFILER_WINDOW) -> None:
+        """
+        Args:
+            window: Number of most recent samples kept per name.
+        """
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._labels: "weakref.WeakKeyDictionary[object, str]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._label_counts: Dict[str, int] = {}
+
+    def label(self, obj: object, kind: str) -> str:
+        """
+        Get a stable name of an object, kind followed by a number counting the
+        objects of the kind (e.g. "hobbin#2"). The samples of the name are
+        dropped when the object is garbage collected.
+        """
+        label = self._labels.get(obj)
+        if label is None:
+            count = self._label_counts.get(kind, 0) + 1
+            self._label_counts[kind] = count
+            label = f"{kind}#{count}"
+            self._labels[obj] = label
+            weakref.finalize(obj, self._samples.pop, label, None)
+        return label
+
+    def record(self, name: str, ms: float) -> None:
+        """Add a sample of name in milliseconds."""
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.window)
+        samples.append(ms)
+
+    def timer(self) -> float:
+        """Get the current time for measuring with elapsed()."""
+        return time.perf_counter()
+
+    def elapsed(self, name: str, start: float) -> None:
+        """Record the time since start (from timer()) as a sample of name."""
+        self.record(name, (time.perf_counter() - start) * 1000)
+
+    def get_stats(self) -> List[TimingStats]:
+        """Get the statistics of all names, highest mean time first."""
+        stats = [
+            TimingStats(name, sum(samples) / len(samples), max(samples))
+            for name, samples in self._samples.items()
+        ]
+        stats.sort(key=lambda s: s.mean_ms, reverse=True)
+        return stats
+
+    def get_top(self, count: int) -> List[TimingStats]:
+        """Get the statistics of the count names with the highest mean time."""
+        return self.get_stats()[:count]
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self._samples.clear()
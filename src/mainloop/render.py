@@ -0,0 +1,65 @@
+"""
+Render backends: how sprite images reach the screen.
+
+Windows and most views draw into env.display, a software surface. Sprite
+images queued by batching windows (Window.queue_blit) and the presenting of
+the changed display regions go through env.backend:
+
+- SurfaceBackend blits the images into the display surface and updates the
+  pygame display (the default).
+- TextureBackend (mainloop/render_sdl2.py) draws into an SDL2 renderer
+  window. It lives in its own module, so the software path works without
+  pygame._sdl2.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import pygame
+
+Blit = Tuple[pygame.Surface, Tuple[int, int]]  # (image, top-left position)
+
+
+class RenderBackend:
+    """Base class of render backends."""
+
+    def draw_many(
+        self, blits: Sequence[Blit], clip: Optional[pygame.Rect] = None
+    ) -> List[pygame.Rect]:
+        """
+        Draw images over the display in order, only within clip if given.
+
+        Returns:
+            The covered display areas.
+        """
+        raise NotImplementedError("draw_many must be implemented by backends")
+
+    def present(self, rects: List[pygame.Rect], full: bool) -> None:
+        """
+        Show the frame. Only the given display regions changed since the last
+        frame, unless full is set.
+        """
+        raise NotImplementedError("present must be implemented by backends")
+
+
+class SurfaceBackend(RenderBackend):
+    """Software drawing into the display surface."""
+
+    def __init__(self, display: pygame.Surface) -> None:
+        self.display = display
+
+    def draw_many(
+        self, blits: Sequence[Blit], clip: Optional[pygame.Rect] = None
+    ) -> List[pygame.Rect]:
+        previous_clip = self.display.get_clip()
+        if clip is not None:
+            self.display.set_clip(clip)
+        try:
+            return self.display.blits(blits) or []
+        finally:
+            self.display.set_clip(previous_clip)
+
+    def present(self, rects: List[pygame.Rect], full: bool) -> None:
+        if full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
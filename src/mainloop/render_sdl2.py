@@ -0,0 +1,78 @@
+"""
+SDL2 texture render backend.
+
+The display surface is uploaded into a streaming texture (only the changed
+regions), sprite images are uploaded as textures once and drawn on top of it
+with Texture.draw. Import this module only when drawing with textures: it
+needs pygame._sdl2.
+"""
+
+import weakref
+from typing import List, Optional, Sequence, Tuple
+
+import pygame
+from pygame._sdl2.video import Renderer, Texture
+
+from mainloop.render import Blit, RenderBackend
+
+
+class TextureBackend(RenderBackend):
+    """
+    Drawing with an SDL2 renderer. Sprite images are uploaded as textures the
+    first time they are drawn and kept while the images exist.
+    """
+
+    def __init__(self, renderer: Renderer, display: pygame.Surface) -> None:
+        """
+        Args:
+            renderer: Renderer of the window to draw to.
+            display: Software surface windows draw to, of the window size.
+        """
+        self.renderer = renderer
+        self.display = display
+        self._canvas = Texture(renderer, display.get_size(), streaming=True)
+        self._canvas_uploaded = False
+        self._textures: "weakref.WeakKeyDictionary[pygame.Surface, Texture]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # (texture, visible area of the texture, display area)
+        self._sprites: List[Tuple[Texture, pygame.Rect, pygame.Rect]] = []
+
+    def get_texture(self, image: pygame.Surface) -> Texture:
+        """Get the texture of an image, uploading it on first use."""
+        texture = self._textures.get(image)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, image)
+            self._textures[image] = texture
+        return texture
+
+    def draw_many(
+        self, blits: Sequence[Blit], clip: Optional[pygame.Rect] = None
+    ) -> List[pygame.Rect]:
+        # Drawn over the display texture on present
+        if clip is None:
+            clip = self.display.get_rect()
+        rects = []
+        for image, dest in blits:
+            rect = pygame.Rect(dest, image.get_size())
+            visible = rect.clip(clip)
+            if not visible:
+                continue
+            area = visible.move(-rect.left, -rect.top)
+            self._sprites.append((self.get_texture(image), area, visible))
+            rects.append(visible)
+        return rects
+
+    def present(self, rects: List[pygame.Rect], full: bool) -> None:
+        if full or not self._canvas_uploaded:
+            self._canvas.update(self.display)
+            self._canvas_uploaded = True
+        else:
+            for rect in rects:
+                self._canvas.update(self.display.subsurface(rect), rect)
+        self.renderer.clear()
+        self._canvas.draw()
+        for texture, area, rect in self._sprites:
+            texture.draw(srcrect=area, dstrect=rect)
+        self._sprites.clear()
+        self.renderer.present()
@@ -2,6 +2,10 @@ from typing import Dict, Optional, Tuple, List
 import pygame
 import weakref
 from mainloop.environment import Environment
+from mainloop.view_index import SpatialGrid, ViewRegistry
+
+# Fraction of the display area above which a full flip replaces a rect update
+FULL_FLIP_AREA_RATIO = 0.5
 
 
 class ExitMainLoop(Exception):
@@ -10,6 +14,25 @@ class ExitMainLoop(Exception):
     pass
 
 
+def merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """
+    Merge overlapping rects into their unions until no two rects overlap.
+    Empty rects are dropped.
+    """
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        rect = rect.copy()
+        # A grown union may overlap rects merged before, so check them again
+        index = rect.collidelist(merged)
+        while index >= 0:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
 class View:
     """
     Base class for a visual representation of an object.
@@ -28,6 +51,21 @@ class View:
         """Update view state. Must be implemented by subclasses."""
         raise NotImplementedError("tick must be implemented by View subclasses")
 
+    def get_bounds(self) -> Optional[pygame.Rect]:
+        """
+        Get the area the view draws to in window-local coordinates, for the
+        spatial index of the window. None (the default) keeps the view out of
+        the index.
+        """
+        return None
+
+    def update(self) -> None:
+        """
+        Advance the view state by one fixed step. Only called when the main loop
+        runs fixed updates; tick() then draws the state interpolated by
+        env.alpha. Does nothing by default.
+        """
+
     def set_window(self, window: Optional["Window"]) -> None:
         """
         Associate this view with a window using weak reference.
@@ -49,14 +87,31 @@ class Window:
     """
     Base class for a window within a screen.
     Receives Environment in constructor and sets its rect to full display size.
-    Manages a list of Views with priority.
+    Manages Views with priority, optionally indexed by their bounds in a
+    SpatialGrid (see enable_spatial_index()).
     Subclasses must implement tick().
+
+    Windows with tracks_dirty_rects report every display region they change
+    with mark_dirty() and redraw everything only while invalid (see
+    is_valid()). Other windows are presented as a whole on every tick.
+
+    Views of windows with batches_blits queue their images with queue_blit()
+    instead of blitting them; tick_views() draws the queue with a single
+    Surface.blits call. Views are drawn clipped to the window rect and should
+    skip drawing when is_visible() is false for their bounds.
     """
 
+    tracks_dirty_rects: bool = False
+    batches_blits: bool = False
+
     def __init__(self, env: Environment) -> None:
         self.env = env
         self._rect: pygame.Rect = self.env.display.get_rect()
-        self._views: List[Tuple[int, View]] = []  # (priority, view) list
+        self._views: ViewRegistry[View] = ViewRegistry()
+        self._grid: Optional[SpatialGrid[View]] = None
+        self._dirty_rects: List[pygame.Rect] = []
+        self._valid = False  # Nothing has been drawn yet
+        self._draw_list: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
 
     def tick(self, events: list[pygame.event.Event]) -> None:
         raise NotImplementedError("tick must be implemented by Window subclasses")
@@ -66,24 +121,141 @@ class Window:
         Add a view to this window with given priority.
         Lower priority values are rendered last (on top).
         """
-        self._views.append((priority, view))
-        self._views.sort(key=lambda pair: pair[0])  # 0 = highest priority
+        self._views.add(priority, view)
         view.set_window(self)
+        self.update_view_bounds(view)
 
     def remove_view(self, view: View) -> None:
         """Remove a view from this window."""
-        self._views = [(p, v) for p, v in self._views if v is not view]
+        self._views.remove(view)
+        if self._grid is not None:
+            self._grid.remove(view)
         view.set_window(None)
 
     def get_views(self) -> List[Tuple[int, View]]:
         """Get a copy of the views list with their priorities."""
-        return self._views.copy()
+        return list(self._views)
+
+    def enable_spatial_index(self, cell_size: Tuple[int, int]) -> None:
+        """Index the bounds of the views in a grid of the given cell size."""
+        self._grid = SpatialGrid(cell_size)
+        for _, view in self._views:
+            self.update_view_bounds(view)
+
+    def update_view_bounds(self, view: View) -> None:
+        """Store the current bounds of a view in the spatial index, if any."""
+        if self._grid is None or view not in self._views:
+            return
+        bounds = view.get_bounds()
+        if bounds is None:
+            self._grid.remove(view)
+        else:
+            self._grid.update(view, bounds)
+
+    def get_views_in(self, rect: pygame.Rect) -> List[View]:
+        """
+        Get the indexed views whose bounds intersect a rect (window-local
+        coordinates), in priority order.
+        """
+        if self._grid is None:
+            raise RuntimeError("Spatial index not enabled")
+        return sorted(self._grid.query(rect), key=self._views.sort_key)
+
+    def get_views_at(self, point: Tuple[int, int]) -> List[View]:
+        """Get the indexed views at a window-local point, topmost first."""
+        if self._grid is None:
+            raise RuntimeError("Spatial index not enabled")
+        found = self._grid.at_point(point)
+        return sorted(found, key=self._views.sort_key, reverse=True)
+
+    def tick_views(self) -> List[pygame.Rect]:
+        """
+        Tick all views in priority order and draw the queued blits, clipped to
+        the window rect.
+
+        Returns:
+            The rects marked dirty by the views.
+        """
+        start = len(self._dirty_rects)
+        display = self.env.display
+        previous_clip = display.get_clip()
+        display.set_clip(self._rect)
+        # Views may add or remove views while ticking: tick the views present
+        # at the start, except those removed meanwhile
+        views = [view for _, view in self._views]
+        registry = self._views
+        try:
+            profiler = self.env.profiler
+            if profiler is None:
+                for view in views:
+                    if view in registry:
+                        view.tick()
+            else:
+                for view in views:
+                    if view not in registry:
+                        continue
+                    began = profiler.timer()
+                    view.tick()
+                    profiler.elapsed(profiler.label(view, view.view_type), began)
+            self.flush_blits()
+        finally:
+            display.set_clip(previous_clip)
+        return self._dirty_rects[start:]
+
+    def is_visible(self, bounds: pygame.Rect) -> bool:
+        """Check whether screen-coordinate bounds intersect the window rect."""
+        return bool(self._rect.colliderect(bounds))
+
+    def update(self) -> None:
+        """Advance the window by one fixed step. Updates all views by default."""
+        for _, view in list(self._views):
+            if view in self._views:
+                view.update()
+
+    def queue_blit(self, image: pygame.Surface, dest: Tuple[int, int]) -> None:
+        """Queue an image to be drawn at dest (screen coordinates)."""
+        self._draw_list.append((image, dest))
+
+    def flush_blits(self) -> None:
+        """Draw the queued images in queue order and mark their areas dirty."""
+        if not self._draw_list:
+            return
+        self._dirty_rects.extend(
+            self.env.backend.draw_many(self._draw_list, self._rect)
+        )
+        self._draw_list = []
+
+    def mark_dirty(self, rect: Optional[pygame.Rect] = None) -> None:
+        """
+        Report a changed display region in screen coordinates.
+        Without a rect the whole window is reported.
+        """
+        self._dirty_rects.append(self._rect.copy() if rect is None else rect)
+
+    def take_dirty_rects(self) -> List[pygame.Rect]:
+        """Get the reported regions and start collecting new ones."""
+        rects = self._dirty_rects
+        self._dirty_rects = []
+        return rects
+
+    def invalidate(self) -> None:
+        """Request a full redraw of the window on its next tick."""
+        self._valid = False
+
+    def is_valid(self) -> bool:
+        """Check whether the drawn content is still on the display."""
+        return self._valid
+
+    def validate(self) -> None:
+        """Mark the window as fully drawn."""
+        self._valid = True
 
     def get_rect(self) -> pygame.Rect:
         return self._rect
 
     def set_rect(self, rect: pygame.Rect) -> None:
         self._rect = rect
+        self.invalidate()
 
     def to_screen_coords(self, local: Tuple[int, int]) -> Tuple[int, int]:
         return (self._rect.left + local[0], self._rect.top + local[1])
@@ -92,22 +264,116 @@ class Window:
         return (screen[0] - self._rect.left, screen[1] - self._rect.top)
 
 
+class ScaledWindow(Window):
+    """
+    Window showing an inner window which draws into an off-screen surface of
+    its own environment (e.g. at a low logical resolution). When the inner
+    window changed anything, the whole surface is scaled to the window rect
+    once per tick.
+    """
+
+    tracks_dirty_rects = True
+
+    def __init__(self, env: Environment, rect: pygame.Rect, inner: Window) -> None:
+        """
+        Args:
+            env: Environment of the display.
+            rect: Area of the display to scale the inner surface to.
+            inner: Window drawing into inner.env.display.
+        """
+        super().__init__(env)
+        self.inner = inner
+        self.set_rect(rect)
+
+    def _share_state(self) -> None:
+        # Interpolation and profiling are set up on the display environment
+        self.inner.env.alpha = self.env.alpha
+        self.inner.env.profiler = self.env.profiler
+
+    def tick(self, events: list[pygame.event.Event]) -> None:
+        self._share_state()
+        self.inner.tick(events)
+        changed = not self.inner.tracks_dirty_rects or bool(
+            self.inner.take_dirty_rects()
+        )
+        if not changed and self.is_valid():
+            return
+        pygame.transform.scale(
+            self.inner.env.display,
+            self._rect.size,
+            self.env.display.subsurface(self._rect),
+        )
+        self.mark_dirty()
+        self.validate()
+
+    def update(self) -> None:
+        self._share_state()
+        self.inner.update()
+
+    def invalidate(self) -> None:
+        super().invalidate()
+        self.inner.invalidate()
+
+
 class Screen:
     """
     Base class for a game screen.
     Receives Environment in constructor.
     Manages a list of windows with priority.
+    Only the display regions changed by the windows are presented, unless
+    they cover more than full_flip_ratio of the display.
     """
 
+    full_flip_ratio: float = FULL_FLIP_AREA_RATIO
+
     def __init__(self, env: Environment, interval: int) -> None:
         self.env = env
         self.interval = interval
         self._windows: List[Tuple[int, Window]] = []
 
     def tick(self, events: list[pygame.event.Event]) -> None:
+        profiler = self.env.profiler
+        if profiler is None:
+            for _, window in self._windows:
+                window.tick(events)
+        else:
+            for _, window in self._windows:
+                began = profiler.timer()
+                window.tick(events)
+                profiler.elapsed(profiler.label(window, type(window).__name__), began)
+        self.present(self.collect_dirty_rects())
+
+    def update(self) -> None:
+        """Advance all windows by one fixed step."""
         for _, window in self._windows:
-            window.tick(events)
-        pygame.display.flip()
+            window.update()
+
+    def collect_dirty_rects(self) -> List[pygame.Rect]:
+        """
+        Collect the changed regions of all windows, merged and clipped to the
+        display. Windows not tracking dirty rects contribute their whole rect.
+        """
+        rects = []
+        for _, window in self._windows:
+            if window.tracks_dirty_rects:
+                rects.extend(window.take_dirty_rects())
+            else:
+                rects.append(window.get_rect())
+        display_rect = self.env.display.get_rect()
+        return merge_rects([rect.clip(display_rect) for rect in rects])
+
+    def present(self, rects: List[pygame.Rect]) -> None:
+        """Present the given display regions, or all if they are large."""
+        if not rects:
+            return
+        area = sum(rect.width * rect.height for rect in rects)
+        display_area = self.env.display.get_width() * self.env.display.get_height()
+        self.env.backend.present(rects, area > display_area * self.full_flip_ratio)
+
+    def invalidate(self) -> None:
+        """Request a full redraw of all windows, e.g. when the screen is shown."""
+        for _, window in self._windows:
+            window.invalidate()
 
     def add_window(self, priority: int, window: Window) -> None:
         self._windows.append((priority, window))
@@ -162,6 +428,8 @@ class Screens:
         if name not in self._screens:
             raise ValueError(f"Screen '{name}' not found")
         self._active_screen_name = name
+        # The display holds the content of the previous screen
+        self._screens[name].invalidate()
 
     def get_active_screen_name(self) -> Optional[str]:
         return self._active_screen_name
@@ -177,6 +445,12 @@ class Screens:
         screen = self._screens[self._active_screen_name]
         screen.tick(events)
 
+    def update(self) -> None:
+        """Advance the active screen by one fixed step."""
+        if self._active_screen_name is None:
+            raise RuntimeError("No active screen set")
+        self._screens[self._active_screen_name].update()
+
     def get_interval(self) -> int:
         if self._active_screen_name is None:
             raise RuntimeError("No active screen set")
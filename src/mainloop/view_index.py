@@ -0,0 +1,193 @@
+# REGISTER_DOCTEST
+"""
+Indexes of the views of a window.
+
+ViewRegistry keeps the views in priority order with cheap insert and remove.
+SpatialGrid is a uniform grid (aligned to board cells) of view bounds for
+culling, picking and neighbour queries.
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, Generic, Iterator, List, Set, Tuple, TypeVar
+
+import pygame
+
+T = TypeVar("T")
+Cell = Tuple[int, int]  # (column, row) of the grid
+
+
+class ViewRegistry(Generic[T]):
+    """
+    Views in ascending priority value order, and in insertion order within a
+    priority. Views are kept in a bucket per priority; the sorted priorities
+    are searched with bisect, so adding and removing views costs O(log P) for
+    P distinct priorities and iteration yields (priority, view) pairs.
+
+    Examples:
+        >>> registry = ViewRegistry()
+        >>> registry.add(5, "a")
+        >>> registry.add(0, "b")
+        >>> registry.add(5, "c")
+        >>> list(registry)
+        [(0, 'b'), (5, 'a'), (5, 'c')]
+        >>> registry.remove("a")
+        True
+        >>> list(registry), len(registry), "c" in registry
+        ([(0, 'b'), (5, 'c')], 2, True)
+    """
+
+    def __init__(self) -> None:
+        self._priorities: List[int] = []  # Sorted priorities of the buckets
+        # Insertion-ordered views of each priority (dict as an ordered set)
+        self._buckets: Dict[int, Dict[T, None]] = {}
+        # (priority, insertion number) of every view, its iteration order
+        self._keys: Dict[T, Tuple[int, int]] = {}
+        self._added = 0
+
+    def add(self, priority: int, view: T) -> None:
+        """Add a view; a view added again moves to the given priority."""
+        if view in self._keys:
+            self.remove(view)
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = {}
+            insort(self._priorities, priority)
+        bucket[view] = None
+        self._keys[view] = (priority, self._added)
+        self._added += 1
+
+    def remove(self, view: T) -> bool:
+        """
+        Remove a view.
+
+        Returns:
+            False if the view was not registered.
+        """
+        key = self._keys.pop(view, None)
+        if key is None:
+            return False
+        priority = key[0]
+        bucket = self._buckets[priority]
+        del bucket[view]
+        if not bucket:
+            del self._buckets[priority]
+            del self._priorities[bisect_left(self._priorities, priority)]
+        return True
+
+    def get_priority(self, view: T) -> int:
+        """Get the priority of a registered view."""
+        return self._keys[view][0]
+
+    def sort_key(self, view: T) -> Tuple[int, int]:
+        """Get a key ordering registered views like iteration does."""
+        return self._keys[view]
+
+    def __iter__(self) -> Iterator[Tuple[int, T]]:
+        for priority in self._priorities:
+            for view in self._buckets[priority]:
+                yield priority, view
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, view: object) -> bool:
+        return view in self._keys
+
+
+class SpatialGrid(Generic[T]):
+    """
+    Uniform grid of view bounds. Every view is stored in all cells its bounds
+    overlap, so moving a view touches only the cells it enters or leaves and
+    queries look only at the cells of the query area.
+
+    Examples:
+        >>> grid = SpatialGrid((10, 10))
+        >>> grid.update("a", pygame.Rect(5, 5, 10, 10))
+        >>> grid.update("b", pygame.Rect(30, 0, 5, 5))
+        >>> grid.cells_of(pygame.Rect(5, 5, 10, 10))
+        [(0, 0), (0, 1), (1, 0), (1, 1)]
+        >>> sorted(grid.query(pygame.Rect(0, 0, 20, 20)))
+        ['a']
+        >>> grid.at_point((32, 2))
+        ['b']
+        >>> sorted(grid.neighbours("a", radius=2))
+        ['b']
+    """
+
+    def __init__(self, cell_size: Tuple[int, int]) -> None:
+        """
+        Args:
+            cell_size: Size of a grid cell, e.g. of a board cell in pixels.
+        """
+        self.cell_width, self.cell_height = cell_size
+        self._cells: Dict[Cell, Set[T]] = {}
+        self._bounds: Dict[T, pygame.Rect] = {}
+        self._cells_of: Dict[T, List[Cell]] = {}
+
+    def cells_of(self, rect: pygame.Rect) -> List[Cell]:
+        """Get the cells overlapped by a non-empty rect."""
+        left, top = rect.left // self.cell_width, rect.top // self.cell_height
+        right = (rect.right - 1) // self.cell_width
+        bottom = (rect.bottom - 1) // self.cell_height
+        return [
+            (cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1)
+        ]
+
+    def update(self, view: T, bounds: pygame.Rect) -> None:
+        """Add a view or move it to new bounds."""
+        cells = self.cells_of(bounds) if bounds.width and bounds.height else []
+        old_cells = self._cells_of.get(view, [])
+        if cells != old_cells:
+            for cell in old_cells:
+                self._discard(cell, view)
+            for cell in cells:
+                self._cells.setdefault(cell, set()).add(view)
+            self._cells_of[view] = cells
+        self._bounds[view] = bounds.copy()
+
+    def remove(self, view: T) -> None:
+        """Remove a view if present."""
+        for cell in self._cells_of.pop(view, []):
+            self._discard(cell, view)
+        self._bounds.pop(view, None)
+
+    def _discard(self, cell: Cell, view: T) -> None:
+        views = self._cells[cell]
+        views.discard(view)
+        if not views:
+            del self._cells[cell]
+
+    def get_bounds(self, view: T) -> pygame.Rect:
+        """Get the bounds a view was stored with."""
+        return self._bounds[view]
+
+    def query(self, rect: pygame.Rect) -> Set[T]:
+        """Get the views whose bounds intersect a rect."""
+        if not (rect.width and rect.height):
+            return set()
+        found: Set[T] = set()
+        for cell in self.cells_of(rect):
+            for view in self._cells.get(cell, ()):
+                if view not in found and self._bounds[view].colliderect(rect):
+                    found.add(view)
+        return found
+
+    def at_point(self, point: Tuple[int, int]) -> List[T]:
+        """Get the views whose bounds contain a point (for picking)."""
+        cell = (point[0] // self.cell_width, point[1] // self.cell_height)
+        return [
+            view
+            for view in self._cells.get(cell, ())
+            if self._bounds[view].collidepoint(point)
+        ]
+
+    def neighbours(self, view: T, radius: int = 1) -> Set[T]:
+        """Get the other views within radius cells around the cells of a view."""
+        bounds = self._bounds[view]
+        area = bounds.inflate(
+            2 * radius * self.cell_width, 2 * radius * self.cell_height
+        )
+        return self.query(area) - {view}
+
+    def __len__(self) -> int:
+        return len(self._bounds)
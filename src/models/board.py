@@ -1,4 +1,17 @@
-from typing import Tuple, List, Dict, Optional
+from array import array
+from typing import Callable, Tuple, List, Dict, Optional
+
+# Called with the LC coordinates and the slot (sign(mx), sign(my)) of a changed cell
+ChangeListener = Callable[[Tuple[int, int], Tuple[int, int]], None]
+
+# Stored slots of a large cell in storage order: center, up, down, left, right
+SLOTS: Tuple[Tuple[int, int], ...] = ((0, 0), (0, -1), (0, 1), (-1, 0), (1, 0))
+SLOTS_PER_CELL = len(SLOTS)
+_SLOT_INDEX: Dict[Tuple[int, int], int] = {slot: i for i, slot in enumerate(SLOTS)}
+
+# Directions of step() in the order of the columns of BoardModel.step_table
+DIRECTIONS = "ulrd"
+DIRECTION_INDEX: Dict[str, int] = {d: i for i, d in enumerate(DIRECTIONS)}
 
 
 def sign(x: int) -> int:
@@ -38,19 +51,41 @@ class BoardModel:
         if cell_size % 2 == 0:
             raise ValueError("Cell size must be an odd number.")
 
-        # Initialize the field
-        self.field = self._initialize_field()
+        # Contents of all slots: SLOTS_PER_CELL bytes per large cell in SLOTS
+        # order, large cells row by row (see cell_offset)
+        self.cells = self._initialize_cells()
+        # Replaced rather than changed, so listeners may unregister while notified
+        self._listeners: Tuple[ChangeListener, ...] = ()
+
+        # Small cells as ints (see sc_to_id): the center and four arms of
+        # half_cell_size small cells per large cell
+        self.sc_per_cell = 1 + 4 * self.half_cell_size
+        self.sc_count = self.size[0] * self.size[1] * self.sc_per_cell
+        # Index into cells of the slot of each small cell id
+        self.content_index = array(
+            "i", (self._content_index_of(i) for i in range(self.sc_count))
+        )
+        # Id reached by step() from each id in each of DIRECTIONS, -1 if none
+        self.step_table = self._build_step_table()
+
+    def _initialize_cells(self) -> bytearray:
+        # Method to initialize the slot contents
+        cells = bytearray(self.size[0] * self.size[1] * SLOTS_PER_CELL)
+        for bx in range(self.size[0]):
+            for by in range(self.size[1]):
+                offset = self.cell_offset((bx, by))
+                cells[offset : offset + SLOTS_PER_CELL] = self._get_content_from_data(
+                    bx, by
+                )
+        return cells
 
-    def _initialize_field(self) -> List[List[Dict[Tuple[int, int], int]]]:
-        # Method to initialize the field
-        field = []
-        for i in range(self.size[0]):
-            row = []
-            for j in range(self.size[1]):
-                cell_map = self._get_content_from_data(i, j)
-                row.append(cell_map)
-            field.append(row)
-        return field
+    def cell_offset(self, lc_coords: Tuple[int, int]) -> int:
+        # Index of the first slot of a large cell in cells, IndexError for
+        # a large cell off the board
+        bx, by = lc_coords
+        if not (0 <= bx < self.size[0] and 0 <= by < self.size[1]):
+            raise IndexError(f"Large cell off the board: {lc_coords}")
+        return (by * self.size[0] + bx) * SLOTS_PER_CELL
 
     _decode_bc = {
         "G": GOLD,
@@ -65,15 +100,76 @@ class BoardModel:
         " ": EMPTY,
     }
 
-    def _get_content_from_data(self, bx: int, by: int) -> Dict[Tuple[int, int], int]:
-        # Method to get content from data
-        return {
-            (0, 0): self._decode_bc[self.data[3 * by + 1][4 * bx + 1]],
-            (0, 1): self._decode_sc[self.data[3 * by + 2][4 * bx + 1]],
-            (0, -1): self._decode_sc[self.data[3 * by][4 * bx + 1]],
-            (1, 0): self._decode_sc[self.data[3 * by + 1][4 * bx + 2]],
-            (-1, 0): self._decode_sc[self.data[3 * by + 1][4 * bx]],
-        }
+    def _get_content_from_data(self, bx: int, by: int) -> bytes:
+        # Method to get the slot contents of a large cell (in SLOTS order)
+        return bytes(
+            (
+                self._decode_bc[self.data[3 * by + 1][4 * bx + 1]],
+                self._decode_sc[self.data[3 * by][4 * bx + 1]],
+                self._decode_sc[self.data[3 * by + 2][4 * bx + 1]],
+                self._decode_sc[self.data[3 * by + 1][4 * bx]],
+                self._decode_sc[self.data[3 * by + 1][4 * bx + 2]],
+            )
+        )
+
+    def sc_to_id(self, coords: Tuple[Tuple[int, int], Tuple[int, int]]) -> int:
+        # Encode SC coordinates as an int in range(sc_count)
+        (bx, by), (mx, my) = coords
+        lc_id = self.cell_offset((bx, by)) // SLOTS_PER_CELL * self.sc_per_cell
+        if mx == 0 and my == 0:
+            return lc_id
+        slot_index = _SLOT_INDEX[(sign(mx), sign(my))]
+        distance = abs(mx) + abs(my)
+        return lc_id + 1 + (slot_index - 1) * self.half_cell_size + distance - 1
+
+    def id_to_sc(self, sc_id: int) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        # Decode SC coordinates encoded by sc_to_id
+        lc_index, local = divmod(sc_id, self.sc_per_cell)
+        by, bx = divmod(lc_index, self.size[0])
+        if local == 0:
+            return (bx, by), (0, 0)
+        arm, distance = divmod(local - 1, self.half_cell_size)
+        dx, dy = SLOTS[arm + 1]
+        return (bx, by), (dx * (distance + 1), dy * (distance + 1))
+
+    def _content_index_of(self, sc_id: int) -> int:
+        lc_index, local = divmod(sc_id, self.sc_per_cell)
+        slot_index = 0 if local == 0 else 1 + (local - 1) // self.half_cell_size
+        return lc_index * SLOTS_PER_CELL + slot_index
+
+    def _build_step_table(self) -> "array[int]":
+        # Row of len(DIRECTIONS) entries per small cell id
+        table = array("i", [-1]) * (self.sc_count * len(DIRECTIONS))
+        for sc_id in range(self.sc_count):
+            coords = self.id_to_sc(sc_id)
+            (bx, by), (mx, my) = coords
+            if (
+                (bx == 0 and mx < 0)
+                or (by == 0 and my < 0)
+                or (bx == self.size[0] - 1 and mx > 0)
+                or (by == self.size[1] - 1 and my > 0)
+            ):
+                continue  # Road leading off the board
+            for direction_index, direction in enumerate(DIRECTIONS):
+                new_coords = self.step(coords, direction)
+                if new_coords is not None:
+                    table[sc_id * len(DIRECTIONS) + direction_index] = self.sc_to_id(
+                        new_coords
+                    )
+        return table
+
+    def step_id(self, sc_id: int, direction_index: int) -> int:
+        # Make one step from a small cell id in DIRECTIONS[direction_index],
+        # the id version of step(); -1 if the step is not possible
+        if not (0 <= sc_id < self.sc_count and 0 <= direction_index < len(DIRECTIONS)):
+            raise IndexError(f"No step {direction_index} from small cell {sc_id}")
+        return self.step_table[sc_id * len(DIRECTIONS) + direction_index]
+
+    def get_cell_content_id(self, sc_id: int) -> int:
+        # Get the content of the small cell with the given id
+        if not 0 <= sc_id < self.sc_count:
+            raise IndexError(f"Small cell id off the board: {sc_id}")
+        return self.cells[self.content_index[sc_id]]
 
     def is_center(self, coords: Tuple[Tuple[int, int], Tuple[int, int]]) -> bool:
         # Check if SC is the center of LC
@@ -125,14 +221,45 @@ class BoardModel:
     def get_cell_content(self, coords: Tuple[Tuple[int, int], Tuple[int, int]]) -> int:
         # Get the content of the cell at the given SC coordinates
         (bx, by), (mx, my) = coords
-        return self.field[bx][by].get((sign(mx), sign(my)), self.EMPTY)
+        offset = self.cell_offset((bx, by))
+        slot_index = _SLOT_INDEX.get((sign(mx), sign(my)))
+        if slot_index is None:
+            return self.EMPTY  # Off the roads
+        return self.cells[offset + slot_index]
 
     def set_cell_content(
         self, coords: Tuple[Tuple[int, int], Tuple[int, int]], content: int
     ) -> None:
         # Set the required content in the cell at the given SC coordinates
+        # and notify the listeners if it has changed
         (bx, by), (mx, my) = coords
-        self.field[bx][by][(sign(mx), sign(my))] = content
+        offset = self.cell_offset((bx, by))
+        slot = (sign(mx), sign(my))
+        slot_index = _SLOT_INDEX.get(slot)
+        if slot_index is None:
+            raise ValueError(f"Not a small cell of a road: {coords}")
+        index = offset + slot_index
+        if self.cells[index] == content:
+            return
+        self.cells[index] = content
+        self.notify_cell_changed((bx, by), slot)
+
+    def notify_cell_changed(
+        self, lc_coords: Tuple[int, int], slot: Tuple[int, int]
+    ) -> None:
+        # Call the listeners about a slot changed directly in cells
+        for listener in self._listeners:
+            listener(lc_coords, slot)
+
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        # Register a callable notified about every changed cell
+        self._listeners += (listener,)
+
+    def remove_change_listener(self, listener: ChangeListener) -> None:
+        # Unregister a callable added by add_change_listener
+        listeners = list(self._listeners)
+        listeners.remove(listener)
+        self._listeners = tuple(listeners)
 
     def lc_to_sc_center(
         self, lc_coords: Tuple[int, int]
@@ -0,0 +1,131 @@
+# REGISTER_DOCTEST
+"""
+NumPy view of the slot contents of a board for vectorized queries.
+
+board_array(board) is an array of shape (sy, sx, SLOTS_PER_CELL) sharing the
+memory of BoardModel.cells: array[by, bx, slot_index] is the content of a
+slot, with slot indices in SLOTS order (CENTER, UP, DOWN, LEFT, RIGHT).
+Reading it always shows the current contents. Writing into it does not
+notify the change listeners; assign_contents() does.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from models.board import SLOTS, SLOTS_PER_CELL, BoardModel
+
+# Slot indices of the last array axis
+CENTER, UP, DOWN, LEFT, RIGHT = range(SLOTS_PER_CELL)
+
+Contents = npt.NDArray[np.uint8]
+Mask = npt.NDArray[np.bool_]
+
+
+def board_array(board: BoardModel) -> Contents:
+    """
+    Get the slot contents of a board as a (sy, sx, SLOTS_PER_CELL) array
+    sharing memory with the board.
+
+    Examples:
+        >>> board = BoardModel((2, 1), 3, ["### ###", "#G#   #", "### ###"])
+        >>> contents = board_array(board)
+        >>> contents.shape
+        (1, 2, 5)
+        >>> contents[0, :, CENTER].tolist()
+        [1, 0]
+        >>> board.set_cell_content(((1, 0), (0, 0)), BoardModel.RUBY)
+        >>> int(contents[0, 1, CENTER])
+        2
+    """
+    sx, sy = board.size
+    return np.frombuffer(board.cells, dtype=np.uint8).reshape(sy, sx, SLOTS_PER_CELL)
+
+
+def count_content(board: BoardModel, content: int) -> int:
+    """
+    Count the large cells with the given content in the center.
+
+    Examples:
+        >>> board = BoardModel((3, 1), 3, ["### ### ###", "#G# #G#   #", "### ### ###"])
+        >>> count_content(board, BoardModel.GOLD)
+        2
+    """
+    return int(np.count_nonzero(board_array(board)[:, :, CENTER] == content))
+
+
+def dug_cells(board: BoardModel) -> Mask:
+    """
+    Get a (sy, sx) mask of the large cells whose center is dug out: empty or
+    a start position.
+
+    Examples:
+        >>> board = BoardModel((3, 1), 3, ["### ### ###", "#G# ### # #", "### ### ###"])
+        >>> dug_cells(board).tolist()
+        [[False, False, True]]
+    """
+    center = board_array(board)[:, :, CENTER]
+    return np.isin(
+        center, (BoardModel.EMPTY, BoardModel.HOBBIN_START, BoardModel.DIGGER_START)
+    )
+
+
+def gold_over_empty(board: BoardModel) -> Mask:
+    """
+    Get a (sy, sx) mask of the gold bags with a tunnel beneath: the road down
+    and the center of the large cell below are empty.
+
+    Examples:
+        >>> board = BoardModel(
+        ...     (2, 2), 3, ["### ###", "#G# #G#", "# # ###", "# # ###", "# # # #", "### ###"]
+        ... )
+        >>> gold_over_empty(board).tolist()
+        [[True, False], [False, False]]
+    """
+    contents = board_array(board)
+    result = np.zeros(contents.shape[:2], dtype=np.bool_)
+    result[:-1] = (
+        (contents[:-1, :, CENTER] == BoardModel.GOLD)
+        & (contents[:-1, :, DOWN] == BoardModel.EMPTY)
+        & (contents[1:, :, UP] == BoardModel.EMPTY)
+        & (contents[1:, :, CENTER] == BoardModel.EMPTY)
+    )
+    return result
+
+
+def assign_contents(board: BoardModel, contents: Contents) -> int:
+    """
+    Set all slot contents of a board from a (sy, sx, SLOTS_PER_CELL) array,
+    e.g. the result of a vectorized transform of board_array(board), and
+    notify the change listeners of every changed slot.
+
+    Returns:
+        The number of changed slots.
+
+    Examples:
+        >>> board = BoardModel((2, 1), 3, ["### ###", "#G# #G#", "### ###"])
+        >>> changes = []
+        >>> board.add_change_listener(lambda lc, slot: changes.append((lc, slot)))
+        >>> contents = board_array(board).copy()
+        >>> contents[contents == BoardModel.GOLD] = BoardModel.RUBY
+        >>> assign_contents(board, contents)
+        2
+        >>> changes
+        [((0, 0), (0, 0)), ((1, 0), (0, 0))]
+        >>> count_content(board, BoardModel.RUBY)
+        2
+    """
+    current = board_array(board)
+    if contents.shape != current.shape:
+        raise ValueError(
+            f"Contents of shape {contents.shape} for a board of shape {current.shape}"
+        )
+    changed: List[Tuple[int, int, int]] = [
+        (int(by), int(bx), int(slot_index))
+        for by, bx, slot_index in np.argwhere(current != contents)
+    ]
+    current[...] = contents
+    for by, bx, slot_index in changed:
+        board.notify_cell_changed((bx, by), SLOTS[slot_index])
+    return len(changed)
@@ -9,6 +9,7 @@ setattr(sys.modules["__main__"], "LANGUAGE", "en_US")
 import os.path
 import gettext
 import sys
+from typing import Optional, Tuple
 
 MAIN_MODULE = sys.modules["__main__"]
 
@@ -18,6 +19,13 @@ ASSERT_VIEW_ZOOM = 32
 
 NO_REAL_VIDEO = False
 
+# Surface memory budget of the process-wide AnimatedSprite cache
+SPRITE_CACHE_BUDGET = 256 * 1024 * 1024
+# Interval of checking sprite files for changes in development mode (ms)
+HOT_RELOAD_INTERVAL = 500
+# Interval of the fixed game update steps (ms), independent of the frame rate
+UPDATE_INTERVAL = 60
+
 if NO_DISPLAY_ON_TEST and not hasattr(MAIN_MODULE, "MAIN_ASSETS"):
     os.environ["SDL_VIDEODRIVER"] = "dummy"
     NO_REAL_VIDEO = True
@@ -34,7 +42,14 @@ if hasattr(sys, "_MEIPASS"):  # pragma: no cover
 else:
     ASSETS_DIR = os.path.join(os.path.dirname(SRC_DIR), ASSETS_DIR)
 
-print("ASSETS_DIR =", ASSETS_DIR)
+print("ASSETS_DIR =", ASSETS_DIR, file=sys.stderr)
+
+# Persistent cache of scaled and transformed sprite frames (None disables it)
+SPRITE_DISK_CACHE_DIR: Optional[str] = None
+if hasattr(MAIN_MODULE, "MAIN_ASSETS"):  # pragma: no cover
+    SPRITE_DISK_CACHE_DIR = os.path.join(
+        os.path.expanduser("~"), ".cache", "digger", "sprites"
+    )
 
 
 def asset_path(asset: str) -> str:
@@ -45,6 +60,17 @@ if SRC_DIR not in sys.path:  # pragma: no cover
     sys.path.append(SRC_DIR)
 
 LANGUAGE = getattr(MAIN_MODULE, "LANGUAGE", "en_US")
+# Development mode: reload changed sprites while the game runs
+DEV_MODE = getattr(MAIN_MODULE, "DEV_MODE", False)
+# Load frames of the cached sprites on first use instead of at level start
+SPRITE_LAZY_LOADING = getattr(MAIN_MODULE, "SPRITE_LAZY_LOADING", False)
+# Render backend: "surface" (software) or "texture" (SDL2 renderer)
+RENDER_BACKEND = getattr(MAIN_MODULE, "RENDER_BACKEND", "surface")
+# Cell size (px) of the logical surface the board is drawn to and scaled from,
+# None draws the board at the display resolution
+LOGICAL_CELL_SIZE: Optional[Tuple[int, int]] = getattr(
+    MAIN_MODULE, "LOGICAL_CELL_SIZE", None
+)
 
 TRANSLATION = gettext.translation(
     "messages", localedir=LOCALES_DIR, languages=[LANGUAGE]
@@ -0,0 +1,121 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import pygame
+
+from animations.animated import AnimatedSprite
+from animations.atlas import ATLAS_IMAGE, ATLAS_INDEX, AtlasIndex, pack_atlas
+from settings import asset_path
+
+SPRITE_SIZE = (4, 4)
+
+
+class TestAtlas(unittest.TestCase):
+    """Tests for packing and loading sprite atlases."""
+
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((100, 100))
+        self.tmpdir = tempfile.mkdtemp()
+        self.sprite_dir = os.path.join(self.tmpdir, "animation")
+        shutil.copytree(asset_path("animation"), self.sprite_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_pack_writes_atlas_and_index(self):
+        """Test that packing writes the atlas image and a full frame index."""
+        index = pack_atlas(self.sprite_dir)
+        self.assertTrue(os.path.isfile(os.path.join(self.sprite_dir, ATLAS_IMAGE)))
+        self.assertTrue(os.path.isfile(os.path.join(self.sprite_dir, ATLAS_INDEX)))
+
+        # 2 variations x 4 frames of 2x2 pixels in a 3x3 grid
+        self.assertEqual(index.frame_size, (2, 2))
+        self.assertEqual(len(index.frames), 8)
+        self.assertEqual(index.frames["a_0"], (0, 0))
+        self.assertEqual(index.frames["b_0"], (2, 2))
+        atlas = pygame.image.load(os.path.join(self.sprite_dir, ATLAS_IMAGE))
+        self.assertEqual(atlas.get_size(), (6, 6))
+
+        loaded = AtlasIndex.load(self.sprite_dir)
+        self.assertEqual(loaded.frame_size, index.frame_size)
+        self.assertEqual(loaded.frames, index.frames)
+
+    def test_load_index_without_atlas(self):
+        self.assertIsNone(AtlasIndex.load(self.sprite_dir))
+
+    def test_pack_with_columns(self):
+        index = pack_atlas(self.sprite_dir, columns=8)
+        self.assertEqual(index.frames["b_3"], (14, 0))
+
+    def test_atlas_frames_match_file_frames(self):
+        """Test that frames cut from the atlas equal frames loaded from PNG files."""
+        expected = AnimatedSprite(self.sprite_dir, SPRITE_SIZE)
+        pack_atlas(self.sprite_dir)
+        sprite = AnimatedSprite(self.sprite_dir, SPRITE_SIZE)
+
+        self.assertEqual(set(sprite.sprites), set(expected.sprites))
+        for key, (image, anchor) in sprite.sprites.items():
+            expected_image, expected_anchor = expected.sprites[key]
+            self.assertEqual(anchor, expected_anchor, key)
+            self.assertEqual(image.get_size(), SPRITE_SIZE)
+            self.assertEqual(
+                pygame.image.tobytes(image, "RGBA"),
+                pygame.image.tobytes(expected_image, "RGBA"),
+                key,
+            )
+
+    def test_untransformed_frames_are_subsurfaces(self):
+        """Test that frames without transformations are cut as subsurfaces."""
+        pack_atlas(self.sprite_dir)
+        sprite = AnimatedSprite(self.sprite_dir, SPRITE_SIZE)
+        image, _ = sprite.sprites[("a", 1, "r")]
+        self.assertIsNotNone(image.get_parent())
+
+        # The whole scaled atlas is accounted once
+        atlas = image.get_abs_parent()
+        transformed = {
+            id(image): image
+            for (_, _, direction), (image, _) in sprite.sprites.items()
+            if direction != "r"
+        }
+        expected = atlas.get_pitch() * atlas.get_height()
+        expected += sum(s.get_pitch() * s.get_height() for s in transformed.values())
+        self.assertEqual(sprite.get_memory_size(), expected)
+
+    def test_stale_atlas_ignored(self):
+        """Test that frames edited after packing are loaded from their files."""
+        pack_atlas(self.sprite_dir)
+        self.assertIsNotNone(AtlasIndex.load(self.sprite_dir))
+        image = pygame.Surface((2, 2), pygame.SRCALPHA)
+        image.fill((10, 20, 30, 255))
+        pygame.image.save(image, os.path.join(self.sprite_dir, "a_0.png"))
+
+        self.assertIsNone(AtlasIndex.load(self.sprite_dir))
+        sprite = AnimatedSprite(self.sprite_dir, SPRITE_SIZE)
+        frame, _ = sprite.get_frame("a", 0, "r")
+        self.assertEqual(tuple(frame.get_at((0, 0))), (10, 20, 30, 255))
+
+    def test_atlas_without_stamp_ignored(self):
+        pack_atlas(self.sprite_dir)
+        index_path = os.path.join(self.sprite_dir, ATLAS_INDEX)
+        with open(index_path) as f:
+            data = json.load(f)
+        self.assertEqual(data["sources"]["files"][0], "animation.json")
+        del data["sources"]
+        with open(index_path, "w") as f:
+            json.dump(data, f)
+        self.assertIsNone(AtlasIndex.load(self.sprite_dir))
+
+    def test_pack_rejects_different_frame_sizes(self):
+        pygame.image.save(
+            pygame.Surface((3, 3)), os.path.join(self.sprite_dir, "b_2.png")
+        )
+        with self.assertRaises(ValueError):
+            pack_atlas(self.sprite_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -190,6 +190,109 @@ class TestAnimatedSpriteView(unittest.TestCase):
             actual_screen_pos = tuple(tracking_animation.set_position_calls[-1])
             self.assertEqual(actual_screen_pos, expected_screen_pos)
 
+    def test_fixed_updates_interpolate_position(self):
+        """Test that with fixed updates tick draws between the updated positions."""
+
+        class SimpleWindow(Window):
+            def tick(self, events):
+                pass
+
+        view = AnimatedSpriteView(self.animated_sprite)
+        window = SimpleWindow(self.env)
+        window.add_view(0, view)
+        self.env.alpha = 0.5
+
+        view.set_position((10, 20))
+        view.tick()  # Not updated yet, drawn where placed
+        self.assertEqual(view.animation.position, [10, 20])
+        view.update()
+        view.set_position((30, 40))
+        view.update()
+        view.tick()
+        self.assertEqual(view.animation.position, [20, 30])
+
+        # Frames advance only on updates
+        frame = view.animation.current_frame_index
+        view.tick()
+        self.assertEqual(view.animation.current_frame_index, frame)
+
+    def test_views_outside_window_culled(self):
+        """Test that views outside the window are not drawn but still animate."""
+
+        class SimpleWindow(Window):
+            def tick(self, events):
+                pass
+
+        window = SimpleWindow(self.env)
+        window.set_rect(pygame.Rect(0, 0, 200, 200))
+        view = AnimatedSpriteView(self.animated_sprite)
+        window.add_view(0, view)
+        view.set_position((500, 500))
+
+        fetched = []
+        get_frame = self.animated_sprite.get_frame
+
+        def fetch(*key):
+            fetched.append(key)
+            return get_frame(*key)
+
+        self.animated_sprite.get_frame = fetch
+
+        self.assertEqual(window.tick_views(), [])
+        self.assertEqual(view.animation.current_frame_index, 1)
+        self.assertEqual(fetched, [])  # Frames of culled views are not loaded
+
+        view.set_position((250, 100))  # Frame anchored off the window edge
+        self.assertTrue(window.tick_views())
+        self.assertEqual(len(fetched), 1)
+
+    def test_views_clipped_to_window(self):
+        """Test that views on the window border do not draw outside it."""
+        for batches_blits in (False, True):
+
+            class SimpleWindow(Window):
+                def tick(self, events):
+                    pass
+
+            SimpleWindow.batches_blits = batches_blits
+            with self.subTest(batches_blits=batches_blits):
+                self.display.fill((0, 0, 0))
+                window = SimpleWindow(self.env)
+                window.set_rect(pygame.Rect(0, 0, 200, 200))
+                view = AnimatedSpriteView(self.animated_sprite)
+                window.add_view(0, view)
+                view.set_position((200, 100))  # Anchor on the right border
+
+                rects = window.tick_views()
+                self.assertTrue(rects)
+                for rect in rects:
+                    self.assertTrue(window.get_rect().contains(rect))
+                outside = pygame.Rect(200, 0, 200, 200)
+                self.assertEqual(
+                    pygame.mask.from_threshold(
+                        self.display.subsurface(outside), (0, 0, 0), (1, 1, 1, 255)
+                    ).count(),
+                    outside.width * outside.height,
+                )
+                self.assertEqual(self.display.get_clip(), self.display.get_rect())
+
+    def test_position_updates_spatial_index(self):
+        """Test that moving a view moves it in the window's spatial index."""
+
+        class SimpleWindow(Window):
+            def tick(self, events):
+                pass
+
+        window = SimpleWindow(self.env)
+        window.enable_spatial_index((100, 100))
+        view = AnimatedSpriteView(self.animated_sprite)
+        window.add_view(0, view)
+        view.set_position((150, 150))
+        self.assertEqual(window.get_views_at((150, 150)), [view])
+        view.set_position((450, 150))
+        self.assertEqual(window.get_views_at((150, 150)), [])
+        self.assertEqual(window.get_views_at((420, 120)), [view])
+
     def test_multiple_views_independent_animation(self):
         """Test that multiple views have independent animations."""
         view1 = AnimatedSpriteView(self.animated_sprite)
@@ -0,0 +1,114 @@
+import itertools
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import pygame
+
+from animations.animated import AnimatedSprite
+from animations.dihedral import (
+    compose_transformations,
+    transform_anchor,
+    transform_image,
+)
+from settings import asset_path
+
+IMAGE_SIZE = (5, 3)
+
+
+def apply_step_by_step(image, anchor, transformations):
+    """Reference: apply each transformation as a separate pass."""
+    anchor = anchor[:]
+    for transformation in transformations:
+        if transformation == "mirror":
+            image = pygame.transform.flip(image, True, False)
+            anchor[0] = image.get_width() - anchor[0] - 1
+        else:
+            image = pygame.transform.rotate(image, -90)
+            anchor = [image.get_width() - anchor[1] - 1, anchor[0]]
+    return image, anchor
+
+
+class TestDihedral(unittest.TestCase):
+    """Tests for transformation chains reduced to D4 elements."""
+
+    def setUp(self):
+        pygame.init()
+        rng = random.Random(1)
+        self.image = pygame.Surface(IMAGE_SIZE, pygame.SRCALPHA)
+        for x, y in itertools.product(range(IMAGE_SIZE[0]), range(IMAGE_SIZE[1])):
+            self.image.set_at((x, y), [rng.randrange(256) for _ in range(4)])
+
+    def test_matches_step_by_step(self):
+        """Test every chain up to 5 steps against applying it step by step."""
+        for length in range(6):
+            for chain in itertools.product(["mirror", "rotate"], repeat=length):
+                with self.subTest(chain=chain):
+                    transform = compose_transformations(chain)
+                    expected_image, expected_anchor = apply_step_by_step(
+                        self.image, [1, 0], chain
+                    )
+                    image = transform_image(self.image, transform)
+                    self.assertEqual(
+                        pygame.image.tobytes(image, "RGBA"),
+                        pygame.image.tobytes(expected_image, "RGBA"),
+                    )
+                    self.assertEqual(
+                        transform_anchor([1, 0], IMAGE_SIZE, transform),
+                        expected_anchor,
+                    )
+
+    def test_group_has_eight_elements(self):
+        elements = {
+            compose_transformations(chain)
+            for length in range(5)
+            for chain in itertools.product(["mirror", "rotate"], repeat=length)
+        }
+        self.assertEqual(len(elements), 8)
+
+
+class TestSharedTransforms(unittest.TestCase):
+    """Tests for directions sharing frames of equal transformations."""
+
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((100, 100))
+        self.tmpdir = tempfile.mkdtemp()
+        self.sprite_dir = os.path.join(self.tmpdir, "animation")
+        shutil.copytree(asset_path("animation"), self.sprite_dir)
+        data_path = os.path.join(self.sprite_dir, "animation.json")
+        with open(data_path) as f:
+            data = json.load(f)
+        data["transform"] = {
+            "r": [],
+            "l": ["mirror"],
+            "u": ["rotate", "mirror", "rotate"],
+            "d": ["rotate", "rotate", "rotate", "rotate"],
+        }
+        with open(data_path, "w") as f:
+            json.dump(data, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_equal_elements_share_frames(self):
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                sprite = AnimatedSprite(self.sprite_dir, (4, 4), lazy=lazy)
+                sprite.warm_up()
+                # rotate, mirror, rotate == mirror; four rotations == identity
+                self.assertIs(
+                    sprite.get_frame("a", 1, "u"), sprite.get_frame("a", 1, "l")
+                )
+                self.assertIs(
+                    sprite.get_frame("a", 1, "d")[0], sprite.get_frame("a", 1, "r")[0]
+                )
+                self.assertIsNot(
+                    sprite.get_frame("a", 1, "l")[0], sprite.get_frame("a", 1, "r")[0]
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import pygame
+
+from animations.animated import AnimatedSprite
+from animations.disk_cache import CACHE_FILE_SUFFIX, SpriteDiskCache
+from settings import asset_path
+
+SPRITE_SIZE = (4, 4)
+
+
+class TestSpriteDiskCache(unittest.TestCase):
+    """Tests for the persistent sprite frame cache."""
+
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((100, 100))
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmpdir, "cache")
+        self.sprite_dir = os.path.join(self.tmpdir, "animation")
+        shutil.copytree(asset_path("animation"), self.sprite_dir)
+        self.cache = SpriteDiskCache(self.cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def cache_files(self):
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return [f for f in os.listdir(self.cache_dir) if f.endswith(CACHE_FILE_SUFFIX)]
+
+    def assertSameFrames(self, sprites, expected):
+        self.assertEqual(set(sprites), set(expected))
+        for key, (image, anchor) in sprites.items():
+            expected_image, expected_anchor = expected[key]
+            self.assertEqual(anchor, expected_anchor, key)
+            self.assertEqual(
+                pygame.image.tobytes(image, "RGBA"),
+                pygame.image.tobytes(expected_image, "RGBA"),
+                key,
+            )
+
+    def test_cold_start_writes_cache(self):
+        AnimatedSprite(self.sprite_dir, SPRITE_SIZE, disk_cache=self.cache)
+        self.assertEqual(len(self.cache_files()), 1)
+
+    def test_warm_start_skips_image_work(self):
+        """Test that a warm start reads frames from the cache only."""
+        expected = AnimatedSprite(self.sprite_dir, SPRITE_SIZE, disk_cache=self.cache)
+        with patch("animations.animated.load_image") as load_image, patch(
+            "pygame.transform.scale"
+        ) as scale:
+            sprite = AnimatedSprite(self.sprite_dir, SPRITE_SIZE, disk_cache=self.cache)
+            load_image.assert_not_called()
+            scale.assert_not_called()
+        self.assertTrue(sprite.is_loaded())
+        self.assertSameFrames(sprite.sprites, expected.sprites)
+
+    def test_lazy_sprite_saved_when_fully_loaded(self):
+        sprite = AnimatedSprite(
+            self.sprite_dir, SPRITE_SIZE, lazy=True, disk_cache=self.cache
+        )
+        sprite.warm_up(variations=["a"])
+        self.assertEqual(self.cache_files(), [])
+        sprite.warm_up()
+        self.assertEqual(len(self.cache_files()), 1)
+
+        cached = AnimatedSprite(
+            self.sprite_dir, SPRITE_SIZE, lazy=True, disk_cache=self.cache
+        )
+        self.assertTrue(cached.is_loaded())
+        self.assertSameFrames(cached.sprites, sprite.sprites)
+
+    def test_key_depends_on_size_and_content(self):
+        sprite = AnimatedSprite(self.sprite_dir, SPRITE_SIZE, lazy=True)
+        data = sprite.animation_data
+        key = self.cache.make_key(self.sprite_dir, SPRITE_SIZE, data)
+        self.assertEqual(key, self.cache.make_key(self.sprite_dir, SPRITE_SIZE, data))
+        self.assertNotEqual(key, self.cache.make_key(self.sprite_dir, (8, 8), data))
+
+        pygame.image.save(
+            pygame.Surface((2, 2)), os.path.join(self.sprite_dir, "a_0.png")
+        )
+        self.assertNotEqual(
+            key, self.cache.make_key(self.sprite_dir, SPRITE_SIZE, data)
+        )
+
+    def test_shared_frames_stay_shared(self):
+        """Test that frames shared between directions are shared after loading."""
+        sprite_dir = asset_path("no_transform")
+        AnimatedSprite(sprite_dir, (1, 1), disk_cache=self.cache)
+        sprite = AnimatedSprite(sprite_dir, (1, 1), disk_cache=self.cache)
+        self.assertIs(sprite.sprites[("a", 0, "r")], sprite.sprites[("a", 0, "d")])
+
+    def test_corrupted_cache_is_a_miss(self):
+        AnimatedSprite(self.sprite_dir, SPRITE_SIZE, disk_cache=self.cache)
+        path = os.path.join(self.cache_dir, self.cache_files()[0])
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 1)
+        sprite = AnimatedSprite(self.sprite_dir, SPRITE_SIZE, disk_cache=self.cache)
+        self.assertTrue(sprite.is_loaded())
+
+    def test_load_missing_key(self):
+        self.assertIsNone(self.cache.load("missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import pygame
+
+from animations.animated import AnimatedSprite
+from animations.atlas import AtlasIndex, pack_atlas
+from animations.disk_cache import SpriteDiskCache
+from animations.hot_reload import AssetManifest, SpriteWatcher
+from animations.sprite_cache import SpriteCache
+from settings import asset_path
+
+SPRITE_SIZE = (4, 4)
+
+
+class TestHotReload(unittest.TestCase):
+    """Tests for the asset manifest and the reloading of changed sprites."""
+
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((100, 100))
+        self.tmpdir = tempfile.mkdtemp()
+        self.sprite_dir = os.path.join(self.tmpdir, "animation")
+        shutil.copytree(asset_path("animation"), self.sprite_dir)
+        self.cache = SpriteCache()
+        self.watcher = SpriteWatcher(self.cache, interval=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write_frame(self, name, color):
+        image = pygame.Surface((2, 2), pygame.SRCALPHA)
+        image.fill(color)
+        pygame.image.save(image, os.path.join(self.sprite_dir, name))
+
+    def test_manifest_reports_changed_files(self):
+        manifest = AssetManifest(self.sprite_dir)
+        self.assertIn("animation.json", manifest.hashes)
+        self.assertEqual(manifest.update(), set())
+
+        self.write_frame("a_0.png", (1, 2, 3, 255))
+        os.remove(os.path.join(self.sprite_dir, "b_0.png"))
+        self.write_frame("c_0.png", (1, 2, 3, 255))
+        self.assertEqual(manifest.update(), {"a_0.png", "b_0.png", "c_0.png"})
+
+    def test_manifest_ignores_touched_files(self):
+        """Test that a new modification time with the same content is no change."""
+        manifest = AssetManifest(self.sprite_dir)
+        path = os.path.join(self.sprite_dir, "a_0.png")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(manifest.update(), set())
+
+    def test_changed_sprite_reloaded_in_place(self):
+        sprite = self.cache.get(self.sprite_dir, SPRITE_SIZE)
+        other = self.cache.get(asset_path("no_transform"), (1, 1))
+        self.assertEqual(self.watcher.check(), [])
+
+        self.write_frame("a_0.png", (10, 20, 30, 255))
+        self.assertEqual(self.watcher.check(), [os.path.normpath(self.sprite_dir)])
+        self.assertIs(self.cache.get(self.sprite_dir, SPRITE_SIZE), sprite)
+        self.assertIs(self.cache.get(asset_path("no_transform"), (1, 1)), other)
+        image, _ = sprite.get_frame("a", 0, "r")
+        self.assertEqual(tuple(image.get_at((0, 0))), (10, 20, 30, 255))
+        self.assertEqual(self.watcher.check(), [])
+
+    def test_packed_sprite_reloaded_from_edited_frames(self):
+        """Test that an edited frame is shown although the atlas is outdated."""
+        disk_cache = SpriteDiskCache(os.path.join(self.tmpdir, "cache"))
+        caches = [self.cache, SpriteCache(disk_cache=disk_cache)]
+        for i, cache in enumerate(caches):
+            with self.subTest(disk_cache=i == 1):
+                pack_atlas(self.sprite_dir)
+                self.assertIsNotNone(AtlasIndex.load(self.sprite_dir))
+                watcher = SpriteWatcher(cache, interval=0)
+                sprite = cache.get(self.sprite_dir, SPRITE_SIZE)
+                watcher.check()
+
+                color = (10, 20, 30 + i, 255)
+                self.write_frame("a_0.png", color)
+                self.assertEqual(watcher.check(), [os.path.normpath(self.sprite_dir)])
+                image, _ = sprite.get_frame("a", 0, "r")
+                self.assertEqual(tuple(image.get_at((0, 0))), color)
+                # Sprites created later are not given stale frames either
+                fresh = AnimatedSprite(
+                    self.sprite_dir, SPRITE_SIZE, disk_cache=disk_cache
+                )
+                image, _ = fresh.get_frame("a", 0, "r")
+                self.assertEqual(tuple(image.get_at((0, 0))), color)
+
+    def test_animation_data_reloaded(self):
+        sprite = self.cache.get(self.sprite_dir, SPRITE_SIZE)
+        self.watcher.check()
+        data_path = os.path.join(self.sprite_dir, "animation.json")
+        with open(data_path) as f:
+            data = json.load(f)
+        data["animations"]["default"] = [1, 1]
+        with open(data_path, "w") as f:
+            json.dump(data, f)
+
+        self.watcher.check()
+        self.assertEqual(sprite.animation_data["animations"]["default"], [1, 1])
+
+    def test_animations_follow_reloaded_data(self):
+        sprite = self.cache.get(self.sprite_dir, SPRITE_SIZE)
+        playing = sprite.create_animation()
+        playing.start_animation("alternative")
+        playing.set_variation("b")
+        playing.set_direction("u")
+        for _ in range(3):
+            playing.next_frame()  # Frame 0 of the 4th sequence step
+        kept = sprite.create_animation()
+        kept.next_frame()
+        self.watcher.check()
+
+        # Fewer frames, a shorter default sequence, no "alternative" and "b"
+        data_path = os.path.join(self.sprite_dir, "animation.json")
+        with open(data_path) as f:
+            data = json.load(f)
+        data.update(frame_count=2, variations=["a"], anchors=data["anchors"][:2])
+        data["animations"] = {"default": [1, 0]}
+        data["transform"] = {"r": [], "l": ["mirror"]}
+        with open(data_path, "w") as f:
+            json.dump(data, f)
+        self.watcher.check()
+
+        self.assertEqual(playing.animation_name, "default")
+        self.assertEqual(playing.get_current_frame(), 0)
+        self.assertEqual((playing.current_variation, playing.direction), ("a", "r"))
+        self.assertEqual(kept.get_current_frame(), 1)
+        for animation in (playing, kept):
+            for _ in range(3):
+                animation.get_blit()
+                animation.next_frame()
+
+    def test_broken_file_keeps_old_sprite(self):
+        sprite = self.cache.get(self.sprite_dir, SPRITE_SIZE)
+        frames = dict(sprite.sprites)
+        self.watcher.check()
+        with open(os.path.join(self.sprite_dir, "animation.json"), "w") as f:
+            f.write("{")
+
+        self.assertEqual(self.watcher.check(), [])
+        self.assertEqual(sprite.sprites, frames)
+
+    def test_poll_respects_interval(self):
+        watcher = SpriteWatcher(self.cache, interval=10**6)
+        self.cache.get(self.sprite_dir, SPRITE_SIZE)
+        watcher.poll()
+        self.write_frame("a_0.png", (10, 20, 30, 255))
+        self.assertEqual(watcher.poll(), [])
+        self.assertEqual(len(watcher.check()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import threading
+import unittest
+from unittest.mock import patch
+import pygame
+
+from animations.animated import AnimatedSprite
+from animations.loader import AsyncSpriteLoader, load_in_parallel
+from animations.sprite_cache import SpriteCache
+from settings import asset_path
+
+SPRITE_SIZE = (4, 4)
+
+
+class TestParallelLoader(unittest.TestCase):
+    """Tests for loading sprites with images decoded on a thread pool."""
+
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((100, 100))
+
+    def test_same_frames_as_serial_load(self):
+        expected = AnimatedSprite(asset_path("animation"), SPRITE_SIZE)
+        sprite = AnimatedSprite(asset_path("animation"), SPRITE_SIZE, lazy=True)
+        load_in_parallel([sprite], max_workers=4)
+
+        self.assertTrue(sprite.is_loaded())
+        self.assertEqual(set(sprite.sprites), set(expected.sprites))
+        for key, (image, anchor) in sprite.sprites.items():
+            expected_image, expected_anchor = expected.sprites[key]
+            self.assertEqual(anchor, expected_anchor, key)
+            self.assertEqual(
+                pygame.image.tobytes(image, "RGBA"),
+                pygame.image.tobytes(expected_image, "RGBA"),
+                key,
+            )
+
+    def test_decoding_runs_on_worker_threads(self):
+        """Test that images are decoded off the main thread and installed on it."""
+        decode_threads = set()
+        install_threads = set()
+        decode = AnimatedSprite.decode_source
+        install = AnimatedSprite.install_source
+
+        def record_decode(sprite, name):
+            decode_threads.add(threading.get_ident())
+            return decode(sprite, name)
+
+        def record_install(sprite, name, decoded):
+            install_threads.add(threading.get_ident())
+            install(sprite, name, decoded)
+
+        sprite = AnimatedSprite(asset_path("animation"), SPRITE_SIZE, lazy=True)
+        with patch.object(AnimatedSprite, "decode_source", record_decode), patch.object(
+            AnimatedSprite, "install_source", record_install
+        ):
+            load_in_parallel([sprite], max_workers=2)
+
+        self.assertTrue(decode_threads)
+        self.assertNotIn(threading.get_ident(), decode_threads)
+        self.assertEqual(install_threads, {threading.get_ident()})
+
+    def test_loaded_sprites_are_skipped(self):
+        sprite = AnimatedSprite(asset_path("animation"), SPRITE_SIZE)
+        self.assertEqual(sprite.get_pending_sources(), [])
+        with patch("animations.loader.ThreadPoolExecutor") as executor:
+            load_in_parallel([sprite])
+            executor.assert_not_called()
+
+    def test_async_loader_progress(self):
+        """Test that polling reports growing progress until all sprites load."""
+        sprites = [
+            AnimatedSprite(asset_path("animation"), SPRITE_SIZE, lazy=True),
+            AnimatedSprite(asset_path("no_transform"), (1, 1), lazy=True),
+        ]
+        loader = AsyncSpriteLoader(sprites, max_workers=2)
+        progress = [loader.get_progress()]
+        while not loader.poll(timeout=1):
+            progress.append(loader.get_progress())
+        progress.append(loader.get_progress())
+
+        self.assertEqual(progress[0], 0.0)
+        self.assertEqual(progress[-1], 1.0)
+        self.assertEqual(progress, sorted(progress))
+        self.assertTrue(all(sprite.is_loaded() for sprite in sprites))
+
+    def test_async_loader_without_work(self):
+        sprite = AnimatedSprite(asset_path("animation"), SPRITE_SIZE)
+        loader = AsyncSpriteLoader([sprite])
+        self.assertTrue(loader.is_done())
+        self.assertEqual(loader.get_progress(), 1.0)
+
+    def test_async_loader_cancel(self):
+        sprite = AnimatedSprite(asset_path("animation"), SPRITE_SIZE, lazy=True)
+        loader = AsyncSpriteLoader([sprite])
+        loader.cancel()
+        self.assertTrue(loader.is_done())
+        self.assertTrue(loader.poll())
+
+    def test_decode_errors_raised_by_poll(self):
+        sprite = AnimatedSprite(asset_path("animation"), SPRITE_SIZE, lazy=True)
+        with patch.object(sprite, "decode_source", side_effect=OSError("broken")):
+            loader = AsyncSpriteLoader([sprite])
+            with self.assertRaises(OSError):
+                loader.wait()
+
+    def test_cache_get_many_without_load(self):
+        cache = SpriteCache(lazy=False)
+        sprites = cache.get_many(
+            {"a": (asset_path("animation"), SPRITE_SIZE)}, load=False
+        )
+        self.assertFalse(sprites["a"].is_loaded())
+        self.assertFalse(sprites["a"].lazy)
+
+    def test_deferred_eager_sprite(self):
+        sprite = AnimatedSprite(
+            asset_path("animation"), SPRITE_SIZE, defer_loading=True
+        )
+        self.assertFalse(sprite.lazy)
+        self.assertFalse(sprite.is_loaded())
+        load_in_parallel([sprite], max_workers=2)
+        self.assertTrue(sprite.is_loaded())
+
+    def test_cache_get_many(self):
+        """Test that get_many loads missing sprites fully and reuses cached ones."""
+        cache = SpriteCache(lazy=False, max_workers=2)
+        cached = cache.get(asset_path("animation"), SPRITE_SIZE)
+        sprites = cache.get_many(
+            {
+                "cached": (asset_path("animation"), SPRITE_SIZE),
+                "new": (asset_path("no_transform"), (1, 1)),
+            }
+        )
+        self.assertIs(sprites["cached"], cached)
+        self.assertTrue(sprites["new"].is_loaded())
+        self.assertFalse(sprites["new"].lazy)
+        self.assertIs(cache.get(asset_path("no_transform"), (1, 1)), sprites["new"])
+
+    def test_get_many_keeps_batch_over_budget(self):
+        cache = SpriteCache(budget=0)
+        sprites = cache.get_many(
+            {
+                "a": (asset_path("animation"), SPRITE_SIZE),
+                "b": (asset_path("no_transform"), (1, 1)),
+            }
+        )
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(all(s.is_loaded() for s in sprites.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import pygame
+
+from animations.animated import AnimatedSprite
+from animations.atlas import ATLAS_IMAGE, pack_atlas
+from animations.mipmaps import MipIndex, level_dir
+
+SOURCE_SIZE = (16, 16)
+LEVELS = [(8, 8), (4, 4), (2, 2)]
+ANCHOR = [12, 4]
+
+
+class TestMipChain(unittest.TestCase):
+    """Tests for picking pre-downscaled source levels."""
+
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((100, 100))
+        self.tmpdir = tempfile.mkdtemp()
+        self.sprite_dir = os.path.join(self.tmpdir, "animation")
+        os.makedirs(self.sprite_dir)
+        data = {
+            "transform": {"r": [], "l": ["mirror"]},
+            "frame_count": 1,
+            "variations": ["a"],
+            "animations": {"default": [0]},
+            "anchors": [ANCHOR],
+        }
+        with open(os.path.join(self.sprite_dir, "animation.json"), "w") as f:
+            json.dump(data, f)
+
+        # Every level has its own color to tell which one was loaded
+        self.colors = {SOURCE_SIZE: (255, 0, 0, 255)}
+        self.save_frame(self.sprite_dir, SOURCE_SIZE)
+        for i, level in enumerate(LEVELS):
+            self.colors[level] = (0, 40 * (i + 1), 0, 255)
+            self.save_frame(os.path.join(self.sprite_dir, level_dir(level)), level)
+        MipIndex(SOURCE_SIZE, LEVELS).save(self.sprite_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def save_frame(self, path, size):
+        os.makedirs(path, exist_ok=True)
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        image.fill(self.colors[size])
+        pygame.image.save(image, os.path.join(path, "a_0.png"))
+
+    def loaded_color(self, sprite):
+        image, _ = sprite.get_frame("a", 0, "r")
+        return tuple(image.get_at((0, 0)))
+
+    def test_smallest_level_at_or_above_size(self):
+        for size, level in [((3, 3), (4, 4)), ((4, 4), (4, 4)), ((5, 2), (8, 8))]:
+            with self.subTest(size=size):
+                sprite = AnimatedSprite(self.sprite_dir, size)
+                self.assertEqual(self.loaded_color(sprite), self.colors[level])
+                self.assertEqual(sprite.get_frame("a", 0, "r")[0].get_size(), size)
+
+    def test_sources_used_above_all_levels(self):
+        sprite = AnimatedSprite(self.sprite_dir, (12, 12))
+        self.assertEqual(sprite.source_path, self.sprite_dir)
+        self.assertEqual(self.loaded_color(sprite), self.colors[SOURCE_SIZE])
+
+    def test_anchors_scaled_from_source_size(self):
+        sprite = AnimatedSprite(self.sprite_dir, (4, 4))
+        self.assertEqual(sprite.get_frame("a", 0, "r")[1], [3, 1])
+        self.assertEqual(sprite.get_frame("a", 0, "l")[1], [0, 1])
+
+    def test_level_loaded_without_extra_scaling(self):
+        """Test that a level of exactly the target size is not scaled again."""
+        with patch("pygame.transform.scale") as scale:
+            AnimatedSprite(self.sprite_dir, (4, 4))
+        scale.assert_not_called()
+
+    def test_pack_atlas_packs_levels(self):
+        pack_atlas(self.sprite_dir)
+        for level in LEVELS:
+            level_path = os.path.join(self.sprite_dir, level_dir(level))
+            self.assertTrue(os.path.isfile(os.path.join(level_path, ATLAS_IMAGE)))
+
+        sprite = AnimatedSprite(self.sprite_dir, (4, 4))
+        self.assertEqual(self.loaded_color(sprite), self.colors[(4, 4)])
+        self.assertEqual(sprite.get_frame("a", 0, "r")[1], [3, 1])
+
+    def test_stale_chain_ignored(self):
+        """Test that a source frame edited after building the chain is used."""
+        self.colors[SOURCE_SIZE] = (0, 0, 255, 255)
+        self.save_frame(self.sprite_dir, SOURCE_SIZE)
+        self.assertIsNone(MipIndex.load(self.sprite_dir))
+        sprite = AnimatedSprite(self.sprite_dir, (4, 4))
+        self.assertEqual(sprite.source_path, self.sprite_dir)
+        self.assertEqual(self.loaded_color(sprite), (0, 0, 255, 255))
+
+    def test_index_round_trip(self):
+        index = MipIndex.load(self.sprite_dir)
+        self.assertEqual(index.source_size, SOURCE_SIZE)
+        self.assertEqual(index.levels, LEVELS)
+        self.assertIsNone(MipIndex.load(self.tmpdir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import pygame
+
+from animations.sprite_cache import SpriteCache
+from settings import asset_path
+
+
+class TestSpriteCache(unittest.TestCase):
+    """Tests for the SpriteCache class."""
+
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((100, 100))
+        self.path = asset_path("animation")
+
+    def test_same_key_returns_same_sprite(self):
+        """Test that the same (path, size) gives the same instance."""
+        cache = SpriteCache()
+        sprite1 = cache.get(self.path, (4, 4))
+        sprite2 = cache.get(self.path, (4, 4))
+        self.assertIs(sprite1, sprite2)
+        self.assertEqual(len(cache), 1)
+
+    def test_different_size_returns_different_sprite(self):
+        """Test that sizes are cached separately."""
+        cache = SpriteCache()
+        sprite1 = cache.get(self.path, (4, 4))
+        sprite2 = cache.get(self.path, (8, 8))
+        self.assertIsNot(sprite1, sprite2)
+        self.assertEqual(sprite2.size, (8, 8))
+        self.assertEqual(len(cache), 2)
+
+    def test_memory_size(self):
+        """Test that memory usage is the sum of the cached sprites."""
+        cache = SpriteCache()
+        sprite1 = cache.get(self.path, (4, 4))
+        sprite2 = cache.get(asset_path("digger"), (4, 4))
+        self.assertGreater(sprite1.get_memory_size(), 0)
+        self.assertEqual(
+            cache.get_memory_size(),
+            sprite1.get_memory_size() + sprite2.get_memory_size(),
+        )
+
+    def test_lru_eviction(self):
+        """Test that the least recently used sprite is evicted first."""
+        cache = SpriteCache()
+        cache.get(self.path, (4, 4))
+        cache.get(asset_path("digger"), (4, 4))
+        cache.get(self.path, (4, 4))  # Touch the first sprite
+        budget = cache.get_memory_size()
+        cache.set_budget(budget)
+        cache.get(asset_path("hobbin"), (4, 4))
+
+        self.assertLessEqual(cache.get_memory_size(), budget)
+        self.assertTrue(cache.contains(asset_path("hobbin"), (4, 4)))
+        self.assertFalse(cache.contains(asset_path("digger"), (4, 4)))
+
+    def test_newest_sprite_is_kept_over_budget(self):
+        """Test that a sprite larger than the budget is still returned and kept."""
+        cache = SpriteCache(budget=0)
+        sprite = cache.get(self.path, (4, 4))
+        self.assertEqual(len(cache), 1)
+        self.assertIs(cache.get(self.path, (4, 4)), sprite)
+
+    def test_set_negative_budget_raises_error(self):
+        cache = SpriteCache()
+        with self.assertRaises(ValueError):
+            cache.set_budget(-1)
+
+    def test_lazy_cache_creates_lazy_sprites(self):
+        cache = SpriteCache(lazy=True)
+        sprite = cache.get(self.path, (4, 4))
+        self.assertTrue(sprite.lazy)
+        self.assertEqual(sprite.get_memory_size(), 0)
+
+    def test_clear(self):
+        cache = SpriteCache()
+        cache.get(self.path, (4, 4))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.get_memory_size(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from game.benchmark import main, measure_frames, run_benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    """Tests for the headless render benchmark"""
+
+    def test_report(self):
+        result = run_benchmark((320, 200), frames=20, sprites=5)
+        self.assertEqual(result["resolution"], [320, 200])
+        self.assertEqual(result["frames"], 20)
+        self.assertEqual(result["sprites"], 5)
+        for key in ("mean_ms", "p50_ms", "p95_ms", "p99_ms", "fps"):
+            self.assertIn(key, result)
+        self.assertLessEqual(result["p50_ms"], result["p95_ms"])
+        self.assertLessEqual(result["p95_ms"], result["p99_ms"])
+        self.assertTrue(result["full_redraw"])
+
+    def test_full_redraw_invalidates_every_frame(self):
+        class CountingScreen:
+            def __init__(self):
+                self.ticks = self.invalidations = 0
+
+            def tick(self, events):
+                self.ticks += 1
+
+            def invalidate(self):
+                self.invalidations += 1
+
+        screen = CountingScreen()
+        self.assertEqual(len(measure_frames(screen, 4, warmup=2)), 4)
+        self.assertEqual((screen.ticks, screen.invalidations), (6, 6))
+        screen = CountingScreen()
+        measure_frames(screen, 4, warmup=2, full_redraw=False)
+        self.assertEqual((screen.ticks, screen.invalidations), (6, 0))
+
+    def test_texture_renderer(self):
+        result = run_benchmark((320, 200), frames=5, sprites=5, texture=True)
+        self.assertEqual(result["renderer"], "texture")
+        self.assertGreater(result["fps"], 0)
+
+    def test_main_writes_json_to_output(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = os.path.join(tmpdir, "result.json")
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                self.assertEqual(main((320, 200), 3, output=output), 0)
+            self.assertEqual(stdout.getvalue(), "")
+            with open(output, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["frames"], 3)
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            main((320, 200), 3)
+        self.assertEqual(json.loads(stdout.getvalue())["frames"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
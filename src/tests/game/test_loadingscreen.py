@@ -0,0 +1,59 @@
+import unittest
+import pygame
+
+from animations.animated import AnimatedSprite
+from animations.loader import AsyncSpriteLoader
+from game.loadingscreen import LoadingScreen
+from game.main import create_digger_screens
+from game.playscreen import PlayScreen
+from mainloop.environment import Environment
+from mainloop.screens import Screens
+from settings import asset_path
+
+
+class TestLoadingScreen(unittest.TestCase):
+    """Tests for the loading screen driving an AsyncSpriteLoader"""
+
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((320, 200))
+        self.env = Environment(self.display)
+        self.screens = Screens(self.env)
+        self.screens.add_screen("next", PlayScreen(self.env))
+
+    def tick_until_switched(self, max_ticks=1000):
+        for _ in range(max_ticks):
+            if self.screens.get_active_screen_name() != "loading":
+                return
+            self.screens.tick([])
+        self.fail("Loading screen did not switch to the next screen")
+
+    def test_switches_to_next_screen_when_loaded(self):
+        sprite = AnimatedSprite(asset_path("animation"), (4, 4), lazy=True)
+        loader = AsyncSpriteLoader([sprite])
+        screen = LoadingScreen(self.env, self.screens, loader, next_screen="next")
+        self.screens.add_screen("loading", screen, make_active=True)
+
+        self.tick_until_switched()
+        self.assertEqual(self.screens.get_active_screen_name(), "next")
+        self.assertTrue(sprite.is_loaded())
+
+    def test_progress_bar_drawn(self):
+        """Test that a finished loader fills the progress bar"""
+        loader = AsyncSpriteLoader([])
+        screen = LoadingScreen(self.env, self.screens, loader, next_screen="next")
+        screen.tick([])
+        bar_rect = screen.progress_window.bar_rect
+        self.assertEqual(self.display.get_at(bar_rect.center)[:3], (255, 255, 255))
+
+    def test_digger_screens_start_with_loading(self):
+        self.screens = create_digger_screens(self.env)
+        self.assertEqual(self.screens.get_active_screen_name(), "loading")
+        self.tick_until_switched()
+        self.assertEqual(self.screens.get_active_screen_name(), "play")
+        play_screen = self.screens.get_screen("play")
+        self.assertTrue(all(s.is_loaded() for s in play_screen.get_sprites()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import gc
+import unittest
+import weakref
+
+import pygame
+
+from game.playscreen import GameWindow
+from game.terrain import EARTH_COLOR, TUNNEL_COLOR, TerrainLayer
+from mainloop.environment import Environment
+from models.board import BoardModel
+
+BOARD_DATA = [
+    "### ### ###",
+    "#G# # #   #",
+    "### ### # #",
+    "### ### # #",
+    "# # #*# # #",
+    "### ### ###",
+]
+CELL_SIZE = (30, 24)
+
+
+class TestTerrainLayer(unittest.TestCase):
+    """Tests for the incrementally updated terrain layer"""
+
+    def setUp(self):
+        pygame.init()
+        self.board = BoardModel((3, 2), 3, BOARD_DATA)
+        self.terrain = TerrainLayer((100, 50), CELL_SIZE, self.board)
+
+    def color_at(self, lc, slot):
+        center = self.terrain.get_slot_rect(lc, slot).center
+        return tuple(self.terrain.surface.get_at(center))[:3]
+
+    def test_initial_render(self):
+        self.assertEqual(self.color_at((0, 0), (0, 0)), (255, 215, 0))
+        self.assertEqual(self.color_at((1, 1), (0, 0)), (224, 17, 95))
+        self.assertEqual(self.color_at((2, 0), (0, 0)), TUNNEL_COLOR)
+        self.assertEqual(self.color_at((2, 0), (0, 1)), TUNNEL_COLOR)
+        self.assertEqual(self.color_at((2, 0), (-1, 0)), TUNNEL_COLOR)
+        self.assertEqual(self.color_at((2, 0), (1, 0)), EARTH_COLOR)
+        # Corners are earth, the area outside the board keeps the background
+        self.assertEqual(tuple(self.terrain.surface.get_at((61, 1)))[:3], EARTH_COLOR)
+        self.assertEqual(tuple(self.terrain.surface.get_at((95, 49)))[:3], TUNNEL_COLOR)
+
+    def test_update_draws_changed_cells_only(self):
+        self.assertEqual(self.terrain.update(), [])
+        self.board.set_cell_content(((0, 0), (1, 0)), BoardModel.EMPTY)
+        self.board.set_cell_content(((0, 0), (1, 0)), BoardModel.EMPTY)
+        self.board.set_cell_content(((2, 0), (-1, 0)), BoardModel.ROCK)
+
+        rects = self.terrain.update()
+        self.assertEqual(
+            sorted(map(tuple, rects)),
+            sorted(
+                [
+                    tuple(self.terrain.get_slot_rect((0, 0), (1, 0))),
+                    tuple(self.terrain.get_slot_rect((2, 0), (-1, 0))),
+                ]
+            ),
+        )
+        self.assertEqual(self.color_at((0, 0), (1, 0)), TUNNEL_COLOR)
+        self.assertEqual(self.color_at((2, 0), (-1, 0)), EARTH_COLOR)
+        self.assertEqual(self.terrain.update(), [])
+
+    def test_slot_rects_tile_cell_center_cross(self):
+        center = self.terrain.get_slot_rect((1, 1), (0, 0))
+        self.assertEqual(center.left, self.terrain.get_slot_rect((1, 1), (-1, 0)).right)
+        self.assertEqual(center.right, self.terrain.get_slot_rect((1, 1), (1, 0)).left)
+        self.assertEqual(center.top, self.terrain.get_slot_rect((1, 1), (0, -1)).bottom)
+        self.assertEqual(center.bottom, self.terrain.get_slot_rect((1, 1), (0, 1)).top)
+
+    def test_close_stops_updates(self):
+        self.terrain.close()
+        self.board.set_cell_content(((0, 0), (1, 0)), BoardModel.EMPTY)
+        self.assertEqual(self.terrain.update(), [])
+
+    def test_dropped_layer_is_freed(self):
+        layer_ref = weakref.ref(self.terrain)
+        del self.terrain
+        gc.collect()
+        self.assertIsNone(layer_ref())
+        self.assertEqual(self.board._listeners, ())
+        # Layers rebuilt over the same board do not accumulate
+        for _ in range(3):
+            TerrainLayer((100, 50), CELL_SIZE, self.board)
+        gc.collect()
+        self.assertEqual(self.board._listeners, ())
+        self.board.set_cell_content(((0, 0), (1, 0)), BoardModel.EMPTY)
+
+    def test_close_then_free(self):
+        self.terrain.close()
+        self.terrain.close()
+        del self.terrain
+        gc.collect()
+        self.assertEqual(self.board._listeners, ())
+
+
+class TestGameWindowTerrain(unittest.TestCase):
+    """Tests for drawing the terrain layer in the game window"""
+
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((200, 100))
+        self.env = Environment(self.display)
+        self.board = BoardModel((3, 2), 3, BOARD_DATA)
+        self.window = GameWindow(
+            self.env, pygame.Rect(10, 20, 90, 48), board=self.board
+        )
+
+    def test_changed_cell_blitted(self):
+        self.window.tick([])
+        self.assertEqual(self.window.take_dirty_rects()[0], self.window.get_rect())
+
+        self.board.set_cell_content(((1, 1), (0, 0)), BoardModel.EMPTY)
+        self.window.tick([])
+        cell_rect = self.window.terrain.get_slot_rect((1, 1), (0, 0)).move(10, 20)
+        self.assertIn(cell_rect, self.window.take_dirty_rects())
+        self.assertEqual(tuple(self.display.get_at(cell_rect.center))[:3], TUNNEL_COLOR)
+
+    def test_close_stops_following_board(self):
+        self.window.close()
+        self.assertEqual(self.board._listeners, ())
+        self.board.set_cell_content(((1, 1), (0, 0)), BoardModel.EMPTY)
+        self.assertEqual(self.window.terrain.update(), [])
+
+    def test_unchanged_board_blits_sprite_areas_only(self):
+        self.window.tick([])
+        self.window.tick([])
+        self.window.take_dirty_rects()
+        self.window.tick([])
+        cell_area = self.window.cell_width * self.window.cell_height
+        for rect in self.window.take_dirty_rects():
+            self.assertLessEqual(rect.width * rect.height, cell_area)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -110,7 +110,7 @@ class TestAnimatedSprite(BaseSurfaceTest):
                 original_anchor[1] * SPRITE_SIZE[1] // original_size[1],
             ]
 
-            # Apply transformations in the same order as in AnimatedSprite._apply_transformations
+            # Apply the transformation chain step by step
             for transformation in self.animated_sprite.animation_data["transform"][
                 direction
             ]:
@@ -301,3 +301,65 @@ class TestAnimatedSprite(BaseSurfaceTest):
                     animation.current_frame_index
                 ]
                 self.assertEqual(actual_frame, expected_frame)
+
+    def test_lazy_sprite_loads_nothing_upfront(self):
+        """Test that a lazy sprite materializes no frames at construction."""
+        sprite = AnimatedSprite(self.sprite_dir, SPRITE_SIZE, lazy=True)
+        self.assertEqual(sprite.sprites, {})
+        self.assertFalse(sprite.is_loaded())
+        self.assertEqual(sprite.get_memory_size(), 0)
+
+    def test_lazy_draw_materializes_requested_frame(self):
+        """Test that drawing a lazy sprite loads only the drawn frame."""
+        sprite = AnimatedSprite(self.sprite_dir, SPRITE_SIZE, lazy=True)
+        animation = sprite.create_animation()
+        animation.set_direction("u")
+        _, anchor = sprite.get_frame("a", 0, "u")
+        animation.set_position(anchor)
+        self.surface.fill((0, 0, 0))
+        animation.draw(self.surface)
+
+        self.assertEqual(list(sprite.sprites), [("a", 0, "u")])
+        self.assertImageEquals((0, 0), self.reference_images["a_0_u"])
+
+    def test_lazy_frames_match_eager_frames(self):
+        """Test that lazily materialized frames equal the eagerly loaded ones."""
+        sprite = AnimatedSprite(self.sprite_dir, SPRITE_SIZE, lazy=True)
+        for key in reversed(list(self.animated_sprite.sprites)):
+            image, anchor = sprite.get_frame(*key)
+            expected_image, expected_anchor = self.animated_sprite.sprites[key]
+            self.assertEqual(anchor, expected_anchor)
+            self.assertEqual(
+                pygame.image.tobytes(image, "RGBA"),
+                pygame.image.tobytes(expected_image, "RGBA"),
+            )
+        self.assertTrue(sprite.is_loaded())
+
+    def test_warm_up_subset(self):
+        """Test that warm_up materializes exactly the requested frames."""
+        sprite = AnimatedSprite(self.sprite_dir, SPRITE_SIZE, lazy=True)
+        sprite.warm_up(variations=["b"], frames=[1, 2], directions=["l"])
+        self.assertEqual(set(sprite.sprites), {("b", 1, "l"), ("b", 2, "l")})
+
+        sprite.warm_up()
+        self.assertTrue(sprite.is_loaded())
+
+    def test_lazy_unknown_frame_raises_key_error(self):
+        sprite = AnimatedSprite(self.sprite_dir, SPRITE_SIZE, lazy=True)
+        with self.assertRaises(KeyError):
+            sprite.get_frame("z", 0, "r")
+        with self.assertRaises(KeyError):
+            sprite.get_frame("a", 4, "r")
+        with self.assertRaises(KeyError):
+            sprite.get_frame("a", 0, "x")
+
+    def test_lazy_bad_animation(self):
+        """Test that unknown transformations are reported without loading frames."""
+        self.assertRaises(
+            ValueError, AnimatedSprite, asset_path("bad_animation"), (1, 1), True
+        )
+
+    def test_lazy_shared_sprite_without_transform(self):
+        sprite = AnimatedSprite(asset_path("no_transform"), (1, 1), lazy=True)
+        sprite_r = sprite.get_frame("a", 0, "r")
+        self.assertIs(sprite.get_frame("a", 0, "d"), sprite_r)
@@ -1,8 +1,18 @@
+import time
 import unittest
+from unittest.mock import patch
 import pygame
 from mainloop.environment import Environment
-from mainloop.screens import Screen, Screens, Window, ExitMainLoop, View
-from mainloop.mainloop import MainLoop
+from mainloop.screens import (
+    Screen,
+    Screens,
+    Window,
+    ExitMainLoop,
+    View,
+    ScaledWindow,
+    merge_rects,
+)
+from mainloop.mainloop import MAX_UPDATES_PER_ITERATION, MainLoop
 
 # ---------- Environment Tests ----------
 
@@ -137,6 +147,126 @@ class TestMainLoop(unittest.TestCase):
             self.fail(f"MainLoop.run() raised unexpected exception in timer mode: {e}")
         self.assertEqual(screen.tick_count, 2)
 
+    def test_mainloop_hooks(self):
+        screens = Screens(self.env)
+        screen = CountingScreen(self.env, interval=10, max_ticks=2)
+        screens.add_screen("hooks", screen, make_active=True)
+        loop = MainLoop(self.env, screens, frequency=1000)
+        calls = []
+        loop.add_hook(lambda: calls.append(screen.tick_count))
+        loop.run()
+        self.assertGreaterEqual(len(calls), 2)
+        self.assertEqual(calls[0], 0)
+
+
+class EventRecordingScreen(CountingScreen):
+    def __init__(self, env, interval, max_ticks=2):
+        super().__init__(env, interval, max_ticks)
+        self.events = []
+
+    def tick(self, events):
+        self.events.extend(events)
+        super().tick(events)
+
+
+class TestPacedMainLoop(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((100, 100))
+        self.env = Environment(self.display)
+        self.screens = Screens(self.env)
+
+    def test_paced_ticks(self):
+        screen = EventRecordingScreen(self.env, interval=20, max_ticks=10)
+        self.screens.add_screen("paced", screen, make_active=True)
+        loop = MainLoop(self.env, self.screens, paced=True, spin_margin=1)
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, value=1))
+        wall, cpu = time.perf_counter(), time.process_time()
+        loop.run()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+        self.assertEqual(screen.tick_count, 10)
+        self.assertGreaterEqual(wall, 0.18)  # 9 intervals after the first tick
+        self.assertLess(cpu, wall / 2)  # Mostly asleep
+        self.assertIn(
+            (pygame.USEREVENT, 1),
+            [(e.type, getattr(e, "value", None)) for e in screen.events],
+        )
+        (stats,) = loop.get_jitter_stats()
+        self.assertEqual(stats.name, "tick")
+
+    def test_paced_excludes_timer(self):
+        with self.assertRaises(ValueError):
+            MainLoop(self.env, self.screens, use_timer=True, paced=True)
+
+
+class UpdateCountingScreen(Screen):
+    def __init__(self, env, interval):
+        super().__init__(env, interval)
+        self.update_count = 0
+
+    def update(self):
+        self.update_count += 1
+
+
+class TestFixedUpdates(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((100, 100))
+        self.env = Environment(self.display)
+        self.screens = Screens(self.env)
+        self.screen = UpdateCountingScreen(self.env, interval=10)
+        self.screens.add_screen("counting", self.screen, make_active=True)
+        self.loop = MainLoop(self.env, self.screens, update_interval=10)
+
+    def run_updates_at(self, now):
+        with patch("pygame.time.get_ticks", return_value=now):
+            return self.loop.run_updates()
+
+    def test_updates_follow_time(self):
+        self.assertEqual(self.run_updates_at(1000), 0)
+        self.assertEqual(self.env.alpha, 0.0)
+        self.assertEqual(self.run_updates_at(1025), 2)
+        self.assertEqual(self.env.alpha, 0.5)
+        self.assertEqual(self.run_updates_at(1029), 0)
+        self.assertAlmostEqual(self.env.alpha, 0.9)
+        self.assertEqual(self.run_updates_at(1031), 1)
+        self.assertEqual(self.screen.update_count, 3)
+
+    def test_catch_up_is_limited(self):
+        self.run_updates_at(0)
+        self.assertEqual(self.run_updates_at(1003), MAX_UPDATES_PER_ITERATION)
+        self.assertAlmostEqual(self.env.alpha, 0.3)
+        self.assertEqual(self.run_updates_at(1013), 1)
+
+    def test_screens_update_windows_and_views(self):
+        class CountingView(View):
+            def __init__(self):
+                super().__init__()
+                self.update_count = 0
+
+            def tick(self):
+                pass
+
+            def update(self):
+                self.update_count += 1
+
+        screen = Screen(self.env, 10)
+        window = DummyWindow(self.env)
+        view = CountingView()
+        window.add_view(0, view)
+        screen.add_window(0, window)
+        self.screens.add_screen("views", screen, make_active=True)
+        self.screens.update()
+        self.assertEqual(view.update_count, 1)
+
+    def test_alpha_unset_without_fixed_updates(self):
+        screen = CountingScreen(self.env, interval=0, max_ticks=2)
+        self.screens.add_screen("polling", screen, make_active=True)
+        MainLoop(self.env, self.screens).run()
+        self.assertIsNone(self.env.alpha)
+
 
 # ---------- Window Tests ----------
 
@@ -209,6 +339,143 @@ class TestWindowIntegration(unittest.TestCase):
             w.tick([])
 
 
+# ---------- Dirty Rect Tests ----------
+
+
+class DirtyWindow(Window):
+    """Window which redraws fully only while invalid and then reports given rects."""
+
+    tracks_dirty_rects = True
+
+    def __init__(self, env):
+        super().__init__(env)
+        self.changes = []
+        self.full_redraws = 0
+
+    def tick(self, events):
+        if not self.is_valid():
+            self.full_redraws += 1
+            self.mark_dirty()
+            self.validate()
+        for rect in self.changes:
+            self.mark_dirty(rect)
+        self.changes = []
+
+
+class TestDirtyRects(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((100, 100))
+        self.env = Environment(self.display)
+        self.screen = DummyScreenWithWindows(self.env, 100)
+        self.window = DirtyWindow(self.env)
+        self.window.set_rect(pygame.Rect(0, 0, 50, 50))
+        self.screen.add_window(0, self.window)
+
+    def tick(self):
+        with patch("pygame.display.update") as update, patch(
+            "pygame.display.flip"
+        ) as flip:
+            self.screen.tick([])
+        return update, flip
+
+    def test_merge_rects(self):
+        rects = [
+            pygame.Rect(0, 0, 10, 10),
+            pygame.Rect(20, 0, 10, 10),
+            pygame.Rect(5, 5, 20, 2),  # Joins both above
+            pygame.Rect(50, 50, 5, 5),
+            pygame.Rect(60, 60, 0, 5),  # Empty
+        ]
+        self.assertEqual(
+            merge_rects(rects),
+            [pygame.Rect(0, 0, 30, 10), pygame.Rect(50, 50, 5, 5)],
+        )
+        self.assertEqual(merge_rects([]), [])
+
+    def test_small_changes_update_rects(self):
+        """Test that only the changed regions are presented after the first tick."""
+        self.tick()
+        self.window.changes = [pygame.Rect(1, 1, 4, 4), pygame.Rect(3, 3, 4, 4)]
+        update, flip = self.tick()
+        update.assert_called_once_with([pygame.Rect(1, 1, 6, 6)])
+        flip.assert_not_called()
+        self.assertEqual(self.window.full_redraws, 1)
+
+    def test_large_changes_flip(self):
+        self.window.changes = [pygame.Rect(0, 0, 100, 80)]
+        update, flip = self.tick()
+        flip.assert_called_once()
+        update.assert_not_called()
+
+    def test_nothing_presented_without_changes(self):
+        self.tick()
+        update, flip = self.tick()
+        update.assert_not_called()
+        flip.assert_not_called()
+
+    def test_rects_clipped_to_display(self):
+        self.tick()
+        self.window.changes = [pygame.Rect(95, 95, 10, 10)]
+        update, _ = self.tick()
+        update.assert_called_once_with([pygame.Rect(95, 95, 5, 5)])
+
+    def test_untracked_window_presented_whole(self):
+        window = DummyWindow(self.env)
+        window.set_rect(pygame.Rect(60, 60, 10, 10))
+        self.screen.add_window(1, window)
+        self.tick()
+        update, _ = self.tick()
+        update.assert_called_once_with([pygame.Rect(60, 60, 10, 10)])
+
+    def test_queued_blits_drawn_at_once(self):
+        self.tick()
+        image = pygame.Surface((4, 4))
+        image.fill((255, 0, 0))
+        self.window.queue_blit(image, (10, 10))
+        self.window.queue_blit(image, (12, 12))
+        self.assertEqual(
+            self.window.tick_views(),
+            [pygame.Rect(10, 10, 4, 4), pygame.Rect(12, 12, 4, 4)],
+        )
+        self.assertEqual(self.display.get_at((15, 15)), (255, 0, 0))
+        update, _ = self.tick()
+        update.assert_called_once_with([pygame.Rect(10, 10, 6, 6)])
+
+    def test_scaled_window(self):
+        inner = DirtyWindow(Environment(pygame.Surface((10, 10))))
+        inner.env.display.fill((255, 0, 0))
+        scaled = ScaledWindow(self.env, pygame.Rect(50, 50, 40, 40), inner)
+        scaled.tick([])
+        self.assertEqual(scaled.take_dirty_rects(), [pygame.Rect(50, 50, 40, 40)])
+        self.assertEqual(self.display.get_at((89, 89)), (255, 0, 0))
+
+        scaled.tick([])  # Nothing changed inside
+        self.assertEqual(scaled.take_dirty_rects(), [])
+        inner.changes = [pygame.Rect(0, 0, 1, 1)]
+        scaled.tick([])
+        self.assertEqual(len(scaled.take_dirty_rects()), 1)
+
+        scaled.invalidate()
+        self.assertFalse(inner.is_valid())
+
+    def test_activating_screen_invalidates_windows(self):
+        screens = Screens(self.env)
+        screens.add_screen("dirty", self.screen, make_active=True)
+        screens.add_screen("other", DummyScreen(self.env, 100))
+        self.tick()
+        screens.set_active_screen("other")
+        screens.set_active_screen("dirty")
+        self.assertFalse(self.window.is_valid())
+        self.tick()
+        self.assertEqual(self.window.full_redraws, 2)
+
+    def test_set_rect_invalidates(self):
+        self.tick()
+        self.window.set_rect(pygame.Rect(10, 10, 20, 20))
+        self.assertFalse(self.window.is_valid())
+
+
 # ---------- Window Geometry Tests ----------
 
 
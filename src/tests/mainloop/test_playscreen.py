@@ -1,7 +1,11 @@
+import gc
 import unittest
+from unittest.mock import patch
 import pygame
 from game.playscreen import PlayScreen, BackgroundWindow, GameWindow, StatusWindow
 from mainloop.environment import Environment
+from mainloop.screens import ScaledWindow
+from views.hobbin_view import HobbinView
 
 
 class TestBackgroundWindow(unittest.TestCase):
@@ -97,6 +101,49 @@ class TestBackgroundWindow(unittest.TestCase):
         # Color should remain unchanged
         self.assertEqual(self.background_window.rect_color, initial_color)
 
+    def test_background_drawn_from_cached_layer(self):
+        """Test that the background is rendered once and then skipped"""
+        with patch.object(
+            self.background_window,
+            "_render_layer",
+            wraps=self.background_window._render_layer,
+        ) as render:
+            self.background_window.tick([])
+            self.background_window.tick([])
+            self.background_window.invalidate()
+            self.background_window.tick([])
+        render.assert_called_once()
+        for rect in self.background_rects:
+            self.assertEqual(self.display.get_at(rect.center)[:3], (0, 0, 0))
+
+    def test_valid_background_not_redrawn(self):
+        self.background_window.tick([])
+        self.background_window.take_dirty_rects()
+        self.display.fill((1, 2, 3))
+        self.background_window.tick([])
+        self.assertEqual(self.background_window.take_dirty_rects(), [])
+        self.assertEqual(self.display.get_at((500, 100))[:3], (1, 2, 3))
+
+    def test_color_change_redraws_background(self):
+        self.background_window.tick([])
+        self.background_window.take_dirty_rects()
+        self.background_window.tick(
+            [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+        )
+        self.assertEqual(
+            self.background_window.take_dirty_rects(), self.background_rects
+        )
+        for rect in self.background_rects:
+            self.assertEqual(self.display.get_at(rect.center)[:3], (255, 255, 255))
+
+    def test_layout_change_redraws_background(self):
+        self.background_window.tick([])
+        self.background_window.take_dirty_rects()
+        new_rects = [pygame.Rect(0, 0, 10, 10)]
+        self.background_window.set_background_rects(new_rects)
+        self.background_window.tick([])
+        self.assertEqual(self.background_window.take_dirty_rects(), new_rects)
+
 
 class TestPlayScreenGetters(unittest.TestCase):
     """Test cases for PlayScreen getter methods"""
@@ -155,5 +202,127 @@ class TestPlayScreenGetters(unittest.TestCase):
         self.assertEqual(self.play_screen.background_window.rect_color, (255, 0, 0))
 
 
+class TestPlayScreenDirtyRects(unittest.TestCase):
+    """Test cases for presenting only the changed parts of the play screen"""
+
+    def setUp(self):
+        self.display = pygame.display.set_mode((800, 600))
+        self.env = Environment(self.display)
+        self.play_screen = PlayScreen(self.env, interval=60)
+
+    def test_game_window_redraws_only_sprites(self):
+        """Test that after the first tick the game window reports sprite areas only"""
+        game_window = self.play_screen.game_window
+        game_window.tick([])
+        self.assertEqual(game_window.take_dirty_rects()[0], game_window.get_rect())
+
+        game_window.tick([])
+        rects = game_window.take_dirty_rects()
+        self.assertTrue(rects)
+        cell_area = game_window.cell_width * game_window.cell_height
+        for rect in rects:
+            self.assertLessEqual(rect.width * rect.height, cell_area)
+
+    def test_second_tick_updates_sprite_areas_only(self):
+        self.play_screen.tick([])
+        with patch("pygame.display.update") as update, patch(
+            "pygame.display.flip"
+        ) as flip:
+            self.play_screen.tick([])
+        flip.assert_not_called()
+        update.assert_called_once()
+
+    def test_status_window_drawn_once(self):
+        status_window = self.play_screen.status_window
+        status_window.tick([])
+        self.assertEqual(len(status_window.take_dirty_rects()), 1)
+        status_window.tick([])
+        self.assertEqual(status_window.take_dirty_rects(), [])
+
+
+class TestLogicalResolution(unittest.TestCase):
+    """Test cases for drawing the board at a logical resolution"""
+
+    def setUp(self):
+        self.display = pygame.display.set_mode((800, 600))
+        self.env = Environment(self.display)
+        self.play_screen = PlayScreen(self.env, interval=60, logical_cell_size=(8, 8))
+
+    def test_board_drawn_at_logical_size(self):
+        game_window = self.play_screen.game_window
+        self.assertEqual(game_window.env.display.get_size(), (15 * 8, 10 * 8))
+        self.assertEqual((game_window.cell_width, game_window.cell_height), (8, 8))
+
+    def test_board_scaled_to_game_rect(self):
+        self.play_screen.tick([])
+        (scaled,) = [
+            window
+            for _, window in self.play_screen.get_windows()
+            if isinstance(window, ScaledWindow)
+        ]
+        rect = scaled.get_rect()
+        self.assertGreater(rect.width, 15 * 8)
+        # Terrain top-left corner (earth) is scaled to the game rect corner
+        self.assertEqual(
+            self.display.get_at(rect.topleft),
+            self.play_screen.game_window.env.display.get_at((0, 0)),
+        )
+
+        # Animated views change the board, so it is scaled on every tick
+        scaled.tick([])
+        self.assertEqual(scaled.take_dirty_rects(), [rect])
+
+
+class TestProfilerOverlay(unittest.TestCase):
+    """Test cases for the frame-time profiler toggled in the status window"""
+
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((800, 600))
+        self.env = Environment(self.display)
+        self.play_screen = PlayScreen(self.env, interval=60)
+
+    def press_profiler_key(self):
+        event = pygame.event.Event(pygame.KEYDOWN, key=StatusWindow.PROFILER_KEY)
+        self.play_screen.tick([event])
+
+    def test_toggle_profiler(self):
+        self.press_profiler_key()
+        self.assertIsNotNone(self.env.profiler)
+        self.play_screen.tick([])
+        names = [stats.name for stats in self.env.profiler.get_stats()]
+        self.assertIn("GameWindow#1", names)
+        self.assertIn("BackgroundWindow#1", names)
+        self.assertIn("hobbin#1", names)
+
+        self.press_profiler_key()
+        self.assertIsNone(self.env.profiler)
+        # Overlay cleared
+        status_window = self.play_screen.status_window
+        rect = status_window.get_rect()
+        for x in range(rect.left, rect.right):
+            self.assertEqual(self.display.get_at((x, rect.top + 5)), (0, 0, 255))
+
+    def test_despawned_view_leaves_profiler(self):
+        self.press_profiler_key()
+        game_window = self.play_screen.game_window
+        spawned = HobbinView(
+            game_window.sprites["hobbin"],
+            (game_window.cell_width, game_window.cell_height),
+        )
+        game_window.add_view(10, spawned)
+        self.play_screen.tick([])
+        names = [stats.name for stats in self.env.profiler.get_stats()]
+        self.assertIn("hobbin#2", names)
+
+        game_window.remove_view(spawned)
+        del spawned
+        gc.collect()
+        self.play_screen.tick([])
+        names = [stats.name for stats in self.env.profiler.get_stats()]
+        self.assertNotIn("hobbin#2", names)
+        self.assertIn("hobbin#1", names)
+
+
 if __name__ == "__main__":
     unittest.main()
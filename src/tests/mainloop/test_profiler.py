@@ -0,0 +1,48 @@
+import gc
+import unittest
+
+from mainloop.profiler import FrameProfiler
+
+
+class Labelled:
+    pass
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def test_rolling_stats(self):
+        profiler = FrameProfiler(window=3)
+        for ms in (10.0, 1.0, 2.0, 3.0):  # The first sample drops out
+            profiler.record("slow", ms)
+        profiler.record("fast", 0.5)
+        stats = profiler.get_stats()
+        self.assertEqual([s.name for s in stats], ["slow", "fast"])
+        self.assertAlmostEqual(stats[0].mean_ms, 2.0)
+        self.assertEqual(stats[0].max_ms, 3.0)
+        self.assertEqual(profiler.get_top(1), stats[:1])
+
+    def test_labels(self):
+        profiler = FrameProfiler()
+        first, second = Labelled(), Labelled()
+        self.assertEqual(profiler.label(first, "view"), "view#1")
+        self.assertEqual(profiler.label(second, "view"), "view#2")
+        self.assertEqual(profiler.label(first, "view"), "view#1")
+
+    def test_samples_dropped_with_object(self):
+        profiler = FrameProfiler()
+        kept, dropped = Labelled(), Labelled()
+        profiler.record(profiler.label(kept, "view"), 1.0)
+        profiler.record(profiler.label(dropped, "view"), 2.0)
+        del dropped
+        gc.collect()
+        self.assertEqual([s.name for s in profiler.get_stats()], ["view#1"])
+
+    def test_elapsed(self):
+        profiler = FrameProfiler()
+        profiler.elapsed("tick", profiler.timer())
+        self.assertEqual(len(profiler.get_stats()), 1)
+        profiler.reset()
+        self.assertEqual(profiler.get_stats(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+import unittest
+import pygame
+from pygame._sdl2.video import Renderer, Window
+
+from mainloop.environment import Environment
+from mainloop.render import SurfaceBackend
+from mainloop.render_sdl2 import TextureBackend
+
+
+class TestSurfaceBackend(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.display = pygame.display.set_mode((100, 100))
+
+    def test_default_backend(self):
+        env = Environment(self.display)
+        self.assertIsInstance(env.backend, SurfaceBackend)
+
+    def test_draw_many(self):
+        image = pygame.Surface((4, 4))
+        image.fill((255, 0, 0))
+        rects = SurfaceBackend(self.display).draw_many([(image, (10, 20))])
+        self.assertEqual(rects, [pygame.Rect(10, 20, 4, 4)])
+        self.assertEqual(self.display.get_at((11, 21)), (255, 0, 0))
+
+
+class TestTextureBackend(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.window = Window("test", (100, 100), hidden=True)
+        self.renderer = Renderer(self.window)
+        self.display = pygame.Surface((100, 100))
+        self.backend = TextureBackend(self.renderer, self.display)
+        self.image = pygame.Surface((4, 4))
+        self.image.fill((255, 0, 0))
+
+    def tearDown(self):
+        self.window.destroy()
+
+    def test_sprites_drawn_over_display(self):
+        self.display.fill((0, 0, 255))
+        rects = self.backend.draw_many([(self.image, (10, 20))])
+        self.assertEqual(rects, [pygame.Rect(10, 20, 4, 4)])
+        self.assertEqual(self.display.get_at((11, 21)), (0, 0, 255))
+        self.backend.present(rects, full=False)
+        frame = self.renderer.to_surface()
+        self.assertEqual(frame.get_at((11, 21)), (255, 0, 0))
+        self.assertEqual(frame.get_at((50, 50)), (0, 0, 255))
+
+    def test_only_changed_regions_uploaded(self):
+        self.backend.present([], full=True)
+        self.display.fill((0, 255, 0))
+        self.backend.present([pygame.Rect(0, 0, 10, 10)], full=False)
+        frame = self.renderer.to_surface()
+        self.assertEqual(frame.get_at((5, 5)), (0, 255, 0))
+        self.assertEqual(frame.get_at((50, 50)), (0, 0, 0))
+
+    def test_sprites_clipped(self):
+        rects = self.backend.draw_many(
+            [(self.image, (8, 8)), (self.image, (50, 50))], pygame.Rect(0, 0, 10, 10)
+        )
+        self.assertEqual(rects, [pygame.Rect(8, 8, 2, 2)])
+        self.backend.present(rects, full=True)
+        frame = self.renderer.to_surface()
+        self.assertEqual(frame.get_at((9, 9)), (255, 0, 0))
+        self.assertEqual(frame.get_at((10, 10)), (0, 0, 0))
+
+    def test_textures_uploaded_once(self):
+        texture = self.backend.get_texture(self.image)
+        self.assertIs(self.backend.get_texture(self.image), texture)
+
+
+class TestSoftwarePathImports(unittest.TestCase):
+    def test_works_without_sdl2(self):
+        """The software renderer and the game import without pygame._sdl2."""
+        script = (
+            "import sys\n"
+            "sys.modules['pygame._sdl2.video'] = None\n"
+            "import mainloop.environment, game.main, game.benchmark\n"
+        )
+        src_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=os.path.abspath(src_dir),
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import unittest
+import pygame
+
+from mainloop.environment import Environment
+from mainloop.screens import View, Window
+from mainloop.view_index import SpatialGrid, ViewRegistry
+
+
+class BoxView(View):
+    def __init__(self, bounds):
+        super().__init__()
+        self.bounds = bounds
+
+    def tick(self):
+        pass
+
+    def get_bounds(self):
+        return self.bounds
+
+    def move_to(self, bounds):
+        self.bounds = bounds
+        self.get_window().update_view_bounds(self)
+
+
+class IndexedWindow(Window):
+    def tick(self, events):
+        self.tick_views()
+
+
+class TestViewRegistry(unittest.TestCase):
+    def test_order_after_many_changes(self):
+        registry = ViewRegistry()
+        for i in range(100):
+            registry.add(i % 7, i)
+        for i in range(0, 100, 3):
+            self.assertTrue(registry.remove(i))
+        self.assertFalse(registry.remove(0))
+        expected = sorted(
+            ((i % 7, i) for i in range(100) if i % 3), key=lambda pair: pair
+        )
+        self.assertEqual(list(registry), expected)
+
+    def test_readd_moves_view(self):
+        registry = ViewRegistry()
+        registry.add(1, "a")
+        registry.add(2, "b")
+        registry.add(3, "a")
+        self.assertEqual(list(registry), [(2, "b"), (3, "a")])
+        self.assertEqual(len(registry), 2)
+
+
+class TestSpatialGrid(unittest.TestCase):
+    def test_move_and_remove(self):
+        grid = SpatialGrid((10, 10))
+        grid.update("a", pygame.Rect(0, 0, 5, 5))
+        self.assertEqual(grid.at_point((2, 2)), ["a"])
+        grid.update("a", pygame.Rect(50, 50, 5, 5))
+        self.assertEqual(grid.at_point((2, 2)), [])
+        self.assertEqual(grid.query(pygame.Rect(45, 45, 10, 10)), {"a"})
+        grid.remove("a")
+        self.assertEqual(len(grid), 0)
+        self.assertEqual(grid.query(pygame.Rect(0, 0, 100, 100)), set())
+
+    def test_negative_coordinates(self):
+        grid = SpatialGrid((10, 10))
+        grid.update("a", pygame.Rect(-15, -5, 10, 10))
+        self.assertEqual(grid.at_point((-10, 0)), ["a"])
+        self.assertEqual(grid.query(pygame.Rect(0, 0, 10, 10)), set())
+
+
+class TestWindowSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.env = Environment(pygame.display.set_mode((100, 100)))
+        self.window = IndexedWindow(self.env)
+        self.window.enable_spatial_index((10, 10))
+
+    def test_query_and_pick(self):
+        low = BoxView(pygame.Rect(0, 0, 20, 20))
+        high = BoxView(pygame.Rect(10, 10, 20, 20))
+        far = BoxView(pygame.Rect(80, 80, 10, 10))
+        unindexed = View()
+        self.window.add_view(5, high)
+        self.window.add_view(1, low)
+        self.window.add_view(1, far)
+        self.window.add_view(0, unindexed)
+
+        self.assertEqual(
+            self.window.get_views_in(pygame.Rect(0, 0, 50, 50)), [low, high]
+        )
+        self.assertEqual(self.window.get_views_at((15, 15)), [high, low])
+
+        far.move_to(pygame.Rect(12, 12, 4, 4))
+        self.assertEqual(self.window.get_views_at((13, 13)), [high, far, low])
+
+        self.window.remove_view(high)
+        self.assertEqual(self.window.get_views_at((13, 13)), [far, low])
+
+    def test_index_enabled_later(self):
+        window = IndexedWindow(self.env)
+        view = BoxView(pygame.Rect(0, 0, 5, 5))
+        window.add_view(0, view)
+        with self.assertRaises(RuntimeError):
+            window.get_views_at((1, 1))
+        window.enable_spatial_index((10, 10))
+        self.assertEqual(window.get_views_at((1, 1)), [view])
+
+
+class SpawningView(View):
+    """Adds a view and removes views on its first tick or update."""
+
+    def __init__(self, log, name, spawn=None, remove=()):
+        super().__init__()
+        self.log, self.name = log, name
+        self.spawn, self.remove = spawn, list(remove)
+
+    def tick(self):
+        self.act()
+
+    def update(self):
+        self.act()
+
+    def act(self):
+        self.log.append(self.name)
+        window = self.get_window()
+        while self.remove:
+            window.remove_view(self.remove.pop())
+        if self.spawn is not None:
+            window.add_view(0, self.spawn)
+            self.spawn = None
+
+
+class TestViewChangesWhileTicking(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.env = Environment(pygame.display.set_mode((100, 100)))
+        self.log = []
+        self.window = IndexedWindow(self.env)
+        self.window.enable_spatial_index((10, 10))
+        despawn = SpawningView(self.log, "despawn")
+        despawn.remove.append(despawn)
+        spawned = SpawningView(self.log, "spawned")
+        removed = SpawningView(self.log, "removed")
+        self.window.add_view(0, despawn)
+        self.window.add_view(1, SpawningView(self.log, "spawner", spawn=spawned))
+        self.window.add_view(2, SpawningView(self.log, "remover", remove=[removed]))
+        self.window.add_view(3, removed)
+
+    def check(self, step):
+        step()
+        self.assertEqual(self.log, ["despawn", "spawner", "remover"])
+        names = [view.name for _, view in self.window.get_views()]
+        self.assertEqual(names, ["spawned", "spawner", "remover"])
+        self.log.clear()
+        step()
+        self.assertEqual(self.log, ["spawned", "spawner", "remover"])
+
+    def test_tick_views(self):
+        self.check(self.window.tick_views)
+
+    def test_update(self):
+        self.check(self.window.update)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from models.board import BoardModel
+from models.board import DIRECTIONS, SLOTS, SLOTS_PER_CELL, BoardModel
 
 
 class TestBoardModel(unittest.TestCase):
@@ -24,6 +24,7 @@ class TestBoardModel(unittest.TestCase):
             "### ### ### ### ###",
         ]
         self.board = BoardModel(self.size, self.cell_size, self.data)
+        self.initial_cells = bytes(self.board.cells)
 
     def test_initialization(self):
         self.assertEqual(self.board.size, self.size)
@@ -100,6 +101,96 @@ class TestBoardModel(unittest.TestCase):
         self.board.set_cell_content(((0, 0), (0, 0)), BoardModel.RUBY)
         self.assertEqual(self.board.get_cell_content(((0, 0), (0, 0))), BoardModel.RUBY)
 
+    def test_compact_storage(self):
+        self.assertEqual(len(self.board.cells), 5 * 5 * SLOTS_PER_CELL)
+        offset = self.board.cell_offset((1, 0))
+        self.assertEqual(offset, SLOTS_PER_CELL)
+        self.board.set_cell_content(((1, 0), (0, 1)), BoardModel.GOLD)
+        self.assertEqual(
+            self.board.cells[offset + SLOTS.index((0, 1))], BoardModel.GOLD
+        )
+        self.assertEqual(self.board.cells[0], BoardModel.GOLD)  # "G" at (0, 0)
+
+    def test_off_road_cells(self):
+        self.assertEqual(
+            self.board.get_cell_content(((1, 1), (1, 1))), BoardModel.EMPTY
+        )
+        with self.assertRaises(ValueError):
+            self.board.set_cell_content(((1, 1), (1, 1)), BoardModel.ROCK)
+
+    def valid_sc_coords(self, board):
+        half = board.half_cell_size
+        for bx in range(board.size[0]):
+            for by in range(board.size[1]):
+                for m in range(-half, half + 1):
+                    for mx, my in {(m, 0), (0, m)}:
+                        if (
+                            (bx == 0 and mx < 0)
+                            or (by == 0 and my < 0)
+                            or (bx == board.size[0] - 1 and mx > 0)
+                            or (by == board.size[1] - 1 and my > 0)
+                        ):
+                            continue
+                        yield (bx, by), (mx, my)
+
+    def test_sc_ids(self):
+        for cell_size in (1, 3, 7):
+            board = BoardModel(self.size, cell_size, self.data)
+            ids = set()
+            for coords in self.valid_sc_coords(board):
+                sc_id = board.sc_to_id(coords)
+                self.assertEqual(board.id_to_sc(sc_id), coords)
+                self.assertLess(sc_id, board.sc_count)
+                ids.add(sc_id)
+                self.assertEqual(
+                    board.get_cell_content_id(sc_id), board.get_cell_content(coords)
+                )
+            self.assertEqual(len(ids), len(list(self.valid_sc_coords(board))))
+
+    def test_step_table(self):
+        board = BoardModel(self.size, 5, self.data)
+        for coords in self.valid_sc_coords(board):
+            sc_id = board.sc_to_id(coords)
+            for direction_index, direction in enumerate(DIRECTIONS):
+                expected = board.step(coords, direction)
+                next_id = board.step_id(sc_id, direction_index)
+                if expected is None:
+                    self.assertEqual(next_id, -1)
+                else:
+                    self.assertEqual(board.id_to_sc(next_id), expected)
+
+    def test_cells_off_the_board(self):
+        # The board is 5x5; every large cell off it raises, never another cell
+        for lc in [(5, 0), (0, 5), (-1, 0), (0, -1), (5, 5), (-1, -1), (10, 2)]:
+            with self.assertRaises(IndexError):
+                self.board.cell_offset(lc)
+            with self.assertRaises(IndexError):
+                self.board.get_cell_content((lc, (0, 0)))
+            with self.assertRaises(IndexError):
+                self.board.get_cell_content((lc, (1, 1)))  # Also off the roads
+            with self.assertRaises(IndexError):
+                self.board.set_cell_content((lc, (0, 0)), BoardModel.ROCK)
+            with self.assertRaises(IndexError):
+                self.board.set_cell_content((lc, (1, 1)), BoardModel.ROCK)
+            with self.assertRaises(IndexError):
+                self.board.sc_to_id((lc, (0, 0)))
+        self.assertEqual(self.board.cell_offset((4, 4)), 24 * SLOTS_PER_CELL)
+        self.assertEqual(
+            self.board.get_cell_content(((4, 4), (0, 0))), BoardModel.EMPTY
+        )
+        self.assertEqual(bytes(self.board.cells), self.initial_cells)
+
+    def test_ids_off_the_board(self):
+        last = self.board.sc_count - 1
+        self.assertEqual(self.board.step_id(last, len(DIRECTIONS) - 1), -1)
+        self.board.get_cell_content_id(last)
+        for sc_id, direction_index in [(-1, 0), (last + 1, 0), (0, -1), (0, 4)]:
+            with self.assertRaises(IndexError):
+                self.board.step_id(sc_id, direction_index)
+        for sc_id in [-1, last + 1]:
+            with self.assertRaises(IndexError):
+                self.board.get_cell_content_id(sc_id)
+
     def test_lc_to_sc_center(self):
         self.assertEqual(self.board.lc_to_sc_center((0, 0)), ((0, 0), (0, 0)))
         self.assertEqual(self.board.lc_to_sc_center((1, 1)), ((1, 1), (0, 0)))
@@ -139,6 +230,37 @@ class TestBoardModel(unittest.TestCase):
         self.assertIsNone(self.board.step(((4, 4), (0, 0)), "r"))
         self.assertIsNone(self.board.step(((4, 4), (0, 0)), "d"))
 
+    def test_change_listeners(self):
+        changes = []
+        self.board.add_change_listener(lambda lc, slot: changes.append((lc, slot)))
+        self.board.set_cell_content(((1, 2), (0, -1)), BoardModel.EMPTY)
+        self.board.set_cell_content(((1, 2), (0, -1)), BoardModel.EMPTY)
+        self.board.set_cell_content(((1, 2), (0, 0)), BoardModel.GOLD)
+        # Setting the same content again is not a change
+        self.assertEqual(changes, [((1, 2), (0, -1)), ((1, 2), (0, 0))])
+
+    def test_listener_removed_while_notified(self):
+        changes = []
+
+        def once(lc, slot):
+            self.board.remove_change_listener(once)
+            changes.append("once")
+
+        self.board.add_change_listener(once)
+        self.board.add_change_listener(lambda lc, slot: changes.append("always"))
+        self.board.set_cell_content(((1, 2), (0, 0)), BoardModel.GOLD)
+        self.board.set_cell_content(((1, 2), (0, 0)), BoardModel.EMPTY)
+        self.assertEqual(changes, ["once", "always", "always"])
+
+    def test_remove_change_listener(self):
+        changes = []
+        listener = changes.append
+        self.board.add_change_listener(lambda lc, slot: listener(lc))
+        self.board.add_change_listener(listener)
+        self.board.remove_change_listener(listener)
+        self.board.set_cell_content(((0, 0), (1, 0)), BoardModel.EMPTY)
+        self.assertEqual(changes, [(0, 0)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,109 @@
+import random
+import unittest
+
+import numpy as np
+
+from models.board import SLOTS, BoardModel
+from models.board_array import (
+    CENTER,
+    DOWN,
+    assign_contents,
+    board_array,
+    count_content,
+    dug_cells,
+    gold_over_empty,
+)
+
+
+class TestBoardArray(unittest.TestCase):
+    def setUp(self):
+        self.data = [
+            "### ### ### ###",
+            "#G# #G#   # # #",
+            "### # # # # ###",
+            "### # # # # ###",
+            "# #         #H#",
+            "### ### ### ###",
+        ]
+        self.board = BoardModel((4, 2), 3, self.data)
+
+    def test_matches_board(self):
+        contents = board_array(self.board)
+        self.assertEqual(contents.shape, (2, 4, 5))
+        self.assertEqual(contents.dtype, np.uint8)
+        for by in range(2):
+            for bx in range(4):
+                for slot_index, slot in enumerate(SLOTS):
+                    self.assertEqual(
+                        contents[by, bx, slot_index],
+                        self.board.get_cell_content(((bx, by), slot)),
+                    )
+
+    def test_shares_memory(self):
+        contents = board_array(self.board)
+        self.board.set_cell_content(((3, 0), (0, 1)), BoardModel.EMPTY)
+        self.assertEqual(contents[0, 3, DOWN], BoardModel.EMPTY)
+        contents[1, 0, CENTER] = BoardModel.GOLD
+        self.assertEqual(self.board.get_cell_content(((0, 1), (0, 0))), BoardModel.GOLD)
+
+    def test_queries(self):
+        self.assertEqual(count_content(self.board, BoardModel.GOLD), 2)
+        self.assertEqual(count_content(self.board, BoardModel.HOBBIN_START), 1)
+        self.assertEqual(
+            dug_cells(self.board).tolist(),
+            [[False, False, True, True], [True, True, True, True]],
+        )
+        # Only the second bag has an open road down
+        self.assertEqual(
+            gold_over_empty(self.board).tolist(),
+            [[False, True, False, False], [False, False, False, False]],
+        )
+
+    def test_queries_match_loops(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            bx, by = rng.randrange(4), rng.randrange(2)
+            slot = rng.choice(SLOTS)
+            if (by == 0 and slot == (0, -1)) or (by == 1 and slot == (0, 1)):
+                continue
+            content = rng.choice((BoardModel.EMPTY, BoardModel.GOLD, BoardModel.ROCK))
+            self.board.set_cell_content(((bx, by), slot), content)
+
+        def get(bx, by, slot):
+            return self.board.get_cell_content(((bx, by), slot))
+
+        gold = sum(
+            get(bx, by, (0, 0)) == BoardModel.GOLD for bx in range(4) for by in range(2)
+        )
+        self.assertEqual(count_content(self.board, BoardModel.GOLD), gold)
+        falling = gold_over_empty(self.board)
+        for bx in range(4):
+            self.assertFalse(falling[1, bx])
+            self.assertEqual(
+                falling[0, bx],
+                get(bx, 0, (0, 0)) == BoardModel.GOLD
+                and get(bx, 0, (0, 1)) == BoardModel.EMPTY
+                and get(bx, 1, (0, -1)) == BoardModel.EMPTY
+                and get(bx, 1, (0, 0)) == BoardModel.EMPTY,
+            )
+
+    def test_assign_contents(self):
+        changes = []
+        self.board.add_change_listener(lambda lc, slot: changes.append((lc, slot)))
+        contents = board_array(self.board).copy()
+        contents[dug_cells(self.board)] = BoardModel.ROCK  # Fill all tunnels
+        changed = assign_contents(self.board, contents)
+        self.assertEqual(changed, len(changes))
+        self.assertIn(((2, 0), (0, 0)), changes)
+        self.assertIn(((2, 0), (0, 1)), changes)
+        self.assertNotIn(((0, 0), (0, 0)), changes)
+        self.assertFalse(dug_cells(self.board).any())
+        self.assertEqual(assign_contents(self.board, contents), 0)
+
+    def test_assign_contents_shape(self):
+        with self.assertRaises(ValueError):
+            assign_contents(self.board, np.zeros((4, 2, 5), dtype=np.uint8))
+
+
+if __name__ == "__main__":
+    unittest.main()
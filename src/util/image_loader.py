@@ -3,12 +3,13 @@ import os
 from typing import Union
 from io import BytesIO
 import pygame
-from fs.zipfs import ZipFS
+from util.zip_pool import ZIP_POOL, split_zip_path
 
 
 def load_image(path: Union[str, os.PathLike[str]]) -> pygame.Surface:
     """
     Loads an image from a regular file or from inside a ZIP archive.
+    Archives are opened once and kept in the shared ZIP_POOL.
 
     Examples:
         >>> import tempfile, zipfile, pygame
@@ -28,16 +29,14 @@ def load_image(path: Union[str, os.PathLike[str]]) -> pygame.Surface:
         ...     zip_inner_path = zip_path.replace("\\\\", "/") + "/inner.png"
         ...     img2 = load_image(zip_inner_path)
         ...     assert isinstance(img2, pygame.Surface)
+        ...     ZIP_POOL.close_all()
     """
-    path_str = str(path).replace("\\", "/")
-    zip_marker = ".zip/"
-    if zip_marker in path_str:
-        zip_path, inner_path = path_str.split(zip_marker, 1)
-        zip_path += ".zip"
-        zip_path = os.path.abspath(os.path.expanduser(zip_path))
-        zip_fs = ZipFS(zip_path)
-        with zip_fs.openbin(inner_path) as f:
+    zip_paths = split_zip_path(path)
+    if zip_paths is not None:
+        zip_path, inner_path = zip_paths
+        with ZIP_POOL.get(zip_path).openbin(inner_path) as f:
             return pygame.image.load(BytesIO(f.read()))
     else:
+        path_str = str(path).replace("\\", "/")
         full_path = os.path.abspath(os.path.expanduser(path_str))
         return pygame.image.load(full_path)
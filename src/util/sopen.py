@@ -1,12 +1,13 @@
 # REGISTER_DOCTEST
 import os
 from typing import BinaryIO
-from fs.zipfs import ZipFS
+from util.zip_pool import ZIP_POOL, split_zip_path
 
 
 def smart_open(path: str | os.PathLike[str]) -> BinaryIO:
     """
     Opens a file transparently, supporting access to files inside ZIP archives.
+    Archives are opened once and kept in the shared ZIP_POOL.
 
     Examples:
         >>> import zipfile, tempfile
@@ -25,14 +26,41 @@ def smart_open(path: str | os.PathLike[str]) -> BinaryIO:
         ...     zip_inner_path = zip_path.replace("\\\\", "/") + "/inner.txt"
         ...     with smart_open(zip_inner_path) as f:
         ...         assert f.read() == b"zip content"
+        ...     ZIP_POOL.close_all()
     """
-    path_str = str(path).replace("\\", "/")
-    zip_marker = ".zip/"
-    if zip_marker in path_str:
-        zip_path, inner_path = path_str.split(zip_marker, 1)
-        zip_path += ".zip"
-        zip_path = os.path.abspath(os.path.expanduser(zip_path))
-        zip_fs = ZipFS(zip_path)
-        return zip_fs.openbin(inner_path)
+    zip_paths = split_zip_path(path)
+    if zip_paths is not None:
+        zip_path, inner_path = zip_paths
+        return ZIP_POOL.get(zip_path).openbin(inner_path)
     else:
+        path_str = str(path).replace("\\", "/")
         return open(os.path.abspath(os.path.expanduser(path_str)), "rb")
+
+
+def smart_exists(path: str | os.PathLike[str]) -> bool:
+    """
+    Checks whether a file exists, supporting files inside ZIP archives.
+
+    Examples:
+        >>> import zipfile, tempfile
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     file_path = os.path.join(tmpdir, "file.txt")
+        ...     assert not smart_exists(file_path)
+        ...     with open(file_path, "wb") as f:
+        ...         _ = f.write(b"regular content")
+        ...     assert smart_exists(file_path)
+        ...     zip_path = os.path.join(tmpdir, "archive.zip")
+        ...     with zipfile.ZipFile(zip_path, "w") as zf:
+        ...         _ = zf.writestr("inner.txt", "zip content")
+        ...     zip_path = zip_path.replace("\\\\", "/")
+        ...     assert smart_exists(zip_path + "/inner.txt")
+        ...     assert not smart_exists(zip_path + "/missing.txt")
+        ...     ZIP_POOL.close_all()
+    """
+    zip_paths = split_zip_path(path)
+    if zip_paths is not None:
+        zip_path, inner_path = zip_paths
+        return bool(ZIP_POOL.get(zip_path).exists(inner_path))
+    else:
+        path_str = str(path).replace("\\", "/")
+        return os.path.isfile(os.path.abspath(os.path.expanduser(path_str)))
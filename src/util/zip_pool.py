@@ -0,0 +1,98 @@
+# REGISTER_DOCTEST
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+from fs.zipfs import ZipFS
+
+ZIP_MARKER = ".zip/"
+DEFAULT_MAX_OPEN = 8
+
+
+def split_zip_path(path: str | os.PathLike[str]) -> Optional[Tuple[str, str]]:
+    """
+    Splits a path pointing inside a ZIP archive into the absolute archive path
+    and the path inside the archive. Returns None for regular paths.
+
+    Examples:
+        >>> split_zip_path("/data/assets.zip/assets/digger/l_0.png")
+        ('/data/assets.zip', 'assets/digger/l_0.png')
+        >>> split_zip_path("/data/assets/digger/l_0.png") is None
+        True
+    """
+    path_str = str(path).replace("\\", "/")
+    if ZIP_MARKER not in path_str:
+        return None
+    zip_path, inner_path = path_str.split(ZIP_MARKER, 1)
+    zip_path += ".zip"
+    return os.path.abspath(os.path.expanduser(zip_path)), inner_path
+
+
+class ZipFSPool:
+    """
+    Thread-safe pool of open ZipFS handles keyed by archive path, so the central
+    directory of an archive is parsed once and not for every file opened in it.
+    At most max_open archives are kept open; the least recently used one is
+    closed when another archive has to be opened.
+
+    Examples:
+        >>> import tempfile, zipfile
+        >>> pool = ZipFSPool(max_open=1)
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     paths = [os.path.join(tmpdir, f"{n}.zip") for n in "ab"]
+        ...     for zip_path in paths:
+        ...         with zipfile.ZipFile(zip_path, "w") as zf:
+        ...             zf.writestr("inner.txt", "zip content")
+        ...     zip_fs = pool.get(paths[0])
+        ...     assert pool.get(paths[0]) is zip_fs  # The same handle is reused
+        ...     _ = pool.get(paths[1])  # Closes the least recently used archive
+        ...     assert len(pool) == 1 and zip_fs.isclosed()
+        ...     pool.close_all()
+        >>> len(pool)
+        0
+    """
+
+    def __init__(self, max_open: int = DEFAULT_MAX_OPEN) -> None:
+        if max_open < 1:
+            raise ValueError(f"max_open must be positive, got {max_open}")
+        self.max_open = max_open
+        self._lock = threading.Lock()
+        self._archives: OrderedDict[str, ZipFS] = OrderedDict()
+
+    def get(self, zip_path: str) -> ZipFS:
+        """Get an open handle of the archive, opening it if needed."""
+        key = os.path.abspath(zip_path)
+        with self._lock:
+            zip_fs = self._archives.get(key)
+            if zip_fs is not None and not zip_fs.isclosed():
+                self._archives.move_to_end(key)
+                return zip_fs
+            zip_fs = ZipFS(key)
+            self._archives[key] = zip_fs
+            self._archives.move_to_end(key)
+            while len(self._archives) > self.max_open:
+                _, evicted = self._archives.popitem(last=False)
+                evicted.close()
+            return zip_fs
+
+    def close(self, zip_path: str) -> None:
+        """Close the handle of the archive if it is open."""
+        with self._lock:
+            zip_fs = self._archives.pop(os.path.abspath(zip_path), None)
+        if zip_fs is not None:
+            zip_fs.close()
+
+    def close_all(self) -> None:
+        """Close all open handles."""
+        with self._lock:
+            archives = list(self._archives.values())
+            self._archives.clear()
+        for zip_fs in archives:
+            zip_fs.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._archives)
+
+
+ZIP_POOL = ZipFSPool()
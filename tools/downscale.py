@@ -2,15 +2,22 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import json
+import os
 import sys
 from pathlib import Path
 from PIL import Image, ImageFile
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from animations.mipmaps import MIP_DIR, MipIndex, level_dir  # noqa: E402
+
 # Allow Pillow to load truncated PNGs if needed
 ImageFile.LOAD_TRUNCATED_IMAGES = True
 
 TARGET_IN = (1024, 1024)
 TARGET_OUT = (512, 512)
+MIN_MIP_SIZE = 32
 
 def is_png(p: Path) -> bool:
     return p.is_file() and p.suffix.lower() == ".png"
@@ -36,6 +43,51 @@ def resize_png(src: Path, dst: Path, optimize=True, compress_level=9) -> None:
         dst.parent.mkdir(parents=True, exist_ok=True)
         im_resized.save(dst, format="PNG", **save_kwargs)
 
+def build_mip_chain(anim_dir: Path, min_size=MIN_MIP_SIZE) -> MipIndex:
+    """
+    Write halved copies of the frames of an animation directory into
+    mip/<width>x<height>/ until a level would be smaller than min_size,
+    and describe them in mips.json.
+    """
+    with open(anim_dir / "animation.json", "rb") as f:
+        animation_data = json.load(f)
+    names = [
+        f"{variation}_{frame_index}.png"
+        for variation in animation_data["variations"]
+        for frame_index in range(animation_data["frame_count"])
+    ]
+    with Image.open(anim_dir / names[0]) as im:
+        source_size = im.size
+
+    levels = []
+    width, height = source_size[0] // 2, source_size[1] // 2
+    while min(width, height) >= min_size:
+        levels.append((width, height))
+        width, height = width // 2, height // 2
+
+    for name in names:
+        with Image.open(anim_dir / name) as im:
+            for level in levels:
+                # Every level is filtered from the source, not from the previous level
+                dst = anim_dir / level_dir(level) / name
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                im.resize(level, resample=Image.Resampling.LANCZOS).save(
+                    dst, format="PNG", optimize=True
+                )
+
+    index = MipIndex(source_size, levels)
+    index.save(str(anim_dir))
+    return index
+
+def build_mip_chains(root: Path, min_size: int) -> int:
+    for data_path in sorted(root.rglob("animation.json")):
+        if MIP_DIR in data_path.relative_to(root).parts:
+            continue
+        index = build_mip_chain(data_path.parent, min_size)
+        levels = ", ".join(f"{w}x{h}" for w, h in index.levels)
+        print(f"{data_path.parent}: mip levels {levels or '(none)'}")
+    return 0
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Recursively find 1024×1024 PNG images and resize them to 512×512 (transparency preserved)."
@@ -51,6 +103,17 @@ def main() -> int:
         default="-512",
         help="Suffix for resized file names (ignored with --inplace). Default: -512",
     )
+    parser.add_argument(
+        "--mip",
+        action="store_true",
+        help="Build a mip chain (mips.json + mip/WxH/) for every animation directory instead.",
+    )
+    parser.add_argument(
+        "--min-size",
+        type=int,
+        default=MIN_MIP_SIZE,
+        help=f"Smallest mip level side (with --mip). Default: {MIN_MIP_SIZE}",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -63,6 +126,9 @@ def main() -> int:
         print(f"Error: '{args.root}' does not exist or is not a directory.", file=sys.stderr)
         return 1
 
+    if args.mip:
+        return build_mip_chains(args.root, args.min_size)
+
     total_found = 0
     total_done = 0
 
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pack animation directories into atlas.png + atlas.json (see src/animations/atlas.py)."""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from animations.atlas import pack_atlas  # noqa: E402
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Pack animation frames into atlas.png and atlas.json."
+    )
+    parser.add_argument("paths", nargs="+", help="animation directories to pack")
+    parser.add_argument(
+        "--columns", type=int, default=None, help="frames per atlas row"
+    )
+    args = parser.parse_args()
+
+    for path in args.paths:
+        if not os.path.isfile(os.path.join(path, "animation.json")):
+            print(f"[Skip] {path}: no animation.json", file=sys.stderr)
+            continue
+        index = pack_atlas(path, args.columns)
+        print(f"{path}: packed {len(index.frames)} frames")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())